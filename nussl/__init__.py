@@ -25,6 +25,7 @@ class ImportErrorClass(object):
 
 from .core.constants import *
 from .core.audio_signal import AudioSignal
+from .core.audio_cache import AudioCache
 from .core import utils, efz_utils, stft_utils, datasets
 from .evaluation import *
 from .separation import *
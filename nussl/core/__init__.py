@@ -5,4 +5,5 @@ Imports for core nussl components
 """
 
 from nussl.core.audio_signal import AudioSignal
+from nussl.core.audio_cache import AudioCache
 
@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+A disk cache of decoded (and resampled) audio files, so that each file is only decoded once, no
+matter how many times it is loaded.
+"""
+
+import hashlib
+import multiprocessing
+import os
+import tempfile
+
+from nussl.core import constants
+from nussl.core.audio_signal import AudioSignal
+
+__all__ = ['AudioCache']
+
+
+class AudioCache(object):
+    """
+    Loads audio files as :class:`AudioSignal` objects, and keeps the decoded and resampled audio of
+    every file in ``cache_dir``, so that loading a file again only memory maps the cached copy.
+
+    The cached copies are 32-bit float WAV files, which are loaded lazily (see
+    :func:`AudioSignal.load_audio_from_file`): nothing is read until :attr:`AudioSignal.audio_data`
+    is accessed, and then only the active region is read. A cached copy is keyed by the real path of
+    the file, its modification time and :attr:`sample_rate`, so a file that changes is decoded again.
+
+    :func:`load_many` and :func:`prefetch` decode files that are not cached yet on a pool of
+    ``num_jobs`` processes, ahead of the files that are being used.
+
+    Parameters:
+        cache_dir (str): Directory for the cached copies. It is made if it does not exist. It can be
+            shared by many :class:`AudioCache` objects, even in different processes.
+        sample_rate (int, optional): Sample rate that every file is resampled to. If ``None``
+            (default), files keep their own sample rate.
+        num_jobs (int, optional): Number of processes that decode files in :func:`load_many` and
+            :func:`prefetch`. If ``None``, uses one per CPU. Defaults to 1 (decode in this process).
+
+    Example:
+
+    .. code-block:: python
+        :linenos:
+
+        cache = nussl.AudioCache('path/to/cache', sample_rate=16000, num_jobs=4)
+
+        # decodes and resamples every file on the first sweep, and only memory maps them afterwards
+        for mixture in cache.load_many(mixture_paths):
+            repet = nussl.Repet(mixture)
+            ...
+
+    """
+    def __init__(self, cache_dir, sample_rate=None, num_jobs=1):
+        if num_jobs is not None and num_jobs < 1:
+            raise ValueError('num_jobs must be None or at least 1!')
+
+        self.cache_dir = cache_dir
+        self.sample_rate = None if sample_rate is None else int(sample_rate)
+        self.num_jobs = num_jobs
+
+        if not os.path.isdir(self.cache_dir):
+            try:
+                os.makedirs(self.cache_dir)
+            except OSError:
+                # made by someone else in the meantime
+                if not os.path.isdir(self.cache_dir):
+                    raise
+
+    def cache_path(self, path):
+        """
+        Path of the cached copy of ``path``. The file is not necessarily there yet.
+
+        Args:
+            path (str): Path to an audio file.
+
+        Returns:
+            (str): Path in :attr:`cache_dir` for the current version of ``path`` at
+            :attr:`sample_rate`.
+        """
+        real_path = os.path.realpath(path)
+        key = repr((real_path, os.path.getmtime(real_path), self.sample_rate)).encode('utf-8')
+        file_name = os.path.splitext(os.path.basename(real_path))[0]
+        return os.path.join(self.cache_dir, '{}-{}.wav'.format(file_name, hashlib.sha1(key).hexdigest()))
+
+    def is_cached(self, path):
+        """
+        Args:
+            path (str): Path to an audio file.
+
+        Returns:
+            (bool): ``True`` if the current version of ``path`` is in the cache.
+        """
+        return os.path.isfile(self.cache_path(path))
+
+    def cache(self, path):
+        """
+        Decodes (and resamples) ``path`` into the cache, unless it is already cached.
+
+        Args:
+            path (str): Path to an audio file.
+
+        Returns:
+            (str): Path to the cached copy.
+        """
+        cache_path = self.cache_path(path)
+        if os.path.isfile(cache_path):
+            return cache_path
+
+        signal = AudioSignal(path, sample_rate=self.sample_rate)
+
+        # write next to the cached copy and rename, so nobody ever reads a partial file
+        handle, temp_path = tempfile.mkstemp(suffix='.wav', dir=self.cache_dir)
+        os.close(handle)
+        try:
+            signal.write_audio_to_file(temp_path, normalize=False, sample_format=constants.SAMPLE_FORMAT_FLOAT32)
+            os.rename(temp_path, cache_path)
+        finally:
+            if os.path.isfile(temp_path):
+                os.remove(temp_path)
+
+        return cache_path
+
+    def load(self, path):
+        """
+        Loads ``path`` from the cache, decoding it into the cache first if needed.
+
+        Args:
+            path (str): Path to an audio file.
+
+        Returns:
+            (:class:`AudioSignal`): A lazily loaded signal with the audio of ``path`` at
+            :attr:`sample_rate`. Its :attr:`AudioSignal.path_to_input_file` is ``path``.
+        """
+        return self._load_cached(path, self.cache(path))
+
+    def load_many(self, paths):
+        """
+        Generator that loads every file in ``paths``, in order, like :func:`load`. Files that are not
+        cached yet are decoded on :attr:`num_jobs` processes ahead of the one being yielded.
+
+        Args:
+            paths (list): Paths to audio files.
+
+        Yields:
+            (:class:`AudioSignal`): The signal of the next path, as returned by :func:`load`.
+        """
+        paths = list(paths)
+        for path, cache_path in zip(paths, self._cache_all(paths)):
+            yield self._load_cached(path, cache_path)
+
+    def prefetch(self, paths):
+        """
+        Decodes every file in ``paths`` that is not cached yet into the cache, on :attr:`num_jobs`
+        processes, and waits for them to finish.
+
+        Args:
+            paths (list): Paths to audio files.
+
+        Returns:
+            (list): Paths to the cached copies, in the order of ``paths``.
+        """
+        return list(self._cache_all(list(paths)))
+
+    def _cache_all(self, paths):
+        """
+        Generator that caches every path, serially or on a process pool, and yields their cache paths
+        in order.
+        """
+        n_uncached = len(set(path for path in paths if not self.is_cached(path)))
+
+        if self.num_jobs == 1 or n_uncached < 2:
+            for path in paths:
+                yield self.cache(path)
+            return
+
+        pool = multiprocessing.Pool(self.num_jobs)
+        try:
+            for cache_path in pool.imap(_cache_audio_file, [(self, path) for path in paths]):
+                yield cache_path
+        finally:
+            pool.close()
+            pool.join()
+
+    @staticmethod
+    def _load_cached(path, cache_path):
+        signal = AudioSignal(cache_path, lazy=True)
+        signal.path_to_input_file = path
+        return signal
+
+
+def _cache_audio_file(args):
+    """
+    Caches one file with :func:`AudioCache.cache`. This is a module-level function so that it can be
+    sent to worker processes.
+
+    Args:
+        args (tuple): ``(audio_cache, path)``.
+
+    Returns:
+        (str): Path to the cached copy.
+    """
+    audio_cache, path = args
+    return audio_cache.cache(path)
@@ -102,6 +102,9 @@ import copy
 import json
 import numbers
 import os.path
+import struct
+import sys
+import threading
 import warnings
 
 import audioread
@@ -109,6 +112,8 @@ import librosa
 import matplotlib.pyplot as plt
 import numpy as np
 import scipy.io.wavfile as wav
+import six
+from six.moves import queue
 
 from nussl.core import constants
 from nussl.core import stft_utils
@@ -132,6 +137,8 @@ class AudioSignal(object):
         duration (float): Length of the signal to read from the file (in seconds). Defaults to full
             length of the signal.
         sample_rate (int): Sampling rate of this :class:`AudioSignal` object.
+        lazy (bool): If ``True``, memory map a WAV input file instead of reading it, and only read
+            the active region when :attr:`audio_data` is accessed. See :func:`load_audio_from_file`.
 
     Attributes:
         audio_data (:obj:`np.ndarray`):
@@ -156,7 +163,7 @@ class AudioSignal(object):
     """
 
     def __init__(self, path_to_input_file=None, audio_data_array=None, stft=None, label=None,
-                 sample_rate=None, stft_params=None, offset=0, duration=None):
+                 sample_rate=None, stft_params=None, offset=0, duration=None, lazy=False):
 
         self.path_to_input_file = path_to_input_file
         self._audio_data = None
@@ -164,6 +171,7 @@ class AudioSignal(object):
         self._sample_rate = None
         self._active_start = None
         self._active_end = None
+        self._converted_audio_data = None
         self.label = label
 
         # Assert that this object was only initialized in one way
@@ -178,7 +186,7 @@ class AudioSignal(object):
                                        'one of {path, audio, stft}!')
 
         if path_to_input_file is not None:
-            self.load_audio_from_file(self.path_to_input_file, offset, duration, sample_rate)
+            self.load_audio_from_file(self.path_to_input_file, offset, duration, sample_rate, lazy)
         elif audio_data_array is not None:
             self.load_audio_from_array(audio_data_array, sample_rate)
 
@@ -201,6 +209,9 @@ class AudioSignal(object):
     #                 Properties
     ##################################################
 
+    # Number of samples converted at a time by write_audio_to_file
+    _WRITE_CHUNK_SAMPLES = 2 ** 18
+
     # Constants for accessing _audio_data np.array indices
     _LEN = 1
     _CHAN = 0
@@ -220,9 +231,9 @@ class AudioSignal(object):
         See Also:
             :func:`set_active_region_to_default` for information about active regions.
         """
-        if self.audio_data is None:
+        if self._active_region_data is None:
             return None
-        return self.audio_data.shape[constants.LEN_INDEX]
+        return self._active_region_data.shape[constants.LEN_INDEX]
 
     @property
     def entire_signal_length(self):
@@ -234,7 +245,7 @@ class AudioSignal(object):
         See Also:
             :func:`set_active_region_to_default` for information about active regions.
         """
-        if self.audio_data is None:
+        if self._audio_data is None:
             return None
         return self._audio_data.shape[constants.LEN_INDEX]
 
@@ -282,8 +293,8 @@ class AudioSignal(object):
             * :func:`is_stereo`
         """
         # TODO: what about a mismatch between audio_data and stft_data??
-        if self.audio_data is not None:
-            return self.audio_data.shape[constants.CHAN_INDEX]
+        if self._audio_data is not None:
+            return self._audio_data.shape[constants.CHAN_INDEX]
         if self.stft_data is not None:
             return self.stft_data.shape[constants.STFT_CHAN_INDEX]
         return None
@@ -366,6 +377,11 @@ class AudioSignal(object):
             that if one of them is changed, those changes are not instantly reflected in the other.
             To propagate changes, either call :func:`stft` or :func:`istft`.
 
+            * If the file was loaded with ``lazy=True`` (see :func:`load_audio_from_file`), the
+            samples stay on disk, and the first access reads the active region from the file and
+            converts it to floats. The converted (read-only) array is kept until the active region or
+            :attr:`audio_data` is set again.
+
             * If :attr:`audio_data` is set with an improperly transposed array, it will
             automatically transpose it so that it is set the expected way. A warning will be
             displayed on the console.
@@ -380,22 +396,21 @@ class AudioSignal(object):
             array with shape `(n_channels, n_samples)`. ``None`` by default, this can be
             initialized at instantiation.  By default audio data is stored as an array of floats.
         """
-        if self._audio_data is None:
-            return None
+        audio_data = self._active_region_data
 
-        start = 0
-        end = self._audio_data.shape[constants.LEN_INDEX]
+        if audio_data is not None and not np.issubdtype(audio_data.dtype, np.floating):
+            # lazily loaded files keep the samples of the file, so only the active region is
+            # converted, and only once until the active region changes
+            active_region = (self._active_start, self._active_end)
+            if self._converted_audio_data is None or self._converted_audio_data[0] != active_region:
+                self._converted_audio_data = (active_region, _read_only(_fixed_point_to_float(audio_data)))
+            audio_data = self._converted_audio_data[1]
 
-        if self._active_end is not None and self._active_end < end:
-            end = self._active_end
-
-        if self._active_start is not None and self._active_start > 0:
-            start = self._active_start
-
-        return self._audio_data[:, start:end]
+        return audio_data
 
     @audio_data.setter
     def audio_data(self, value):
+        self._converted_audio_data = None
 
         if value is None:
             self._audio_data = None
@@ -421,6 +436,26 @@ class AudioSignal(object):
 
         self.set_active_region_to_default()
 
+    @property
+    def _active_region_data(self):
+        """
+        (:obj:`np.ndarray`): The active region of the audio data as it is stored, i.e., without
+        reading or converting a lazily loaded file.
+        """
+        if self._audio_data is None:
+            return None
+
+        start = 0
+        end = self._audio_data.shape[constants.LEN_INDEX]
+
+        if self._active_end is not None and self._active_end < end:
+            end = self._active_end
+
+        if self._active_start is not None and self._active_start > 0:
+            start = self._active_start
+
+        return self._audio_data[:, start:end]
+
     @property
     def stft_data(self):
         """
@@ -731,14 +766,15 @@ class AudioSignal(object):
             Returns `False` if :attr:`audio_data` is empty. Else, returns `True`.
 
         """
-        return self.audio_data is not None and self.audio_data.size != 0
+        return self._active_region_data is not None and self._active_region_data.size != 0
 
     ##################################################
     #                     I/O
     ##################################################
 
-    def load_audio_from_file(self, input_file_path, offset=0, duration=None, new_sample_rate=None):
-        # type: (str, float, float, int) -> None
+    def load_audio_from_file(self, input_file_path, offset=0, duration=None, new_sample_rate=None,
+                             lazy=False):
+        # type: (str, float, float, int, bool) -> None
         """
         Loads an audio signal into memory from a file on disc. The audio is stored in
         :class:`AudioSignal` as a :obj:`np.ndarray` of `float` s. The sample rate is read from
@@ -752,6 +788,12 @@ class AudioSignal(object):
         in :attr:`audio_data` (unlike with the active region, which has the entire audio data stored
         in memory but only allows access to a subset of the audio).
 
+        If :param:`lazy` is ``True`` and the file is an 8-, 16- or 32-bit PCM or a 32- or 64-bit
+        float WAV file, the file is memory mapped instead of read, and nothing is read from it
+        until :attr:`audio_data` is accessed. Then only the active region is read and converted to
+        floats, so reading a 30 second window (with :func:`set_active_region`) of a 2 hour file
+        costs 30 seconds of I/O. Other files are read as usual.
+
         See Also:
             * :func:`load_audio_from_array` to read audio data from a :obj:`np.ndarray`.
 
@@ -764,13 +806,24 @@ class AudioSignal(object):
                 length of the signal.
             new_sample_rate (int): If this parameter is not ``None`` or the same sample rate as
                 provided by the input file, then the audio data will be resampled to the new
-                sample rate dictated by this parameter.
+                sample rate dictated by this parameter. (This reads the whole file, even if
+                :param:`lazy` is ``True``.)
+            lazy (bool): If ``True``, memory map WAV files instead of reading them. Defaults to
+                ``False``.
 
         """
         assert offset >= 0, 'Parameter `offset` must be >= 0!'
         if duration is not None:
             assert duration >= 0, 'Parameter `duration` must be >= 0!'
 
+        if lazy and self._load_memory_mapped_wav(input_file_path, offset, duration):
+            if new_sample_rate is not None and new_sample_rate != self._sample_rate:
+                self.resample(new_sample_rate)
+
+            self.path_to_input_file = input_file_path
+            self.set_active_region_to_default()
+            return
+
         with audioread.audio_open(os.path.realpath(input_file_path)) as input_file:
             file_length = input_file.duration
 
@@ -803,6 +856,39 @@ class AudioSignal(object):
         self.path_to_input_file = input_file_path
         self.set_active_region_to_default()
 
+    def _load_memory_mapped_wav(self, input_file_path, offset, duration):
+        """
+        Memory maps the samples of a WAV file into :attr:`_audio_data` for
+        :func:`load_audio_from_file`, without reading them.
+
+        Returns:
+            (bool): ``False`` if the file cannot be memory mapped (e.g., it is not a WAV file, or it
+            has 24-bit samples), in which case nothing was loaded.
+        """
+        try:
+            sample_rate, file_data = wav.read(input_file_path, mmap=True)
+        except (ValueError, TypeError):
+            return False
+
+        if file_data.ndim == 1:
+            file_data = file_data[:, np.newaxis]
+
+        start = int(offset * sample_rate)
+        end = None if duration is None else start + int(duration * sample_rate)
+
+        if start > file_data.shape[0]:
+            raise AudioSignalException('offset is longer than signal!')
+
+        if end is not None and end >= file_data.shape[0]:
+            warnings.warn('offset + duration are longer than the signal.'
+                          ' Reading until end of signal...',
+                          UserWarning)
+
+        # (n_samples, n_channels) in the file, so this is a view with the expected shape
+        self._audio_data = file_data[start:end].T
+        self._sample_rate = sample_rate
+        return True
+
     def load_audio_from_array(self, signal, sample_rate=constants.DEFAULT_SAMPLE_RATE):
         """
         Loads an audio signal from a :obj:`np.ndarray`. :param:`sample_rate` is the sample
@@ -838,41 +924,81 @@ class AudioSignal(object):
 
         self.set_active_region_to_default()
 
-    def write_audio_to_file(self, output_file_path, sample_rate=None, verbose=False):
+    def write_audio_to_file(self, output_file_path, sample_rate=None, verbose=False, normalize=True,
+                            sample_format=constants.DEFAULT_SAMPLE_FORMAT, chunk_size=None):
         """
-        Outputs the audio signal data in :attr:`audio_data` to a file at :param:`output_file_path`
-        with sample rate of :param:`sample_rate`.
+        Outputs the audio signal data in :attr:`audio_data` to a WAV file at
+        :param:`output_file_path` with sample rate of :param:`sample_rate`.
+
+        The audio is converted and written :param:`chunk_size` samples at a time, so writing never
+        holds more than one chunk of converted audio in memory, and a lazily loaded file (see
+        :func:`load_audio_from_file`) is read one chunk at a time. :attr:`audio_data` is never
+        changed.
 
         Parameters:
             output_file_path (str): Filename where output file will be saved.
             sample_rate (int): The sample rate to write the file at. Default is
                 :attr:`sample_rate`.
             verbose (bool): Print out a message if writing the file was successful.
+            normalize (bool): If ``True`` (default) and the absolute max value of
+                :attr:`audio_data` is larger than ``1.0``, scale the audio in the file so that it is
+                exactly ``1.0`` (like :func:`peak_normalize`). If ``False``, write the samples as
+                they are. Values outside of ``[-1.0, 1.0]`` are clipped in PCM files.
+            sample_format (str): One of ``constants.ALL_SAMPLE_FORMATS``: 16-, 24- or 32-bit PCM, or
+                32-bit float. Defaults to ``constants.DEFAULT_SAMPLE_FORMAT`` (16-bit PCM).
+            chunk_size (int): Number of samples converted and written at a time. Defaults to
+                ``2 ** 18``.
+
+        Raises:
+            AudioSignalException: If there is no audio data or :param:`sample_format` is unknown.
+
+        See Also:
+            * :func:`write_audio_signals` to write many :class:`AudioSignal` objects in one call.
         """
         if self.audio_data is None:
             raise AudioSignalException("Cannot write audio file because there is no audio data.")
 
-        try:
-            self.peak_normalize()
+        if sample_format not in constants.ALL_SAMPLE_FORMATS:
+            raise AudioSignalException('Unknown sample_format {}! Must be one of {}.'
+                                       .format(sample_format, constants.ALL_SAMPLE_FORMATS))
 
+        try:
             if sample_rate is None:
                 sample_rate = self.sample_rate
 
-            audio_output = np.copy(self.audio_data)
-
-            # TODO: better fix
-            # convert to fixed point again
-            if not np.issubdtype(audio_output.dtype, np.int):
-                audio_output = np.multiply(audio_output,
-                                           2 ** (constants.DEFAULT_BIT_DEPTH - 1)).astype('int16')
-
-            wav.write(output_file_path, sample_rate, audio_output.T)
+            chunk_size = self._WRITE_CHUNK_SAMPLES if chunk_size is None else int(chunk_size)
+            _write_wav(output_file_path, self._active_region_data, sample_rate, sample_format,
+                       normalize, chunk_size)
         except Exception as e:
             print("Cannot write to file, {file}.".format(file=output_file_path))
             raise e
         if verbose:
             print("Successfully wrote {file}.".format(file=output_file_path))
 
+    @staticmethod
+    def write_audio_signals(audio_signals, output_file_paths, **kwargs):
+        """
+        Writes every :class:`AudioSignal` object in :param:`audio_signals` (e.g., the output of
+        ``make_audio_signals()`` of a separation algorithm) to the file with the same index in
+        :param:`output_file_paths`.
+
+        Parameters:
+            audio_signals (list): :class:`AudioSignal` objects to write.
+            output_file_paths (list): One filename per object in :param:`audio_signals`.
+            kwargs: Keyword arguments for :func:`write_audio_to_file`, used for every file.
+
+        Raises:
+            AudioSignalException: If :param:`audio_signals` and :param:`output_file_paths` have
+                different lengths.
+        """
+        audio_signals, output_file_paths = list(audio_signals), list(output_file_paths)
+        if len(audio_signals) != len(output_file_paths):
+            raise AudioSignalException('Got {} output file paths for {} audio signals!'
+                                       .format(len(output_file_paths), len(audio_signals)))
+
+        for audio_signal, output_file_path in zip(audio_signals, output_file_paths):
+            audio_signal.write_audio_to_file(output_file_path, **kwargs)
+
     ##################################################
     #                Active Region
     ##################################################
@@ -915,6 +1041,7 @@ class AudioSignal(object):
 
         """
         start, end = int(start), int(end)
+        self._converted_audio_data = None
         self._active_start = start if start >= 0 else 0
         self._active_end = end if end < self._signal_length else self._signal_length
 
@@ -928,38 +1055,79 @@ class AudioSignal(object):
             :class:`AudioSignal`.
 
         """
+        self._converted_audio_data = None
         self._active_start = 0
         self._active_end = self._signal_length
 
-    def next_window_generator(self, window_size, hop_size, convert_to_samples=False):
+    def next_window_generator(self, window_size, hop_size, convert_to_samples=False, prefetch=0):
         """
-        Not Implemented
-        
-        Raises:
-            NotImplemented
-            
+        Generator that walks through the active region in windows of ``window_size`` samples, starting
+        a new window every ``hop_size`` samples, and yields each window as a read-only
+        :class:`AudioSignal` view (see :func:`make_view`). The last window ends at the end of the
+        active region, so it can be shorter than ``window_size``. The active region of this object is
+        not changed.
+
+        Nothing is copied, and windows of a lazily loaded file (see :func:`load_audio_from_file`) are
+        only read from the file when their :attr:`audio_data` is accessed, so memory use depends on
+        ``window_size``, not on the length of the file. With ``prefetch``, a background thread reads
+        windows of a lazily loaded file into memory ahead of the one being used.
+
+        Example:
+
+        .. code-block:: python
+            :linenos:
+
+            signal = nussl.AudioSignal('path/to/long_file.wav', lazy=True)
+
+            # 30 second windows, every 15 seconds, reading the next 2 windows in the background
+            for window in signal.next_window_generator(30, 15, convert_to_samples=True, prefetch=2):
+                window.stft()
+                ...
+
         Args:
-            window_size:
-            hop_size:
-            convert_to_samples:
+            window_size (int): Length of each window in samples (or in seconds if
+                ``convert_to_samples`` is ``True``).
+            hop_size (int): Distance between the starts of consecutive windows in samples (or in
+                seconds if ``convert_to_samples`` is ``True``).
+            convert_to_samples (bool): If ``True``, ``window_size`` and ``hop_size`` are in seconds
+                and are converted to samples. Defaults to ``False``.
+            prefetch (int): Maximum number of windows to read ahead on a background thread. Defaults
+                to 0, reading each window in the caller's thread.
 
-        Returns:
+        Raises:
+            AudioSignalException: If there is no audio data, or if ``window_size`` or ``hop_size``
+                is shorter than one sample.
+
+        Yields:
+            (:class:`AudioSignal`): A view of the next window. The ``n``-th window (**0-based**)
+            starts ``n * hop_size`` samples after the start of the active region.
 
         """
-        raise NotImplemented
-        # start = self._active_start
-        # end = self.signal_length
-        # if convert_to_samples:
-        #     start /= self.sample_rate
-        #     end = self.signal_duration
-        # old_start = self._active_start
-        # self.set_active_region_to_default()
-        #
-        # while old_start + window_size < self.signal_length:
-        #     start = old_start + hop_size
-        #     end = start + window_size
-        #     self.set_active_region(start, end)
-        #     yield start, end
+        if self._audio_data is None:
+            raise AudioSignalException('Cannot make windows without audio data!')
+
+        if convert_to_samples:
+            window_size = int(np.round(window_size * self.sample_rate))
+            hop_size = int(np.round(hop_size * self.sample_rate))
+
+        if window_size < 1 or hop_size < 1:
+            raise AudioSignalException('window_size and hop_size must be at least one sample!')
+
+        region_start = max(self._active_start or 0, 0)
+        region_end = region_start + self.signal_length
+
+        def windows():
+            for start in range(region_start, region_end, hop_size):
+                end = min(start + window_size, region_end)
+                yield self.make_view(start=start, end=end)
+
+                if end == region_end:
+                    return
+
+        if prefetch > 0:
+            return _prefetch(windows(), prefetch, _read_window)
+
+        return windows()
 
     ##################################################
     #               STFT Utilities
@@ -986,7 +1154,8 @@ class AudioSignal(object):
 
         Returns:
             (:obj:`np.ndarray`) Calculated, complex-valued STFT from :attr:`audio_data`, 3D numpy
-            array with shape `(n_frequency_bins, n_hops, n_channels)`.
+            array with shape `(n_frequency_bins, n_hops, n_channels)`. The dtype (complex64 or
+            complex128) is set by :attr:`stft_params.precision`.
 
         """
         if self.audio_data is None or self.audio_data.size == 0:
@@ -1011,14 +1180,21 @@ class AudioSignal(object):
         if self.audio_data is None or self.audio_data.size == 0:
             raise AudioSignalException('Cannot do stft without signal!')
 
-        stfts = []
+        if not use_librosa:
+            # e_stft does every channel in one call and returns (n_fft_bins, n_hops, n_channels)
+            return stft_utils.e_stft(signal=self.audio_data, window_length=window_length,
+                                     hop_length=hop_length, window_type=window_type,
+                                     n_fft_bins=n_fft_bins, remove_reflection=remove_reflection,
+                                     precision=self.stft_params.precision)
 
-        stft_func = stft_utils.librosa_stft_wrapper if use_librosa else stft_utils.e_stft
+        stfts = []
 
         for chan in self.get_channels():
-            stfts.append(stft_func(signal=chan, window_length=window_length,
-                                   hop_length=hop_length, window_type=window_type,
-                                   n_fft_bins=n_fft_bins, remove_reflection=remove_reflection))
+            stfts.append(stft_utils.librosa_stft_wrapper(signal=chan, window_length=window_length,
+                                                         hop_length=hop_length,
+                                                         window_type=window_type,
+                                                         n_fft_bins=n_fft_bins,
+                                                         remove_reflection=remove_reflection))
 
         return np.array(stfts).transpose((1, 2, 0))
 
@@ -1077,13 +1253,18 @@ class AudioSignal(object):
         if self.stft_data.size == 0:
             raise AudioSignalException('Cannot do inverse STFT without self.stft_data!')
 
-        signals = []
+        if not use_librosa:
+            # e_istft does every channel in one call and returns (n_channels, n_samples)
+            return stft_utils.e_istft(stft=self.stft_data, window_length=window_length,
+                                      hop_length=hop_length, window_type=window_type)
 
-        istft_func = stft_utils.librosa_istft_wrapper if use_librosa else stft_utils.e_istft
+        signals = []
 
         for stft in self.get_stft_channels():
-            calculated_signal = istft_func(stft=stft, window_length=window_length,
-                                           hop_length=hop_length, window_type=window_type)
+            calculated_signal = stft_utils.librosa_istft_wrapper(stft=stft,
+                                                                 window_length=window_length,
+                                                                 hop_length=hop_length,
+                                                                 window_type=window_type)
 
             signals.append(calculated_signal)
 
@@ -1120,7 +1301,8 @@ class AudioSignal(object):
                                        'mask: {}, self.stft_data: {}'.format(mask.shape,
                                                                              self.stft_data.shape))
 
-        masked_stft = self.stft_data * mask.mask
+        # keep the precision of the STFT, even if the mask has more
+        masked_stft = np.multiply(self.stft_data, mask.mask, dtype=self.stft_data.dtype)
 
         if overwrite:
             self.stft_data = masked_stft
@@ -1434,7 +1616,7 @@ class AudioSignal(object):
         if not self.active_region_is_default and verbose:
             warnings.warn('Making a copy when active region is not default!')
 
-        new_signal = copy.deepcopy(self)
+        new_signal = self._make_copy_without_data()
         new_signal.audio_data = np.zeros_like(self.audio_data)
         new_signal.stft_data = np.zeros_like(self.stft_data)
         return new_signal
@@ -1460,9 +1642,8 @@ class AudioSignal(object):
             if audio_data.shape != self.audio_data.shape:
                 warnings.warn('Shape of new audio_data does not match current audio_data.')
 
-        new_signal = copy.deepcopy(self)
+        new_signal = self._make_copy_without_data()
         new_signal.audio_data = audio_data
-        new_signal.stft_data = None
         return new_signal
 
     def make_copy_with_stft_data(self, stft_data, verbose=True):
@@ -1486,11 +1667,89 @@ class AudioSignal(object):
             if stft_data.shape != self.stft_data.shape:
                 warnings.warn('Shape of new stft_data does not match current stft_data.')
 
-        new_signal = copy.deepcopy(self)
+        new_signal = self._make_copy_without_data()
         new_signal.stft_data = stft_data
-        new_signal.audio_data = None
         return new_signal
 
+    def make_view(self, channels=None, start=None, end=None):
+        """ Makes a new :class:`AudioSignal` object that shares :attr:`audio_data` (and
+        :attr:`stft_data`, if the view has every sample) with this one instead of copying it. Only
+        the metadata is copied, so a view of an hour of audio costs the same as a view of a second.
+
+        The data arrays of a view are read-only. Every method that changes the data of an
+        :class:`AudioSignal` (e.g., :func:`stft`, :func:`apply_gain`, :func:`resample`, or setting
+        :attr:`audio_data`) gives the view new arrays instead of writing into the shared ones, so a
+        view is only copied when it changes (copy-on-write), and it never changes this object.
+        Changes made to this object in place, however, are seen by its views.
+
+        Args:
+            channels (int or slice, optional): Channel (**0-based**) or slice of channels in the
+                view. ``None`` (default) for every channel.
+            start (int, optional): Index of the first sample of :attr:`audio_data` in the view,
+                ignoring the active region, like in :func:`set_active_region`.
+            end (int, optional): Index one past the last sample in the view.
+
+        Notes:
+            If ``start`` and ``end`` are both ``None``, the view keeps the active region and
+            :attr:`stft_data` of this object. Otherwise, the active region of the view is the whole
+            view, and its :attr:`stft_data` is ``None``.
+
+        Raises:
+            AudioSignalException: If ``channels`` is not an int or a slice, or selects no channels.
+
+        Returns:
+            (:class:`AudioSignal`): A view of this `AudioSignal` object.
+
+        Example:
+
+        .. code-block:: python
+            :linenos:
+
+            signal = nussl.AudioSignal('path/to/stereo_file.wav')
+
+            # the left channel of the first 10 seconds, without copying anything
+            left = signal.make_view(channels=0, end=10 * signal.sample_rate)
+            left.apply_gain(0.5)  # only now is the view copied; signal is unchanged
+
+        """
+        if channels is None:
+            channels = slice(None)
+        elif isinstance(channels, numbers.Integral):
+            self._verify_get_channel(channels)
+            channels = slice(channels, channels + 1)
+        elif not isinstance(channels, slice):
+            raise AudioSignalException('channels must be an int or a slice to make a view!')
+
+        whole_signal = start is None and end is None
+        new_signal = self._make_copy_without_data()
+
+        if self._audio_data is not None:
+            new_signal._audio_data = _read_only(self._audio_data[channels, start:end])
+            if new_signal._audio_data.shape[constants.CHAN_INDEX] == 0:
+                raise AudioSignalException('Cannot make a view without any channels!')
+
+        if self._stft_data is not None and whole_signal:
+            new_signal._stft_data = _read_only(self._stft_data[:, :, channels])
+
+        if not whole_signal:
+            new_signal.set_active_region_to_default()
+
+        return new_signal
+
+    def _make_copy_without_data(self):
+        """ Makes a copy of this :class:`AudioSignal` object with all of its metadata (sample rate,
+        label, active region, :attr:`stft_params`, etc.), but with :attr:`audio_data` and
+        :attr:`stft_data` set to ``None``. Unlike ``copy.deepcopy(self)``, the data arrays are never
+        copied, so this takes the same time for an hour of audio as for a second.
+
+        Returns:
+            (:class:`AudioSignal`): A copy of this `AudioSignal` object without any data.
+
+        """
+        # deepcopy() looks up every object in the memo first, so the arrays are "copied" as None
+        memo = {id(self._audio_data): None, id(self._stft_data): None, id(self._converted_audio_data): None}
+        return copy.deepcopy(self, memo)
+
     def to_json(self):
         """ Converts this :class:`AudioSignal` object to JSON.
 
@@ -1505,10 +1764,13 @@ class AudioSignal(object):
 
     @staticmethod
     def _to_json_helper(o):
+        if isinstance(o, np.generic):
+            return o.item()
         if not isinstance(o, AudioSignal):
             raise TypeError
 
         d = copy.copy(o.__dict__)
+        d.pop('_converted_audio_data', None)  # only a cache of audio_data
         for k, v in d.items():
             if isinstance(v, np.ndarray):
                 d[k] = utils.json_ready_numpy_array(v)
@@ -1559,11 +1821,43 @@ class AudioSignal(object):
                 if isinstance(v, dict) and constants.NUMPY_JSON_KEY in v:
                     a.__dict__[k] = utils.json_numpy_obj_hook(v[constants.NUMPY_JSON_KEY])
                 else:
-                    a.__dict__[k] = v if not isinstance(v, unicode) else v.encode('ascii')
+                    a.__dict__[k] = v if not isinstance(v, six.text_type) else str(v)
             return a
         else:
             return json_dict
 
+    def save(self, output_file_path):
+        """ Saves this :class:`AudioSignal` object to a binary file. Unlike :func:`to_json`, the
+        arrays are written as raw bytes, so the file is smaller and :func:`load` memory maps the
+        arrays instead of decoding them. See :func:`utils.save_binary` for the file format.
+
+        See Also:
+            :func:`load`
+
+        Args:
+            output_file_path (str): Path to the output file.
+
+        """
+        utils.save_binary(output_file_path, self.to_json)
+
+    @staticmethod
+    def load(input_file_path):
+        """ Loads an :class:`AudioSignal` object from a file made by :func:`save`. The arrays are
+        memory mapped, so :attr:`audio_data` and :attr:`stft_data` are only read from the file when
+        they are used.
+
+        See Also:
+            :func:`save`
+
+        Args:
+            input_file_path (str): Path to a file made by :func:`save`.
+
+        Returns:
+            (:class:`AudioSignal`): The saved :class:`AudioSignal` object.
+
+        """
+        return utils.load_binary(input_file_path, AudioSignal.from_json)
+
     def rms(self):
         """ Calculates the root-mean-square of :attr:`audio_data`.
         
@@ -1749,9 +2043,7 @@ class AudioSignal(object):
             channel ``n``.
 
         """
-        new_signal = copy.copy(self)
-        new_signal.audio_data = self.get_channel(n)
-        return new_signal
+        return self.make_view(channels=n)
 
     def get_power_spectrogram_channel(self, n):
         """ Returns the n-th channel from ``self.power_spectrogram_data``.
@@ -1894,7 +2186,9 @@ class AudioSignal(object):
 
     def __eq__(self, other):
         for k, v in self.__dict__.items():
-            if isinstance(v, np.ndarray):
+            if k == '_converted_audio_data':
+                continue
+            elif isinstance(v, np.ndarray):
                 if not np.array_equal(v, other.__dict__[k]):
                     return False
             elif v != other.__dict__[k]:
@@ -1905,6 +2199,170 @@ class AudioSignal(object):
         return not self == other
 
 
+def _fixed_point_to_float(array):
+    """Converts fixed-point samples (as read from a WAV file) to floats between -1.0 and 1.0."""
+    if array.dtype == np.uint8:
+        # 8-bit WAV files are unsigned
+        return (array.astype('float') - 128.0) / 128.0
+
+    return array.astype('float') / (np.iinfo(array.dtype).max + 1.0)
+
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_SAMPLE_FORMAT_WIDTHS = {constants.SAMPLE_FORMAT_INT16: 2, constants.SAMPLE_FORMAT_INT24: 3,
+                         constants.SAMPLE_FORMAT_INT32: 4, constants.SAMPLE_FORMAT_FLOAT32: 4}
+
+
+def _write_wav(output_file_path, audio_data, sample_rate, sample_format, normalize, chunk_size):
+    """
+    Writes ``audio_data`` (with shape ``(n_channels, n_samples)``, float or fixed-point samples) to
+    a WAV file ``chunk_size`` samples at a time. See :func:`AudioSignal.write_audio_to_file`.
+    """
+    n_channels, n_samples = audio_data.shape
+
+    def chunks():
+        for start in range(0, n_samples, chunk_size):
+            chunk = audio_data[:, start:start + chunk_size]
+            yield chunk if np.issubdtype(chunk.dtype, np.floating) else _fixed_point_to_float(chunk)
+
+    gain = 1.0
+    if normalize:
+        peak = max([np.max(np.abs(chunk)) for chunk in chunks()] or [0.0])
+        if peak > 1.0:
+            gain = 1.0 / peak
+
+    output_file = _WavWriter(output_file_path, n_channels, n_samples, sample_rate, sample_format)
+    try:
+        for chunk in chunks():
+            output_file.write(chunk * gain if gain != 1.0 else chunk)
+    finally:
+        output_file.close()
+
+
+class _WavWriter(object):
+    """
+    Writes a WAV file with ``n_samples`` samples per channel, one chunk of float samples at a time, so
+    the samples do not have to be in memory (or even computed yet) when the file is opened. The header is
+    written first, so exactly ``n_samples`` samples must be written before :func:`close`.
+    """
+    def __init__(self, output_file_path, n_channels, n_samples, sample_rate, sample_format):
+        self.sample_format = sample_format
+        sample_width = _SAMPLE_FORMAT_WIDTHS[sample_format]
+        block_align = n_channels * sample_width
+        data_size = n_samples * block_align
+
+        if sample_format == constants.SAMPLE_FORMAT_FLOAT32:
+            fmt_chunk = struct.pack('<HHIIHHH', _WAVE_FORMAT_IEEE_FLOAT, n_channels, sample_rate,
+                                    sample_rate * block_align, block_align, 8 * sample_width, 0)
+            fact_chunk = b'fact' + struct.pack('<II', 4, n_samples)
+        else:
+            fmt_chunk = struct.pack('<HHIIHH', _WAVE_FORMAT_PCM, n_channels, sample_rate,
+                                    sample_rate * block_align, block_align, 8 * sample_width)
+            fact_chunk = b''
+
+        self._pad = data_size % 2
+        riff_size = 4 + 8 + len(fmt_chunk) + len(fact_chunk) + 8 + data_size + self._pad
+        if riff_size > 2 ** 32 - 1:
+            raise AudioSignalException('Audio data is too large for a WAV file!')
+
+        self._file = open(output_file_path, 'wb')
+        self._file.write(b'RIFF' + struct.pack('<I', riff_size) + b'WAVE')
+        self._file.write(b'fmt ' + struct.pack('<I', len(fmt_chunk)) + fmt_chunk + fact_chunk)
+        self._file.write(b'data' + struct.pack('<I', data_size))
+
+    def write(self, chunk):
+        """Writes float samples with shape ``(n_channels, n)``."""
+        self._file.write(_to_wav_bytes(chunk.T, self.sample_format))
+
+    def close(self):
+        try:
+            if self._pad:
+                self._file.write(b'\x00')
+        finally:
+            self._file.close()
+
+
+def _to_wav_bytes(samples, sample_format):
+    """Converts float samples with shape ``(n_samples, n_channels)`` to the bytes of a WAV file."""
+    if sample_format == constants.SAMPLE_FORMAT_FLOAT32:
+        return np.ascontiguousarray(samples, dtype='<f4').tobytes()
+
+    max_int = 2 ** (8 * _SAMPLE_FORMAT_WIDTHS[sample_format] - 1)
+    ints = np.clip(np.round(samples * max_int), -max_int, max_int - 1)
+
+    if sample_format == constants.SAMPLE_FORMAT_INT16:
+        return np.ascontiguousarray(ints, dtype='<i2').tobytes()
+
+    ints = np.ascontiguousarray(ints, dtype='<i4')
+    if sample_format == constants.SAMPLE_FORMAT_INT24:
+        # the lowest 3 (little endian) bytes of each sample
+        return ints.view('u1').reshape(-1, 4)[:, :3].tobytes()
+
+    return ints.tobytes()
+
+
+def _read_window(window):
+    """Reads a window of a lazily loaded file (from :func:`next_window_generator`) into memory."""
+    if isinstance(window._audio_data, np.memmap):
+        audio_data = window.audio_data
+        window._audio_data = _read_only(np.array(audio_data) if isinstance(audio_data, np.memmap)
+                                        else audio_data)
+    return window
+
+
+def _prefetch(items, n_items, load):
+    """
+    Generator that yields ``load(item)`` for every item in ``items``, calling ``load`` for up to
+    ``n_items`` items ahead on a background thread. Exceptions from the thread are raised here.
+    """
+    loaded = queue.Queue(n_items)
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        # don't block forever if the caller stops early
+        while not stop.is_set():
+            try:
+                loaded.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def read_ahead():
+        try:
+            for item in items:
+                if not put((load(item), None)):
+                    return
+        except Exception:
+            put((None, sys.exc_info()))
+            return
+        put((done, None))
+
+    thread = threading.Thread(target=read_ahead)
+    thread.daemon = True
+    thread.start()
+
+    try:
+        while True:
+            item, exc_info = loaded.get()
+            if exc_info is not None:
+                six.reraise(*exc_info)
+            if item is done:
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _read_only(array):
+    """Returns ``array`` (a view of another array) with its ``writeable`` flag turned off."""
+    array.flags.writeable = False
+    return array
+
+
 class AudioSignalException(Exception):
     """
     Exception class for :class:`AudioSignal`.
@@ -12,7 +12,10 @@ __all__ = ['DEFAULT_SAMPLE_RATE', 'DEFAULT_WIN_LEN_PARAM', 'DEFAULT_BIT_DEPTH',
            'WINDOW_HAMMING', 'WINDOW_RECTANGULAR', 'WINDOW_HANN',
            'WINDOW_BLACKMAN', 'WINDOW_TRIANGULAR', 'WINDOW_DEFAULT',
            'ALL_WINDOWS', 'NUMPY_JSON_KEY', 'LEN_INDEX', 'CHAN_INDEX',
-           'STFT_VERT_INDEX', 'STFT_LEN_INDEX', 'STFT_CHAN_INDEX']
+           'STFT_VERT_INDEX', 'STFT_LEN_INDEX', 'STFT_CHAN_INDEX',
+           'FLOAT32', 'FLOAT64', 'DEFAULT_PRECISION', 'ALL_PRECISIONS',
+           'SAMPLE_FORMAT_INT16', 'SAMPLE_FORMAT_INT24', 'SAMPLE_FORMAT_INT32', 'SAMPLE_FORMAT_FLOAT32',
+           'DEFAULT_SAMPLE_FORMAT', 'ALL_SAMPLE_FORMATS']
 
 DEFAULT_SAMPLE_RATE = 44100  #: (int): Default sample rate. 44.1 kHz, CD-quality
 DEFAULT_WIN_LEN_PARAM = 0.04  #: (float): Default window length. 40ms
@@ -33,6 +36,27 @@ ALL_WINDOWS = [WINDOW_HAMMING, WINDOW_RECTANGULAR, WINDOW_HANN, WINDOW_BLACKMAN,
 """list(str): list of all available windows in *nussl*
 """
 
+FLOAT32 = 'float32'  #: (str): Name for single precision. Real data is float32, complex data is complex64.
+FLOAT64 = 'float64'  #: (str): Name for double precision. Real data is float64, complex data is complex128.
+
+DEFAULT_PRECISION = FLOAT64
+"""(str): Precision of new :class:`StftParams` objects when none is given. Change this to change the
+default precision of the whole library.
+"""
+ALL_PRECISIONS = [FLOAT32, FLOAT64]
+"""list(str): list of all available precisions in *nussl*
+"""
+
+SAMPLE_FORMAT_INT16 = 'int16'  #: (str): Name for writing 16-bit PCM audio files.
+SAMPLE_FORMAT_INT24 = 'int24'  #: (str): Name for writing 24-bit PCM audio files.
+SAMPLE_FORMAT_INT32 = 'int32'  #: (str): Name for writing 32-bit PCM audio files.
+SAMPLE_FORMAT_FLOAT32 = 'float32'  #: (str): Name for writing 32-bit floating point audio files.
+
+DEFAULT_SAMPLE_FORMAT = SAMPLE_FORMAT_INT16  #: (str): Default sample format of written audio files.
+ALL_SAMPLE_FORMATS = [SAMPLE_FORMAT_INT16, SAMPLE_FORMAT_INT24, SAMPLE_FORMAT_INT32, SAMPLE_FORMAT_FLOAT32]
+"""list(str): list of all sample formats that *nussl* can write
+"""
+
 NUMPY_JSON_KEY = "py/numpy.ndarray"  #: (str): key used when turning numpy arrays into json
 
 BINARY_MASK = 'binary'
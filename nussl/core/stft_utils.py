@@ -3,19 +3,21 @@
 
 from __future__ import division
 
+import collections
 import json
 import os.path
+import threading
 import warnings
 
 import librosa
 import matplotlib.pyplot as plt
 import numpy as np
-import scipy.fftpack as scifft
 import scipy.signal
+import six
 
 from nussl.core import constants
 __all__ = ['plot_stft', 'e_stft', 'e_istft', 'e_stft_plus', 'librosa_stft_wrapper', 'librosa_istft_wrapper',
-           'make_window', 'StftParams']
+           'make_window', 'precision_dtypes', 'StftParams', 'StftCache', 'stft_cache']
 
 
 def plot_stft(signal, file_name, title=None, win_length=None, hop_length=None,
@@ -112,7 +114,7 @@ def plot_stft(signal, file_name, title=None, win_length=None, hop_length=None,
 
 
 def e_stft(signal, window_length, hop_length, window_type,
-           n_fft_bins=None, remove_reflection=True, remove_padding=False):
+           n_fft_bins=None, remove_reflection=True, remove_padding=False, precision=None):
     """
     This function computes a short time fourier transform (STFT) of a 1D numpy array input signal.
     This will zero pad the signal by half a hop_length at the beginning to reduce the window
@@ -123,11 +125,12 @@ def e_stft(signal, window_length, hop_length, window_type,
     inverse STFT function, e_istft(), expects data without the reflection, the onus is on the user to remember
     to set the reconstruct_reflection flag in e_istft() input.
 
-    Additionally, this function assumes a single channeled audio signal and is not guaranteed to work on
-    multichannel audio. If you want to do an STFT on multichannel audio see the AudioSignal object.
+    If :param:`signal` is 2D, it is treated as multichannel audio with shape `(n_channels, n_samples)`
+    (like :attr:`AudioSignal.audio_data`). Every channel is padded in one go, and the STFT of each
+    channel is written directly into one preallocated 3D output array.
 
     Args:
-        signal: 1D numpy array containing audio data. (REAL)
+        signal: 1D numpy array containing audio data, or 2D array with shape (n_channels, n_samples). (REAL)
         window_length: (int) number of samples per window
         hop_length: (int) number of samples between the start of adjacent windows, or "hop"
         window_type: (string) type of window to use. Using WindowType object is recommended.
@@ -137,11 +140,14 @@ def e_stft(signal, window_length, hop_length, window_type,
         If not specified, defaults to True.
         remove_padding: (bool) (Optional) if True, this will remove the extra padding added when doing the STFT.
         Defaults to True.
+        precision: (str) (Optional) one of :attr:`constants.ALL_PRECISIONS`. The output is complex64 for
+        ``'float32'`` and complex128 for ``'float64'``. Defaults to :attr:`constants.DEFAULT_PRECISION`.
 
     Returns:
         2D  numpy array with complex STFT data.
         Data is of shape (num_time_blocks, num_fft_bins). These numbers are determined by length of the input signal,
         on internal zero padding (explained at top), and n_fft_bins/remove_reflection input (see example below).
+        If :param:`signal` is 2D, this is a 3D array with shape (num_fft_bins, num_time_blocks, n_channels).
 
     Example:
         
@@ -182,26 +188,32 @@ def e_stft(signal, window_length, hop_length, window_type,
         n_fft_bins = window_length
 
     window_type = constants.WINDOW_DEFAULT if window_type is None else window_type
-    window = make_window(window_type, window_length)
-
-    orig_signal_length = len(signal)
-    signal, num_blocks = _add_zero_padding(signal, window_length, hop_length)
-    sig_zero_pad = len(signal)
-    # figure out size of output stft
-    stft_bins = n_fft_bins // 2 + 1 if remove_reflection else n_fft_bins  # only want just over half of each fft
-
-    # this is where we do the stft calculation
-    stft = np.zeros((num_blocks, stft_bins), dtype=complex)
-    for hop in range(num_blocks):
-        start = hop * hop_length
-        end = start + window_length
-        unwindowed_signal = signal[start:end]
-        windowed_signal = np.multiply(unwindowed_signal, window)
-        fft = scifft.fft(windowed_signal, n=n_fft_bins)
-        stft[hop, ] = fft[:stft_bins]
-
-    # reshape the 2d array, so it's (n_fft, n_hops).
-    stft = stft.T
+    window = stft_cache.window(window_type, window_length)
+    real_dtype, complex_dtype = precision_dtypes(precision)
+
+    signal = np.asarray(signal)
+    is_multichannel = signal.ndim == 2
+    channels = signal if is_multichannel else np.expand_dims(signal, axis=constants.CHAN_INDEX)
+
+    orig_signal_length = channels.shape[constants.LEN_INDEX]
+    channels, num_blocks = _add_zero_padding(channels, window_length, hop_length)
+
+    # With the reflection removed we only want just over half of each fft, so use a real FFT.
+    stft_bins = n_fft_bins // 2 + 1 if remove_reflection else n_fft_bins
+    fft_func = np.fft.rfft if remove_reflection else np.fft.fft
+
+    # (n_fft, n_hops, n_channels), filled in channel by channel
+    stft = np.empty((stft_bins, num_blocks, channels.shape[constants.CHAN_INDEX]), dtype=complex_dtype)
+    window = window.astype(real_dtype, copy=False)
+
+    for ch, channel in enumerate(channels):
+        # every frame at once, as a (num_blocks, window_length) view into the zero-padded signal
+        frames = _frame_signal(channel, window_length, hop_length, num_blocks)
+
+        # this is where we do the stft calculation, one batched FFT over all of the frames.
+        stft[:, :, ch] = fft_func(frames * window, n=n_fft_bins, axis=1).T
+
+    stft = stft if is_multichannel else stft[:, :, 0]
     stft = _remove_stft_padding(stft, orig_signal_length, window_length, hop_length) if remove_padding else stft
 
     return stft
@@ -226,7 +238,7 @@ def librosa_stft_wrapper(signal, window_length, hop_length, window_type=None, re
     if window_type is not None and n_fft_bins is not None:
         warnings.warn("n_fft_bins ignored. Librosa's stft uses window_length as n_fft_bins")
 
-    window = make_window(window_type, window_length) if window_type is not None else None
+    window = stft_cache.window(window_type, window_length) if window_type is not None else None
     signal = librosa.util.fix_length(signal, len(signal) + hop_length)
     stft = librosa.stft(signal, n_fft=window_length, hop_length=hop_length, win_length=window_length,
                         window=window, center=center)
@@ -242,11 +254,15 @@ def e_istft(stft, window_length, hop_length, window_type, reconstruct_reflection
     this function assumes input STFT has no reflection above Nyquist and will rebuild it, but the
     reconstruct_reflection flag overrides that behavior.
 
-    Additionally, this function assumes a single channeled audio signal and is not guaranteed to work on
-    multichannel audio. If you want to do an iSTFT on multichannel audio see the AudioSignal object.
+    If :param:`stft` is 3D, it is treated as multichannel STFT data with shape
+    `(n_fft_bins, n_hops, n_channels)` (like :attr:`AudioSignal.stft_data`), and each channel is written
+    directly into one preallocated 2D output array.
+
+    The output has the precision of :param:`stft`: float32 for complex64 input and float64 for complex128 input.
 
     Args:
-        stft: complex valued 2D numpy array containing STFT data
+        stft: complex valued 2D numpy array containing STFT data, or 3D array with shape
+            (n_fft_bins, n_hops, n_channels)
         window_length: (int) number of samples per window
         hop_length: (int) number of samples between the start of adjacent windows, or "hop"
         window_type: (deprecated)
@@ -258,7 +274,8 @@ def e_istft(stft, window_length, hop_length, window_type, reconstruct_reflection
         mode. Note: librosa's works differently than nussl's and may produce different output.
 
     Returns:
-        1D numpy array containing an audio signal representing the original signal used to make stft
+        1D numpy array containing an audio signal representing the original signal used to make stft.
+        If :param:`stft` is 3D, this is a 2D array with shape (n_channels, n_samples).
 
     Example:
         
@@ -286,40 +303,92 @@ def e_istft(stft, window_length, hop_length, window_type, reconstruct_reflection
         calculated_signal = nussl.e_istft(stft, win_length, hop_length)
     """
 
-    n_hops = stft.shape[1]
+    window_type = constants.WINDOW_DEFAULT if window_type is None else window_type
+    window_length, hop_length = int(window_length), int(hop_length)
+    n_hops = stft.shape[constants.STFT_LEN_INDEX]
     overlap = window_length - hop_length
     signal_length = (n_hops * hop_length) + overlap
-    signal = np.zeros(signal_length)
 
-    norm_window = np.zeros(signal_length)
-    window = make_window(window_type, window_length)
-
-    # Add reflection back
-    stft = _add_reflection(stft) if reconstruct_reflection else stft
-
-    for n in range(n_hops):
-        start = n * hop_length
-        end = start + window_length
-        inv_sig_temp = np.real(scifft.ifft(stft[:, n]))
-        signal[start:end] += inv_sig_temp[:window_length]
-        norm_window[start:end] = norm_window[start:end] + window
-
-    norm_window[norm_window == 0.0] = constants.EPSILON  # Prevent dividing by zero
-    signal_norm = signal / norm_window
+    is_multichannel = stft.ndim == 3
+    stft = stft if is_multichannel else np.expand_dims(stft, axis=constants.STFT_CHAN_INDEX)
+    norm_window = stft_cache.window_normalization(window_type, window_length, hop_length, n_hops)
 
     # remove zero-padding
+    start, end = 0, signal_length
     if remove_padding:
         if overlap >= hop_length:
             ovp_hop_ratio = int(np.ceil(overlap / hop_length))
             start = ovp_hop_ratio * hop_length
             end = signal_length - overlap
 
-            signal_norm = signal_norm[start:end]
+        else:
+            start = hop_length
+
+    # (n_channels, n_samples), filled in channel by channel
+    real_dtype = np.result_type(stft.real.dtype, np.float32)
+    signal = np.empty((stft.shape[constants.STFT_CHAN_INDEX], max(end - start, 0)), dtype=real_dtype)
 
+    for ch in range(signal.shape[constants.CHAN_INDEX]):
+        # Invert every hop at once. irfft() rebuilds the reflection above Nyquist implicitly,
+        # so it gives the same result as an ifft() over the reconstructed reflection.
+        if reconstruct_reflection:
+            frames = np.fft.irfft(stft[:, :, ch], n=2 * (stft.shape[0] - 1), axis=0)
         else:
-            signal_norm = signal_norm[hop_length:]
+            frames = np.real(np.fft.ifft(stft[:, :, ch], axis=0))
+
+        frames = frames[:window_length, :].astype(real_dtype, copy=False)
+        channel = _overlap_add(frames, hop_length, signal_length)
+        signal[ch] = channel[start:end] / norm_window[start:end]
+
+    return signal if is_multichannel else signal[0]
+
+
+def _overlap_add(frames, hop_length, signal_length):
+    """
+    Overlap-adds the columns of :param:`frames`, spaced :param:`hop_length` samples apart.
+
+    Instead of adding one frame at a time, each frame is cut into ``ceil(window_length / hop_length)``
+    segments that are at most one hop long. The k-th segment of every frame lands in a different,
+    non-overlapping hop-sized row of the output, so each segment index is a single vectorized add.
+
+    Args:
+        frames (:obj:`np.ndarray`): 2D array with shape `(window_length, n_hops)`
+        hop_length (int): number of samples between the start of adjacent frames
+        signal_length (int): length of the output signal, ``(n_hops - 1) * hop_length + window_length``
+
+    Returns:
+        (:obj:`np.ndarray`) 1D array with the overlap-added frames
+
+    """
+    window_length, n_hops = frames.shape
+    n_segments = int(np.ceil(window_length / hop_length))
+
+    # output signal as a grid of hop-sized rows, with enough rows for the last segment of the last hop
+    grid = np.zeros((n_hops + n_segments - 1, hop_length), dtype=frames.dtype)
+
+    for k in range(n_segments):
+        start = k * hop_length
+        end = min(start + hop_length, window_length)
+        grid[k:k + n_hops, :end - start] += frames[start:end, :].T
+
+    return grid.ravel()[:signal_length]
 
-    return signal_norm
+
+def _window_normalization(window_type, window_length, hop_length, n_hops):
+    """
+    Overlap-added window envelope that :func:`e_istft` divides its output by. Zeros are replaced
+    by :attr:`constants.EPSILON` to prevent dividing by zero.
+
+    Returns:
+        (:obj:`np.ndarray`) 1D array of length ``(n_hops - 1) * hop_length + window_length``
+
+    """
+    window = stft_cache.window(window_type, window_length)
+    signal_length = (n_hops - 1) * hop_length + window_length
+    frames = np.broadcast_to(window[:, np.newaxis], (window_length, n_hops))
+    norm_window = _overlap_add(frames, hop_length, signal_length)
+    norm_window[norm_window == 0.0] = constants.EPSILON  # Prevent dividing by zero
+    return norm_window
 
 
 def librosa_istft_wrapper(stft, window_length, hop_length, window_type,
@@ -338,7 +407,7 @@ def librosa_istft_wrapper(stft, window_length, hop_length, window_type,
     Returns:
 
     """
-    window = _get_window_function(window_type) if window_type is not None else None
+    window = stft_cache.window_function(window_type) if window_type is not None else None
 
     if remove_reflection:
         n_fft = stft.shape[0]
@@ -399,7 +468,7 @@ def e_stft_plus(signal, window_length, hop_length, window_type, sample_rate,
     time_vector = np.multiply(hop_in_secs, time_vector)
 
     window_type = constants.WINDOW_DEFAULT if window_type is None else window_type
-    window = make_window(window_type, window_length)
+    window = stft_cache.window(window_type, window_length)
     win_dot = np.dot(window, window.T)
     psd = np.zeros_like(stft, dtype=float)
     for i in range(psd.shape[1]):
@@ -410,37 +479,68 @@ def e_stft_plus(signal, window_length, hop_length, window_type, sample_rate,
 
 def _add_zero_padding(signal, window_length, hop_length):
     """
+    Zero pads the last axis of :param:`signal` so that it fits an integer number of hops.
 
     Args:
-        signal:
+        signal: 1D signal, or 2D signal with shape (n_channels, n_samples)
         window_length:
         hop_length:
     Returns:
     """
-    original_signal_length = len(signal)
+    original_signal_length = signal.shape[-1]
     overlap = window_length - hop_length
-    num_blocks = np.ceil(len(signal) / hop_length)
+    num_blocks = np.ceil(original_signal_length / hop_length)
 
     if overlap >= hop_length:  # Hop is less than 50% of window length
         overlap_hop_ratio = np.ceil(overlap / hop_length)
 
         before = int(overlap_hop_ratio * hop_length)
         after = int((num_blocks * hop_length + overlap) - original_signal_length)
-
-        signal = np.pad(signal, (before, after), 'constant', constant_values=(0, 0))
         extra = overlap
 
     else:
+        before = hop_length
         after = int((num_blocks * hop_length + overlap) - original_signal_length)
-        signal = np.pad(signal, (hop_length, after), 'constant', constant_values=(0, 0))
         extra = window_length
 
-    num_blocks = int(np.ceil((len(signal) - extra) / hop_length))
+    pad_width = [(0, 0)] * (signal.ndim - 1) + [(before, after)]
+    signal = np.pad(signal, pad_width, 'constant', constant_values=0)
+
+    num_blocks = int(np.ceil((signal.shape[-1] - extra) / hop_length))
     num_blocks += 1 if overlap == 0 else 0  # if no overlap, then we need to get another hop at the end
 
     return signal, num_blocks
 
 
+def _frame_signal(signal, window_length, hop_length, num_blocks):
+    """
+    Makes a strided view into :param:`signal` where each row is one frame of the STFT. No data is
+    copied, so the returned array must not be written to.
+
+    Args:
+        signal (:obj:`np.ndarray`): 1D zero-padded signal, as returned by :func:`_add_zero_padding`
+        window_length (int): number of samples per frame
+        hop_length (int): number of samples between the start of adjacent frames
+        num_blocks (int): number of frames
+
+    Returns:
+        (:obj:`np.ndarray`) read-only view with shape `(num_blocks, window_length)`
+
+    """
+    signal = np.ascontiguousarray(signal)
+    window_length, hop_length, num_blocks = int(window_length), int(hop_length), int(num_blocks)
+
+    if num_blocks <= 0 or (num_blocks - 1) * hop_length + window_length > len(signal):
+        raise ValueError('Signal is too short to make {} frames of length {} with hop {}!'
+                         .format(num_blocks, window_length, hop_length))
+
+    stride = signal.strides[0]
+    frames = np.lib.stride_tricks.as_strided(signal, shape=(num_blocks, window_length),
+                                             strides=(hop_length * stride, stride))
+    frames.flags.writeable = False
+    return frames
+
+
 def _remove_stft_padding(stft, original_signal_length, window_length, hop_length):
     """
 
@@ -490,6 +590,29 @@ def make_window(window_type, length, symmetric=False):
         return None
 
 
+def precision_dtypes(precision=None):
+    """
+    Gets the real and complex numpy dtypes for a precision setting.
+
+    Args:
+        precision (str): One of :attr:`constants.ALL_PRECISIONS`. If ``None``,
+            :attr:`constants.DEFAULT_PRECISION` is used.
+
+    Returns:
+        (tuple) ``(real_dtype, complex_dtype)``, i.e., ``(np.float32, np.complex64)`` for ``'float32'``
+        and ``(np.float64, np.complex128)`` for ``'float64'``.
+
+    """
+    precision = constants.DEFAULT_PRECISION if precision is None else precision
+
+    if precision == constants.FLOAT32:
+        return np.float32, np.complex64
+    elif precision == constants.FLOAT64:
+        return np.float64, np.complex128
+    else:
+        raise ValueError('Unknown precision {}! Known precisions: {}'.format(precision, constants.ALL_PRECISIONS))
+
+
 def _get_window_function(window_type):
     """
     Gets a window function from ``scipy.signal``
@@ -506,6 +629,132 @@ def _get_window_function(window_type):
         return None
 
 
+class StftCache(object):
+    """
+    A bounded, least-recently-used cache for everything in an STFT or iSTFT that only depends on the
+    STFT parameters and not on the signal: windows (keyed on `(window_type, length, symmetric)`),
+    the window normalization envelopes that :func:`e_istft` divides by (keyed on
+    `(window_type, window_length, hop_length, n_hops)`), and window functions looked up from
+    ``scipy.signal``. Batch jobs that run many STFTs with the same :class:`StftParams` only pay for
+    these once.
+
+    *nussl* keeps one of these around as :attr:`stft_cache`, which :func:`e_stft`, :func:`e_istft`,
+    and :func:`e_stft_plus` all use. Cached arrays are read-only, because they are shared between
+    calls.
+
+    Notes:
+        ``numpy.fft`` does not expose reusable FFT plans (it keeps its own internal cache of
+        twiddle factors per FFT size), so there are no plans stored here.
+
+    Parameters:
+        max_size (int): Maximum number of entries to keep. When full, the least recently used
+            entry is evicted.
+
+    Attributes:
+        hits (int): Number of lookups that were found in the cache.
+        misses (int): Number of lookups that had to be computed.
+
+    Examples:
+        >>> import nussl
+        >>> nussl.stft_utils.stft_cache.clear()
+        >>> w = nussl.stft_utils.stft_cache.window(nussl.WINDOW_HANN, 2048)
+        >>> w = nussl.stft_utils.stft_cache.window(nussl.WINDOW_HANN, 2048)
+        >>> nussl.stft_utils.stft_cache.info()
+        CacheInfo(hits=1, misses=1, max_size=64, current_size=1)
+
+    """
+    DEFAULT_MAX_SIZE = 64
+    CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'max_size', 'current_size'])
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, compute_func):
+        """
+        Returns the value stored for :param:`key`, or calls :param:`compute_func` (with no arguments)
+        to compute it and stores the result. If the value is a :obj:`np.ndarray` it is made read-only.
+
+        Args:
+            key (tuple): Hashable key for this value.
+            compute_func (callable): Function that computes the value if it is not in the cache.
+
+        Returns:
+            The cached (or freshly computed) value.
+
+        """
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                value = self._entries.pop(key)  # move to the most recently used end
+                self._entries[key] = value
+                return value
+
+            self.misses += 1
+
+        value = compute_func()
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+
+        with self._lock:
+            self._entries[key] = value
+            while len(self._entries) > max(self.max_size, 0):
+                self._entries.popitem(last=False)
+
+        return value
+
+    def window(self, window_type, length, symmetric=False):
+        """
+        Cached version of :func:`make_window`.
+        """
+        return self.get(('window', window_type, int(length), symmetric),
+                        lambda: make_window(window_type, int(length), symmetric))
+
+    def window_normalization(self, window_type, window_length, hop_length, n_hops):
+        """
+        Overlap-added window envelope for an iSTFT with :param:`n_hops` hops, as used by
+        :func:`e_istft`.
+        """
+        key = ('norm_window', window_type, int(window_length), int(hop_length), int(n_hops))
+        return self.get(key, lambda: _window_normalization(window_type, int(window_length),
+                                                           int(hop_length), int(n_hops)))
+
+    def window_function(self, window_type):
+        """
+        Cached version of :func:`_get_window_function`.
+        """
+        return self.get(('window_function', window_type),
+                        lambda: _get_window_function(window_type))
+
+    def info(self):
+        """
+        Returns:
+            (:obj:`StftCache.CacheInfo`) named tuple with the hit and miss counters, the
+            maximum size, and the current number of entries in the cache.
+
+        """
+        with self._lock:
+            return self.CacheInfo(self.hits, self.misses, self.max_size, len(self._entries))
+
+    def clear(self):
+        """
+        Removes every entry from the cache and resets the hit and miss counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+stft_cache = StftCache()  #: (:obj:`StftCache`): Cache shared by all of the STFT functions in *nussl*
+
+
 def _add_reflection(matrix):
     reflection = matrix[-2:0:-1, :]
     reflection = reflection.conj()
@@ -523,8 +772,12 @@ class StftParams(object):
     is the only way that a top level user has access to the STFT parameter settings that
     all of the separation algorithms are built upon.
     This object will get passed around instead of each of these individual attributes.
+
+    :attr:`precision` sets whether STFTs are computed and stored as complex64 (``'float32'``) or
+    complex128 (``'float64'``). Inverse STFTs and masks follow the precision of the STFT they come from.
     """
-    def __init__(self, sample_rate, window_length=None, hop_length=None, window_type=None, n_fft_bins=None):
+    def __init__(self, sample_rate, window_length=None, hop_length=None, window_type=None, n_fft_bins=None,
+                 precision=None):
         self.sample_rate = int(sample_rate)
 
         # default to 40ms windows
@@ -533,6 +786,8 @@ class StftParams(object):
         self._hop_length = self._window_length // 2 if hop_length is None else int(hop_length)
         self.window_type = constants.WINDOW_DEFAULT if window_type is None else window_type
         self._n_fft_bins = self._window_length if n_fft_bins is None else int(n_fft_bins)
+        self._precision = None
+        self.precision = constants.DEFAULT_PRECISION if precision is None else precision
 
         self._hop_length_needs_update = True
         self._n_fft_bins_needs_update = True
@@ -605,6 +860,20 @@ class StftParams(object):
         self._n_fft_bins_needs_update = False
         self._n_fft_bins = value
 
+    @property
+    def precision(self):
+        """
+        Precision of STFTs computed with these parameters, one of :attr:`constants.ALL_PRECISIONS`.
+        Defaults to :attr:`constants.DEFAULT_PRECISION`.
+        This property is settable.
+        """
+        return self._precision
+
+    @precision.setter
+    def precision(self, value):
+        precision_dtypes(value)  # raises if value isn't a known precision
+        self._precision = value
+
     @property
     def window_overlap(self):
         """
@@ -618,6 +887,8 @@ class StftParams(object):
         return json.dumps(self, default=self._to_json_helper)
 
     def _to_json_helper(self, o):
+        if isinstance(o, np.generic):
+            return o.item()
         if not isinstance(o, StftParams):
             raise TypeError
         d = {'__class__': o.__class__.__name__,
@@ -639,7 +910,7 @@ class StftParams(object):
             sr = json_dict['sample_rate']
             s = StftParams(sr)
             for k, v in json_dict.items():
-                s.__dict__[k] = v if not isinstance(v, unicode) else v.encode('ascii')
+                s.__dict__[k] = v if not isinstance(v, six.text_type) else str(v)
             return s
         else:
             return json_dict
@@ -10,6 +10,8 @@ import warnings
 import base64
 import json
 import re
+import struct
+import threading
 import collections
 
 import numpy as np
@@ -17,9 +19,9 @@ import musdb
 
 from nussl.core import constants
 
-__all__ = ['find_peak_indices', 'find_peak_values',
+__all__ = ['find_peak_indices', 'find_peak_values', 'find_peak_indices_batch',
            'json_ready_numpy_array', 'json_serialize_numpy_array', 'load_numpy_json',
-           'json_numpy_obj_hook',
+           'json_numpy_obj_hook', 'save_binary', 'load_binary',
            'add_mismatched_arrays', 'add_mismatched_arrays2D', 'complex_randn',
            '_get_axis',
            'print_all_separation_algorithms',
@@ -187,6 +189,124 @@ def find_peak_values(input_array, n_peaks, min_dist=None, do_min=False, threshol
                                                                 do_min, threshold)]
 
 
+def find_peak_indices_batch(input_array, n_peaks, min_dist=None, do_min=False, threshold=0.5):
+    """
+    Finds the indices of the peaks of every row of a 2-D numpy array at once. This is a
+    vectorized alternative to calling :func:`find_peak_indices` on each row.
+
+    Each row is scaled between 0.0 and 1.0 and everything below ``threshold`` is thrown out,
+    then peaks are picked greedily like :func:`find_peak_indices` does: the largest value is a
+    peak, it and its surroundings are zeroed out, and so on until ``n_peaks`` are found or
+    nothing is left. Every step runs on all rows at once.
+
+    Notes:
+        * For rows whose values are all non-negative, the peaks are exactly the ones that
+        :func:`find_peak_indices` finds in that row, in the same order.
+
+        * Rows whose values are all equal have no peaks.
+
+        * Unlike :func:`find_peak_indices`, no error is raised or warning given when a row
+        has fewer than ``n_peaks`` peaks. Check ``n_found`` instead.
+
+        * Rows with negative values are shifted by their minimum before scaling, and ``do_min``
+        negates the rows before that, so the peaks of such rows (and all peaks with ``do_min``)
+        can differ from the ones :func:`find_peak_indices` finds.
+
+    See Also:
+        :: :func:`find_peak_indices` ::
+
+    Args:
+        input_array: a 2-dimensional numpy array. Peaks are found within each row.
+        n_peaks: (int) maximum number of peaks to find per row
+        min_dist: (int) minimum distance between peaks in a row. Default value: n_columns // 4
+        do_min: (bool) if True, finds indices at minimum value instead of maximum
+        threshold: (float) the value (scaled between 0.0 and 1.0)
+
+    Returns:
+        peak_indices: (np.array) int array of shape ``(n_rows, n_peaks)`` holding the column
+            index of the peaks of each row in the order they were found, padded with -1
+        n_found: (np.array) int array of shape ``(n_rows,)`` with the number of peaks per row
+
+    """
+    input_array = np.asarray(input_array)
+
+    if input_array.ndim != 2:
+        raise ValueError('Can only find peak indices in batches on 2 dimensional data!')
+
+    n_rows, n_cols = input_array.shape
+    min_dist = n_cols // 4 if min_dist is None else int(min_dist)
+    peak_indices = np.full((n_rows, n_peaks), -1, dtype=int)
+    n_found = np.zeros(n_rows, dtype=int)
+
+    if n_cols == 0:
+        return peak_indices, n_found
+
+    values = np.array(input_array, dtype=float)
+    if do_min:
+        np.negative(values, out=values)
+
+    # scale each row between [0.0, 1.0], like find_peak_indices() (rows whose values are all
+    # equal are all zeros after the first step)
+    values -= np.min(values, axis=1, keepdims=True)
+    row_max = np.max(values, axis=1, keepdims=True)
+    values /= np.where(row_max > 0.0, row_max, 1.0)
+
+    # throw out everything below threshold
+    values *= values >= threshold
+
+    # Picking the largest value that is left and zeroing out its surroundings is the same as
+    # going through each row in order of value (ties by lower index, like np.argmax) and taking
+    # every value that has not been zeroed out. Each peak zeroes out at most 2 * min_dist + 2
+    # values, so every peak is within the first n_peaks * (2 * min_dist + 2) values of its row.
+    n_ranks = min(n_cols, n_peaks * (2 * min_dist + 2))
+    rows = np.arange(n_rows)
+    order = _sorted_columns(values, n_ranks)
+
+    # zeroed[r, c + min_dist + 1] is True when column c of row r was zeroed out by a peak, over
+    # the same span as _set_array_zero_indices()
+    zeroed = np.zeros((n_rows, n_cols + 2 * min_dist + 2), dtype=bool)
+    span = np.arange(2 * min_dist + 2)
+
+    for rank in range(n_ranks):
+        columns = order[:, rank]
+        searching = (values[rows, columns] > 0.0) & (n_found < n_peaks)
+        if not np.any(searching):
+            break
+
+        keep = searching & ~zeroed[rows, columns + min_dist + 1]
+        kept_rows = rows[keep]
+        peak_indices[kept_rows, n_found[kept_rows]] = columns[keep]
+        n_found[kept_rows] += 1
+        zeroed[kept_rows[:, np.newaxis], columns[keep][:, np.newaxis] + span] = True
+
+    return peak_indices, n_found
+
+
+def _sorted_columns(values, n_ranks):
+    """
+    Returns the columns of the ``n_ranks`` largest values of each row of ``values``, in
+    descending order of value and ascending order of column for equal values.
+    """
+    n_rows, n_cols = values.shape
+    if n_ranks == 0 or n_ranks >= n_cols:
+        return np.argsort(-values, axis=1, kind='mergesort')[:, :n_ranks]
+
+    rows = np.arange(n_rows)[:, np.newaxis]
+    top = np.argpartition(-values, n_ranks - 1, axis=1)[:, :n_ranks]
+    top_values = values[rows, top]
+    order = top[rows, np.lexsort((top, -top_values))]
+
+    # argpartition() picks any of the columns that tie with the smallest value it keeps, so
+    # rows where some of them were left out are sorted in full (unless they are zeros, which are
+    # never peaks)
+    smallest = np.min(top_values, axis=1, keepdims=True)
+    partial_ties = np.flatnonzero((smallest[:, 0] > 0.0) & (np.sum(values >= smallest, axis=1) > n_ranks))
+    if partial_ties.size:
+        order[partial_ties] = np.argsort(-values[partial_ties], axis=1, kind='mergesort')[:, :n_ranks]
+
+    return order
+
+
 def json_ready_numpy_array(array):
     """
     Adapted from:
@@ -198,8 +318,13 @@ def json_ready_numpy_array(array):
 
     """
     if isinstance(array, np.ndarray):
+        saving = getattr(_binary_arrays, 'saving', None)
+        if saving is not None:
+            # inside save_binary(): the array is written as raw bytes, the JSON only has its index
+            return {constants.NUMPY_JSON_KEY: {"__npy_index__": saving.add(array)}}
+
         # noinspection PyTypeChecker
-        data_b64 = base64.b64encode(np.ascontiguousarray(array).data)
+        data_b64 = base64.b64encode(np.ascontiguousarray(array).data).decode('ascii')
         return {
                 constants.NUMPY_JSON_KEY: {
                         "__ndarray__": data_b64,
@@ -257,12 +382,132 @@ def json_numpy_obj_hook(dct):
     :param dct: (dict) json encoded ndarray
     :return: (ndarray) if input was an encoded ndarray
     """
+    if isinstance(dct, dict) and '__npy_index__' in dct:
+        loading = getattr(_binary_arrays, 'loading', None)
+        if loading is None:
+            raise ValueError('JSON from save_binary() can only be loaded with load_binary()!')
+        return loading[dct['__npy_index__']]
+
     if isinstance(dct, dict) and '__ndarray__' in dct:
         data = base64.b64decode(dct['__ndarray__'])
         return np.frombuffer(data, dct['dtype']).reshape(dct['shape'])
     return dct
 
 
+_BINARY_MAGIC = b'NUSSLBIN'
+_BINARY_ALIGNMENT = 64
+_binary_arrays = threading.local()
+
+
+class _BinaryArrays(object):
+    """The arrays found by :func:`json_ready_numpy_array` during :func:`save_binary`, each stored once."""
+    def __init__(self):
+        self.arrays = []
+        self._indices = {}
+
+    def add(self, array):
+        if array.dtype.hasobject:
+            raise ValueError('Cannot save numpy arrays of Python objects to a binary file!')
+
+        if id(array) not in self._indices:
+            self._indices[id(array)] = len(self.arrays)
+            self.arrays.append(array)  # this also keeps id(array) unique
+        return self._indices[id(array)]
+
+
+def _binary_align(n_bytes):
+    return -(-n_bytes // _BINARY_ALIGNMENT) * _BINARY_ALIGNMENT
+
+
+def save_binary(output_file_path, to_json):
+    """
+    Saves the JSON string made by ``to_json()`` to a binary file, but with every numpy array in it
+    (from :func:`json_ready_numpy_array`) written as raw bytes instead of being base64 encoded in the
+    JSON. The file is about 25% smaller than the JSON string, and :func:`load_binary` memory maps
+    the arrays instead of decoding them.
+
+    The file has the 8 bytes ``b'NUSSLBIN'``, the length of the header (little endian uint64), the
+    header (UTF-8 JSON with the JSON string and the dtype, shape and offset of every array), and
+    then the bytes of every array in C order, each starting at a multiple of 64 bytes.
+
+    Args:
+        output_file_path (str): Path to the output file.
+        to_json (callable): Function that makes the JSON string, e.g. ``audio_signal.to_json``.
+
+    See Also:
+        :func:`load_binary`
+    """
+    _binary_arrays.saving = _BinaryArrays()
+    try:
+        json_string = to_json()
+        arrays = _binary_arrays.saving.arrays
+    finally:
+        _binary_arrays.saving = None
+
+    specs = []
+    offset = 0
+    for array in arrays:
+        specs.append({'dtype': array.dtype.str, 'shape': array.shape, 'offset': offset})
+        offset = _binary_align(offset + array.nbytes)
+
+    header = json.dumps({'json': json_string, 'arrays': specs}).encode('utf-8')
+    data_start = _binary_align(len(_BINARY_MAGIC) + 8 + len(header))
+
+    with open(output_file_path, 'wb') as output_file:
+        output_file.write(_BINARY_MAGIC + struct.pack('<Q', len(header)) + header)
+
+        for array, spec in zip(arrays, specs):
+            output_file.write(b'\0' * (data_start + spec['offset'] - output_file.tell()))
+            output_file.write(np.ascontiguousarray(array).data)
+
+
+def load_binary(input_file_path, from_json, mmap_mode='c'):
+    """
+    Loads a file from :func:`save_binary` with ``from_json()``, e.g. ``AudioSignal.from_json``. The
+    arrays are memory mapped, so they are only read from the file when they are used.
+
+    Args:
+        input_file_path (str): Path to a file from :func:`save_binary`.
+        from_json (callable): Function that makes an object from the JSON string.
+        mmap_mode (str): Mode for :obj:`np.memmap`. Defaults to ``'c'`` (copy-on-write: the arrays
+            can be changed, but the changes are never written to the file). If ``None``, every array
+            is read into memory.
+
+    Raises:
+        ValueError: If ``input_file_path`` is not a file from :func:`save_binary`.
+
+    Returns:
+        The object returned by ``from_json()``.
+
+    See Also:
+        :func:`save_binary`
+    """
+    with open(input_file_path, 'rb') as input_file:
+        if input_file.read(len(_BINARY_MAGIC)) != _BINARY_MAGIC:
+            raise ValueError('{} is not a file from save_binary()!'.format(input_file_path))
+
+        header_length = struct.unpack('<Q', input_file.read(8))[0]
+        header = json.loads(input_file.read(header_length).decode('utf-8'))
+        data_start = _binary_align(len(_BINARY_MAGIC) + 8 + header_length)
+
+        arrays = []
+        for spec in header['arrays']:
+            dtype, shape = np.dtype(str(spec['dtype'])), tuple(spec['shape'])
+            offset = data_start + spec['offset']
+
+            if mmap_mode is not None and len(shape) > 0 and np.prod(shape) > 0:
+                arrays.append(np.memmap(input_file_path, dtype=dtype, mode=mmap_mode, offset=offset, shape=shape))
+            else:
+                input_file.seek(offset)
+                arrays.append(np.fromfile(input_file, dtype=dtype, count=int(np.prod(shape))).reshape(shape))
+
+    _binary_arrays.loading = arrays
+    try:
+        return from_json(header['json'])
+    finally:
+        _binary_arrays.loading = None
+
+
 def add_mismatched_arrays(array1, array2, truncate=False):
     """
     Will add two 1D numpy arrays of different length. If :param:`truncate` is ``False``, it will
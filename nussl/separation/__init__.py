@@ -42,6 +42,11 @@ benchmark_algorithms = [IdealMask, HighLowPassFilter]
 from .overlap_add import OverlapAdd
 composite_instruments = [OverlapAdd]
 
+# Streaming algorithms
+from .streaming_repet import StreamingRepet
+from .streaming_overlap_add import StreamingOverlapAdd
+streaming_algorithms = [StreamingRepet, StreamingOverlapAdd]
+
 # Matrix factorization and component analysis
 from .nmf_mfcc import NMF_MFCC
 from .ica import ICA
@@ -73,6 +78,7 @@ __all__ = ['SeparationBase', 'MaskSeparationBase',
            'spatialization_algorithms', 'Duet', 'Projet',
            'benchmark_algorithms', 'IdealMask', 'HighLowPassFilter',
            'composite_instruments', 'OverlapAdd',
+           'streaming_algorithms', 'StreamingRepet', 'StreamingOverlapAdd',
            'nmf_algorithms', 'NMF_MFCC',
            'component_analysis_algorithms', 'ICA', 'RPCA',
            'deep_learning_algorithms', 'DeepClustering']
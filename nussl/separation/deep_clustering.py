@@ -3,7 +3,6 @@
 """
 Deep Clustering Separation Class
 """
-import copy
 import warnings
 
 try:
@@ -73,13 +72,14 @@ class DeepClustering(mask_separation_base.MaskSeparationBase):
                  do_mono=False,
                  resample_rate=44100,
                  use_librosa_stft=False,
-                 cutoff=-40):
+                 cutoff=-40,
+                 precision=None):
 
         if not torch_okay:
             raise ImportError('Cannot import pytorch! Install pytorch to continue.')
 
         super(DeepClustering, self).__init__(input_audio_signal=input_audio_signal,
-                                             mask_type=mask_type)
+                                             mask_type=mask_type, precision=precision)
 
         self.resample_rate = resample_rate
         if self.audio_signal.sample_rate != self.resample_rate:
@@ -256,8 +256,7 @@ class DeepClustering(mask_separation_base.MaskSeparationBase):
         """
             Applies individual mask and returns audio_signal object
         """
-        source = copy.deepcopy(self.audio_signal)
-        source = source.apply_mask(mask)
+        source = self.audio_signal.apply_mask(mask)
         source.stft_params = self.stft_params
         source.istft(overwrite=True, truncate_to_length=self.audio_signal.signal_length)
 
@@ -47,6 +47,7 @@ class Duet(mask_separation_base.MaskSeparationBase):
         delay_min_distance (int): Minimum distance between peaks wrt delay.
         p (int): Weight the histogram with the symmetric attenuation estimator.
         q (int): Weight the histogram with the delay estimator
+        precision (str): ``'float32'`` or ``'float64'``. See :attr:`MaskSeparationBase.precision`.
         On page 8 of his paper, Rickard recommends p=1 and q=0 as a default starting point and p=.5, q=0 if one
         source is more dominant.
 
@@ -75,9 +76,11 @@ class Duet(mask_separation_base.MaskSeparationBase):
     def __init__(self, input_audio_signal, num_sources,
                  attenuation_min=-3, attenuation_max=3, num_attenuation_bins=50,
                  delay_min=-3, delay_max=3, num_delay_bins=50,
-                 peak_threshold=0.2, attenuation_min_distance=5, delay_min_distance=5, p=1, q=0):
+                 peak_threshold=0.2, attenuation_min_distance=5, delay_min_distance=5, p=1, q=0,
+                 precision=None):
         super(Duet, self).__init__(input_audio_signal=input_audio_signal,
-                                   mask_type=mask_separation_base.MaskSeparationBase.BINARY_MASK)
+                                   mask_type=mask_separation_base.MaskSeparationBase.BINARY_MASK,
+                                   precision=precision)
 
         if not self.audio_signal.is_stereo:
             raise ValueError('Duet requires that the input_audio_signal has exactly 2 channels!')
@@ -20,9 +20,9 @@ class HighLowPassFilter(mask_separation_base.MaskSeparationBase):
 
     def __init__(self, input_audio_signal, high_pass_cutoff_hz, do_fir_filter=False,
                  force_recompute_stft=False,
-                 mask_type=mask_separation_base.MaskSeparationBase.BINARY_MASK):
+                 mask_type=mask_separation_base.MaskSeparationBase.BINARY_MASK, precision=None):
         super(HighLowPassFilter, self).__init__(input_audio_signal=input_audio_signal,
-                                                mask_type=mask_type)
+                                                mask_type=mask_type, precision=precision)
         self.high_pass_cutoff_hz = high_pass_cutoff_hz
 
         self.should_do_fir_filter = do_fir_filter
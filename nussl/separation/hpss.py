@@ -7,7 +7,6 @@ from nussl.separation import mask_separation_base
 from nussl.separation import  masks
 from ..core import constants
 import librosa
-import copy
 
 
 class HPSS(mask_separation_base.MaskSeparationBase):
@@ -30,12 +29,14 @@ class HPSS(mask_separation_base.MaskSeparationBase):
         do_mono: (Optional) (bool) Flattens AudioSignal to mono before running the algorithm
             (does not effect the input AudioSignal object)
         use_librosa_stft: (Optional) (bool) Calls librosa's stft function instead of nussl's
+        precision: (Optional) (str) ``'float32'`` or ``'float64'``. See :attr:`MaskSeparationBase.precision`.
 
     """
     def __init__(self, input_audio_signal, kernel_size=31,
                  do_mono=False, use_librosa_stft=constants.USE_LIBROSA_STFT,
-                 mask_type=mask_separation_base.MaskSeparationBase.SOFT_MASK):
-        super(HPSS, self).__init__(input_audio_signal=input_audio_signal, mask_type=mask_type)
+                 mask_type=mask_separation_base.MaskSeparationBase.SOFT_MASK, precision=None):
+        super(HPSS, self).__init__(input_audio_signal=input_audio_signal, mask_type=mask_type,
+                                   precision=precision)
         self.harmonic = None
         self.percussive = None
         self.use_librosa_stft = use_librosa_stft
@@ -122,8 +123,7 @@ class HPSS(mask_separation_base.MaskSeparationBase):
         """
         self.sources = []
         for mask in self.masks: 
-            source = copy.deepcopy(self.audio_signal)
-            source = source.apply_mask(mask)
+            source = self.audio_signal.apply_mask(mask)
             source.stft_params = self.stft_params
             source.istft(overwrite=True, truncate_to_length=self.audio_signal.signal_length)
             self.sources.append(source)
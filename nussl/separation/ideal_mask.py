@@ -36,6 +36,8 @@ class IdealMask(mask_separation_base.MaskSeparationBase):
             :attr:`SOFT_MASK`.
         use_librosa_stft (bool, Optional): Whether to use librosa's STFT function. Optional, defaults to config 
             settings.
+        precision (str, Optional): ``'float32'`` or ``'float64'``. See
+            :attr:`MaskSeparationBase.precision`. Optional, defaults to the precision of ``input_audio_mixture``.
         
     Attributes:
         sources (list): List of :class:`audio_signal.AudioSignal` objects from :func:`__init__()` where each object 
@@ -81,8 +83,9 @@ class IdealMask(mask_separation_base.MaskSeparationBase):
 
     def __init__(self, input_audio_mixture, sources_list, power=1, split_zeros=False, binary_db_threshold=20,
                  mask_type=mask_separation_base.MaskSeparationBase.SOFT_MASK,
-                 use_librosa_stft=constants.USE_LIBROSA_STFT):
-        super(IdealMask, self).__init__(input_audio_signal=input_audio_mixture, mask_type=mask_type)
+                 use_librosa_stft=constants.USE_LIBROSA_STFT, precision=None):
+        super(IdealMask, self).__init__(input_audio_signal=input_audio_mixture, mask_type=mask_type,
+                                        precision=precision)
 
         self.sources = utils.verify_audio_signal_list_strict(sources_list)
 
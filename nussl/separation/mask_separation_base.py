@@ -8,11 +8,14 @@ Base class for separation algorithms that make masks. Most algorithms in nussl a
 import json
 import warnings
 
+import six
+
 from nussl.separation import masks
 from nussl.separation import separation_base
 from ..core import utils
 from ..core import audio_signal
 from ..core import constants
+from ..core import stft_utils
 
 
 class MaskSeparationBase(separation_base.SeparationBase):
@@ -33,6 +36,8 @@ class MaskSeparationBase(separation_base.SeparationBase):
         mask_type: (str) Indicates whether to make binary or soft masks. See :attr:`mask_type` property for details.
         mask_threshold: (float) Value between [0.0, 1.0] to convert a soft mask to a binary mask. See 
             :attr:`mask_threshold` property for details.
+        precision: (str) ``'float32'`` or ``'float64'``. Precision of the STFT and soft masks. See :attr:`precision`
+            property for details. Defaults to the precision of ``input_audio_signal.stft_params``.
     
     """
 
@@ -46,7 +51,7 @@ class MaskSeparationBase(separation_base.SeparationBase):
 
     _valid_mask_types = [BINARY_MASK, SOFT_MASK]
 
-    def __init__(self, input_audio_signal, mask_type=SOFT_MASK, mask_threshold=0.5):
+    def __init__(self, input_audio_signal, mask_type=SOFT_MASK, mask_threshold=0.5, precision=None):
         super(MaskSeparationBase, self).__init__(input_audio_signal=input_audio_signal)
 
         self._mask_type = None
@@ -55,6 +60,9 @@ class MaskSeparationBase(separation_base.SeparationBase):
         self.mask_threshold = mask_threshold
         self.result_masks = []
 
+        if precision is not None:
+            self.precision = precision
+
     @property
     def mask_type(self):
         """
@@ -176,6 +184,35 @@ class MaskSeparationBase(separation_base.SeparationBase):
 
         self._mask_threshold = value
 
+    @property
+    def precision(self):
+        """
+        PROPERTY
+
+        Precision that this algorithm computes with, one of :attr:`constants.ALL_PRECISIONS`. With ``'float32'``,
+        the STFT of :attr:`audio_signal` is complex64, soft masks are float32 and the separated signals are float32.
+        With ``'float64'`` (the default) these are complex128 and float64.
+
+        This is :attr:`audio_signal.stft_params.precision`. Setting it only changes this object's copy of the
+        :class:`spectral_utils.StftParams`, not the one of the :class:`audio_signal.AudioSignal` passed in.
+
+        Returns:
+            precision (str): Either ``'float32'`` or ``'float64'``.
+
+        Raises:
+            ValueError if set to an unknown precision.
+
+        """
+        return self.stft_params.precision
+
+    @precision.setter
+    def precision(self, value):
+        self.audio_signal.stft_params.precision = value
+
+    @property
+    def _float_dtype(self):
+        return stft_utils.precision_dtypes(self.precision)[0]
+
     def zeros_mask(self, shape):
         """
         Creates a new zeros mask with this object's type
@@ -189,7 +226,7 @@ class MaskSeparationBase(separation_base.SeparationBase):
         if self.mask_type == self.BINARY_MASK:
             return masks.BinaryMask.zeros(shape)
         else:
-            return masks.SoftMask.zeros(shape)
+            return masks.SoftMask.zeros(shape, dtype=self._float_dtype)
 
     def ones_mask(self, shape):
         """
@@ -203,7 +240,7 @@ class MaskSeparationBase(separation_base.SeparationBase):
         if self.mask_type == self.BINARY_MASK:
             return masks.BinaryMask.ones(shape)
         else:
-            return masks.SoftMask.ones(shape)
+            return masks.SoftMask.ones(shape, dtype=self._float_dtype)
 
     def plot(self, output_name, **kwargs):
         """Plots relevant data for mask-based separation algorithm. Base class: Do not call directly!
@@ -269,7 +306,7 @@ class MaskSeparationBaseDecoder(separation_base.SeparationBaseDecoder):
                     separator.__dict__[k] = utils.json_numpy_obj_hook(v[constants.NUMPY_JSON_KEY])
                     
                 # TODO: test this in python3
-                elif isinstance(v, (str, bytes, unicode)) and audio_signal.__name__ in v:
+                elif isinstance(v, (str, bytes, six.text_type)) and audio_signal.__name__ in v:
 
                     separator.__dict__[k] = audio_signal.AudioSignal.from_json(v)
                 elif k == 'result_masks':
@@ -277,7 +314,7 @@ class MaskSeparationBaseDecoder(separation_base.SeparationBaseDecoder):
 
                     separator.result_masks = [masks.MaskBase.from_json(itm) for itm in v]
                 else:
-                    separator.__dict__[k] = v if not isinstance(v, unicode) else v.encode('ascii')
+                    separator.__dict__[k] = v if not isinstance(v, six.text_type) else str(v)
 
             return separator
         else:
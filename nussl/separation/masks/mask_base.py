@@ -169,28 +169,30 @@ class MaskBase(object):
         raise NotImplementedError('Cannot call base class! Use BinaryMask or SoftMask!')
 
     @classmethod
-    def ones(cls, shape):
+    def ones(cls, shape, dtype=float):
         """
         Makes a mask with all ones with the specified shape. Exactly the same as ``np.ones()``.
         Args:
             shape (tuple): Shape of the resultant mask.
+            dtype (:obj:`np.dtype`): Data type of the mask. Defaults to ``float``.
 
         Returns:
 
         """
-        return cls(np.ones(shape))
+        return cls(np.ones(shape, dtype=dtype))
 
     @classmethod
-    def zeros(cls, shape):
+    def zeros(cls, shape, dtype=float):
         """
         Makes a mask with all zeros with the specified shape. Exactly the same as ``np.zeros()``.
         Args:
             shape (tuple): Shape of the resultant mask.
+            dtype (:obj:`np.dtype`): Data type of the mask. Defaults to ``float``.
 
         Returns:
 
         """
-        return cls(np.zeros(shape))
+        return cls(np.zeros(shape, dtype=dtype))
 
     def invert_mask(self):
         """
@@ -237,6 +239,8 @@ class MaskBase(object):
 
     @staticmethod
     def _to_json_helper(o):
+        if isinstance(o, np.generic):
+            return o.item()
         if not isinstance(o, MaskBase):
             raise TypeError('MaskBase._to_json_helper() got foreign object!')
 
@@ -270,6 +274,36 @@ class MaskBase(object):
         mask_decoder = MaskBaseDecoder(cls)
         return mask_decoder.decode(json_string)
 
+    def save(self, output_file_path):
+        """ Saves this mask to a binary file, with the same data as :func:`to_json`, but with the mask written as raw
+        bytes instead of base64 encoded. See :func:`utils.save_binary` for the file format.
+
+        Args:
+            output_file_path (str): Path to the output file.
+
+        See Also:
+            :func:`load` to restore a saved mask.
+
+        """
+        utils.save_binary(output_file_path, self.to_json)
+
+    @classmethod
+    def load(cls, input_file_path):
+        """ Creates a new :class:`MaskBase` object from a file made by :func:`save`. The mask is memory mapped, so it
+        is only read from the file when it is used.
+
+        Args:
+            input_file_path (str): Path to a file made by :func:`save`.
+
+        Returns:
+            (:class:`MaskBase`) A new :class:`MaskBase` object, as it was when it was saved.
+
+        See Also:
+            :func:`save` to save a mask.
+
+        """
+        return utils.load_binary(input_file_path, cls.from_json)
+
     def __add__(self, other):
         return self._add(other)
 
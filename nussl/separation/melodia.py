@@ -27,16 +27,18 @@ class Melodia(mask_separation_base.MaskSeparationBase):
         do_mono: (Optional) (bool) Flattens AudioSignal to mono before running the algorithm (does not effect the
                         input AudioSignal object)
         use_librosa_stft: (Optional) (bool) Calls librosa's stft function instead of nussl's
+        precision: (Optional) (str) ``'float32'`` or ``'float64'``. See :attr:`MaskSeparationBase.precision`.
 
     """
 
     def __init__(self, input_audio_signal, high_pass_cutoff=None, minimum_frequency=55.0,
                  maximum_frequency=1760.0, voicing_tolerance=0.5, minimum_peak_salience=0.0,
                  do_mono=False, use_librosa_stft=constants.USE_LIBROSA_STFT,
-                 mask_type=constants.SOFT_MASK, mask_threshold=0.5):
+                 mask_type=constants.SOFT_MASK, mask_threshold=0.5, precision=None):
 
         super(Melodia, self).__init__(input_audio_signal=input_audio_signal, 
-                                      mask_type=mask_type, mask_threshold=mask_threshold)
+                                      mask_type=mask_type, mask_threshold=mask_threshold,
+                                      precision=precision)
         self.high_pass_cutoff = 100.0 if high_pass_cutoff is None else float(high_pass_cutoff)
         self.background = None
         self.foreground = None
@@ -146,7 +148,7 @@ class Melodia(mask_separation_base.MaskSeparationBase):
         # F0 sequence overtones are at different weights.
         normalized_melody_stft = normalized_melody_stft > 1e-2
         normalized_melody_stft = normalized_melody_stft.astype(float)
-        mask = np.empty(self.audio_signal.stft().shape)
+        mask = np.empty(self.audio_signal.stft().shape, dtype=self._float_dtype)
 
         # Smoothing the mask row-wise using a low-pass filter to
         # get rid of discontuinities in the mask.
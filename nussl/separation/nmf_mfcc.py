@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import copy
 
 import numpy as np
 import sklearn.cluster
@@ -51,6 +50,21 @@ class NMF_MFCC(mask_separation_base.MaskSeparationBase):
             mfcc_range (int,list,tuple): The range of MFCCs used for clustering. See examples below.
              Defaults to ``1:14``.
             n_mfcc (int): The max number of mfccs to use. Defaults to 20.
+            relative_tolerance (float): If not ``None``, NMF stops before ``num_iterations`` once the relative
+             improvement of its reconstruction error stays below this value for ``patience`` iterations.
+             See :class:`TransformerNMF`. Default is ``None``.
+            patience (int): Number of iterations without enough improvement before NMF stops. Defaults to 1.
+            max_time (float): Wall-clock budget in seconds for NMF on each channel. Default is ``None`` (no limit).
+            nmf_batch_size (int): If not ``None``, use mini-batch NMF over blocks of this many STFT frames, so
+             that NMF memory use does not grow with the length of the signal. See :class:`TransformerNMF`.
+             Default is ``None``.
+            nmf_num_restarts (int): Number of random initializations of NMF to try on each channel. The one with the
+             lowest reconstruction error is used. The initializations are derived from ``random_seed``, so results
+             are reproducible. Defaults to 1.
+            nmf_num_jobs (int): Number of processes used to run the NMF restarts. ``None`` uses one per CPU.
+             Defaults to 1.
+            precision (str): ``'float32'`` or ``'float64'``. See :attr:`MaskSeparationBase.precision`.
+             Default is ``None`` (the precision of ``input_audio_signal``).
 
         Attributes:
             input_audio_signal (:class:`audio_signal.AudioSignal`): The :class:`audio_signal.AudioSignal` object that
@@ -102,8 +116,11 @@ class NMF_MFCC(mask_separation_base.MaskSeparationBase):
         """
     def __init__(self, input_audio_signal, num_sources, num_templates=50, num_iterations=50, random_seed=None,
                  distance_measure=transformer_nmf.TransformerNMF.EUCLIDEAN, kmeans_kwargs=None, to_mono=False,
-                 mask_type=mask_separation_base.MaskSeparationBase.BINARY_MASK, mfcc_range=(1, 14), n_mfcc=20):
-        super(NMF_MFCC, self).__init__(input_audio_signal=input_audio_signal, mask_type=mask_type)
+                 mask_type=mask_separation_base.MaskSeparationBase.BINARY_MASK, mfcc_range=(1, 14), n_mfcc=20,
+                 relative_tolerance=None, patience=1, max_time=None, nmf_batch_size=None,
+                 nmf_num_restarts=1, nmf_num_jobs=1, precision=None):
+        super(NMF_MFCC, self).__init__(input_audio_signal=input_audio_signal, mask_type=mask_type,
+                                       precision=precision)
 
         self.num_sources = num_sources
         self.num_templates = num_templates
@@ -112,6 +129,12 @@ class NMF_MFCC(mask_separation_base.MaskSeparationBase):
         self.random_seed = random_seed
         self.kmeans_kwargs = kmeans_kwargs
         self.n_mfcc = n_mfcc
+        self.relative_tolerance = relative_tolerance
+        self.patience = patience
+        self.max_time = max_time
+        self.nmf_batch_size = nmf_batch_size
+        self.nmf_num_restarts = nmf_num_restarts
+        self.nmf_num_jobs = nmf_num_jobs
 
         self.signal_stft = None
         self.labeled_templates = None
@@ -178,11 +201,17 @@ class NMF_MFCC(mask_separation_base.MaskSeparationBase):
         for ch in range(n_chan):
             channel_stft = self.audio_signal.get_magnitude_spectrogram_channel(ch)
 
-            # Set up NMF and run
+            # Set up NMF and run. The reconstruction error is only needed to check for convergence
+            error_interval = None if self.relative_tolerance is None else 1
             nmf = transformer_nmf.TransformerNMF(input_matrix=channel_stft, num_components=self.num_templates,
                                                  seed=self.random_seed, should_do_epsilon=False,
                                                  max_num_iterations=self.num_iterations,
-                                                 distance_measure=self.distance_measure)
+                                                 distance_measure=self.distance_measure,
+                                                 reconstruction_error_interval=error_interval,
+                                                 relative_tolerance=self.relative_tolerance, patience=self.patience,
+                                                 max_time=self.max_time, batch_size=self.nmf_batch_size,
+                                                 update_in_place=True, num_restarts=self.nmf_num_restarts,
+                                                 num_jobs=self.nmf_num_jobs)
 
             channel_activation_matrix, channel_templates_matrix = nmf.transform()
 
@@ -260,8 +289,7 @@ class NMF_MFCC(mask_separation_base.MaskSeparationBase):
         self.sources = []
         for mask in self.result_masks:
 
-            source = copy.deepcopy(self.audio_signal)
-            source = source.apply_mask(mask)
+            source = self.audio_signal.apply_mask(mask)
             source.stft_params = self.stft_params
             source.istft(overwrite=True, truncate_to_length=self.audio_signal.signal_length)
             self.sources.append(source)
@@ -3,6 +3,10 @@
 
 from __future__ import division
 
+import copy
+import multiprocessing
+import multiprocessing.pool
+import threading
 import warnings
 
 import numpy as np
@@ -34,6 +38,11 @@ class OverlapAdd(separation_base.SeparationBase):
         overlap_window_type:
         do_mono:
         use_librosa_stft:
+        num_jobs (int): Number of workers that segments are separated on in parallel. Each worker has its own copy
+            of :attr:`separation_instance`. If ``None``, uses one per CPU. Defaults to 1 (serial).
+        use_threads (bool): If ``True``, the workers are threads instead of processes. The separation instance of
+            every thread shares the (read-only) data of the signal instead of copying it, but threads only run in
+            parallel where numpy releases the GIL.
 
     Example:
 
@@ -51,11 +60,17 @@ class OverlapAdd(separation_base.SeparationBase):
     """
     def __init__(self, input_audio_signal, separation_method,
                  overlap_window_size=24, overlap_hop_size=12, overlap_window_type=constants.WINDOW_TRIANGULAR,
-                 do_mono=False, use_librosa_stft=constants.USE_LIBROSA_STFT):
+                 do_mono=False, use_librosa_stft=constants.USE_LIBROSA_STFT, num_jobs=1, use_threads=False):
         super(OverlapAdd, self).__init__(input_audio_signal=input_audio_signal)
         self.background = None
         self.foreground = None
 
+        if num_jobs is not None and num_jobs < 1:
+            raise ValueError('num_jobs must be None or at least 1!')
+
+        self.num_jobs = num_jobs
+        self.use_threads = use_threads
+
         self.use_librosa_stft = use_librosa_stft
         self.overlap_window_size = overlap_window_size
         self.overlap_hop_size = overlap_hop_size
@@ -230,28 +245,29 @@ class OverlapAdd(separation_base.SeparationBase):
         window = stft_utils.make_window(self.overlap_window_type, 2 * self.overlap_samples)
         window = np.vstack([window for _ in range(self.audio_signal.num_channels)])
 
-        # Main overlap-add loop
+        # Work out the region and the window of every segment first, so segments can be run in any order
+        segments = []
         for start, end in self._next_window():
 
             if start == 0:
                 # First window is a partial window
-                first_window = window[:, -self.hop_samples:]
-                unwindowed = self._set_active_region_and_run(start, self.hop_samples)
-                background_array[:, :self.hop_samples] = np.multiply(unwindowed.audio_data, first_window)
+                segments.append((start, self.hop_samples, window[:, -self.hop_samples:]))
 
             elif end >= self.audio_signal.signal_length:
                 # Last window is a partial window
                 remaining = self.audio_signal.signal_length - start
-                last_window = window[:, remaining:] if remaining != window.shape[-1] else window
+                last_window = np.copy(window[:, remaining:] if remaining != window.shape[-1] else window)
                 last_window[:, self.overlap_samples:] = 1  # only do part of the window
-
-                unwindowed = self._set_active_region_and_run(start, self.audio_signal.signal_length)
-                background_array[:, start:] += np.multiply(unwindowed.audio_data, last_window)
+                segments.append((start, self.audio_signal.signal_length, last_window))
 
             else:
                 # middle cases are straight forward
-                unwindowed = self._set_active_region_and_run(start, end)
-                background_array[:, start:end] += np.multiply(unwindowed.audio_data, window)
+                segments.append((start, end, window))
+
+        # Main overlap-add loop
+        regions = [(start, end) for start, end, _ in segments]
+        for (start, end, segment_window), unwindowed in zip(segments, self._run_segments(regions)):
+            background_array[:, start:end] += np.multiply(unwindowed, segment_window)
 
         self.audio_signal.set_active_region_to_default()
         self.background = self.audio_signal.make_copy_with_audio_data(background_array, verbose=False)
@@ -274,12 +290,39 @@ class OverlapAdd(separation_base.SeparationBase):
 
             yield start, end
 
-    def _set_active_region_and_run(self, start, end):
-        self._separation_instance.audio_signal.set_active_region(start, end)
-        self._separation_instance.run()
-        bkgnd, _ = self._separation_instance.make_audio_signals()
-        return bkgnd
+    def _run_segments(self, regions):
+        """
+        Generator that runs the separation method on every ``(start, end)`` region, serially or on a pool of
+        workers, and yields the unwindowed background audio data of each region in order.
+        """
+        initial_state = _snapshot_state(self._separation_instance)
 
+        if self.num_jobs == 1:
+            for start, end in regions:
+                yield self._run_region(self._separation_instance, initial_state, start, end)
+            return
+
+        if self.use_threads:
+            pool = multiprocessing.pool.ThreadPool(self.num_jobs, _init_overlap_add_worker,
+                                                   (self._separation_instance, True))
+        else:
+            pool = multiprocessing.Pool(self.num_jobs, _init_overlap_add_worker, (self._separation_instance, False))
+
+        try:
+            for unwindowed in pool.imap(_run_overlap_add_segment, regions):
+                yield unwindowed
+        finally:
+            pool.close()
+            pool.join()
+
+    @staticmethod
+    def _run_region(separation_instance, initial_state, start, end):
+        # every segment starts from the same settings, even if run() changes some of them in place
+        separation_instance.__dict__.update(_snapshot_state(initial_state))
+        separation_instance.audio_signal.set_active_region(start, end)
+        separation_instance.run()
+        bkgnd, _ = separation_instance.make_audio_signals()
+        return bkgnd.audio_data
 
     def make_audio_signals(self):
         """ Returns the background and foreground audio signals. You must have run :func:`run()` prior
@@ -300,3 +343,55 @@ class OverlapAdd(separation_base.SeparationBase):
         foreground_array = self.audio_signal.audio_data - self.background.audio_data
         self.foreground = self.audio_signal.make_copy_with_audio_data(foreground_array)
         return [self.background, self.foreground]
+
+
+_worker_state = threading.local()
+
+
+def _snapshot_state(state):
+    """
+    Makes a shallow copy of every attribute of a separation instance (or of a dict of its attributes), so that
+    changing an attribute in place never changes the snapshot. Arrays inside an attribute (e.g., the data of
+    :attr:`audio_signal`) are not copied.
+    """
+    if not isinstance(state, dict):
+        state = state.__dict__
+    return {name: copy.copy(value) for name, value in state.items()}
+
+
+def _copy_sharing_signal(separation_instance):
+    """
+    Deep copies a separation instance, except for the data arrays of its :attr:`audio_signal`, which are
+    read-only views, so the copy shares them instead.
+    """
+    signal = separation_instance.audio_signal
+    # deepcopy() looks up every object in the memo first, so the arrays are "copied" as themselves
+    memo = {id(signal._audio_data): signal._audio_data, id(signal._stft_data): signal._stft_data,
+            id(signal._converted_audio_data): signal._converted_audio_data}
+    return copy.deepcopy(separation_instance, memo)
+
+
+def _init_overlap_add_worker(separation_instance, copy_instance):
+    """
+    Gives an :class:`OverlapAdd` worker its own separation instance. Worker processes already get their own copy
+    when the instance is sent to them; worker threads need an explicit copy, which shares the signal data.
+    """
+    if copy_instance:
+        separation_instance = _copy_sharing_signal(separation_instance)
+    _worker_state.separation_instance = separation_instance
+    _worker_state.initial_state = _snapshot_state(separation_instance)
+
+
+def _run_overlap_add_segment(region):
+    """
+    Runs one :class:`OverlapAdd` segment on this worker's separation instance. This is a module-level function so
+    that it can be sent to worker processes.
+
+    Args:
+        region (tuple): ``(start, end)`` sample indices of the segment.
+
+    Returns:
+        (:obj:`np.ndarray`) The unwindowed background audio data of the segment.
+    """
+    start, end = region
+    return OverlapAdd._run_region(_worker_state.separation_instance, _worker_state.initial_state, start, end)
@@ -7,7 +7,6 @@ The original REpeating Pattern Extraction Technique (REPET).
 
 import numpy as np
 import scipy.fftpack as scifft
-import scipy.spatial.distance
 
 from nussl.separation import mask_separation_base
 from nussl.separation import masks
@@ -46,6 +45,7 @@ class Repet(mask_separation_base.MaskSeparationBase):
         matlab_fidelity (bool, optional): If True, does repet with the same settings as the original MATLAB
                         implementation of REPET, warts and all. This will override ``use_librosa_stft`` and set
                         it to ``False``.
+        precision (str, optional): ``'float32'`` or ``'float64'``, see :attr:`MaskSeparationBase.precision`.
 
     Examples:
         
@@ -65,9 +65,9 @@ class Repet(mask_separation_base.MaskSeparationBase):
     def __init__(self, input_audio_signal, min_period=None, max_period=None, period=None, high_pass_cutoff=100.0,
                  do_mono=False, use_find_period_complex=False,
                  use_librosa_stft=constants.USE_LIBROSA_STFT, matlab_fidelity=False,
-                 mask_type=mask_separation_base.MaskSeparationBase.SOFT_MASK, mask_threshold=0.5):
+                 mask_type=mask_separation_base.MaskSeparationBase.SOFT_MASK, mask_threshold=0.5, precision=None):
         super(Repet, self).__init__(input_audio_signal=input_audio_signal, mask_type=mask_type,
-                                    mask_threshold=mask_threshold)
+                                    mask_threshold=mask_threshold, precision=precision)
 
         # Check input parameters
         if (min_period or max_period) and period:
@@ -139,25 +139,15 @@ class Repet(mask_separation_base.MaskSeparationBase):
         self._compute_spectrograms()
         self.repeating_period = self._calculate_repeating_period()
 
-        # separate the mixture background by masking
-        background_stft = []
-        background_mask = []
-        for i in range(self.audio_signal.num_channels):
-            repeating_mask = self._compute_repeating_mask(self.magnitude_spectrogram[:, :, i])
-
-            repeating_mask[low:self.high_pass_cutoff, :] = 1  # high-pass filter the foreground
-            background_mask.append(repeating_mask)
-
-            # apply mask
-            stft_with_mask = repeating_mask * self.stft[:, :, i]
-            background_stft.append(stft_with_mask)
+        # separate the mixture background by masking, all channels share the median computation
+        background_mask = self._compute_repeating_mask(self.magnitude_spectrogram)
+        background_mask[low:self.high_pass_cutoff, :, :] = 1  # high-pass filter the foreground
 
         # make a new audio signal for the background
-        background_stft = np.array(background_stft).transpose((1, 2, 0))
+        background_stft = background_mask * self.stft
         self._make_background_signal(background_stft)
 
         # make a mask and return
-        background_mask = np.array(background_mask).transpose((1, 2, 0))
         background_mask = masks.SoftMask(background_mask)
         if self.mask_type == self.BINARY_MASK:
             background_mask = background_mask.mask_to_binary(self.mask_threshold)
@@ -294,6 +284,10 @@ class Repet(mask_separation_base.MaskSeparationBase):
     def find_repeating_period_complex(beat_spectrum):
         """ A more complicated approach to finding the repeating period. Use this by setting 
         :attr:`use_find_period_complex`
+
+        The auto-cosine (normalized autocorrelation) of the beat spectrum is computed via FFT in ``O(N log N)``.
+        The repeating period is the lag of the highest local maximum of the first half of the auto-cosine
+        that is at least as high as its neighboring extrema, not counting lag 0.
         
         Args:
             beat_spectrum (:obj:`np.array`): input beat spectrum array
@@ -305,71 +299,93 @@ class Repet(mask_separation_base.MaskSeparationBase):
             :func:`find_repeating_period_simple`
         
         """
-        auto_cosine = np.zeros((len(beat_spectrum), 1))
+        beat_spectrum = np.asarray(beat_spectrum, dtype=float).ravel()
+        n = len(beat_spectrum)
 
-        for i in range(0, len(beat_spectrum) - 1):
-            auto_cosine[i] = 1 - scipy.spatial.distance.cosine(beat_spectrum[0:len(beat_spectrum) - i],
-                                                               beat_spectrum[i:len(beat_spectrum)])
+        # dot products of the beat spectrum with itself at every lag, according to the Wiener-Khinchin theorem
+        n_fft = 2 ** int(np.ceil(np.log2(2 * n)))
+        spectrum = np.fft.rfft(beat_spectrum, n_fft)
+        autocorrelation = np.fft.irfft(np.abs(spectrum) ** 2, n_fft)[:n]
 
-        ac = auto_cosine[0:np.floor(auto_cosine.shape[0])/2]
-        auto_cosine = np.vstack([ac[1], ac, ac[-2]])
-        auto_cosine_diff = np.ediff1d(auto_cosine)
-        sign_changes = auto_cosine_diff[0:-1]*auto_cosine_diff[1:]
-        sign_changes = np.where(sign_changes < 0)[0]
+        # norms of the overlapping parts beat_spectrum[:n - lag] and beat_spectrum[lag:]
+        energy = np.concatenate([[0.0], np.cumsum(beat_spectrum ** 2)])
+        lags = np.arange(n)
+        norms = np.sqrt(energy[n - lags] * (energy[n] - energy[lags]))
 
-        extrema_values = ac[sign_changes]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            auto_cosine = np.where(norms > 0, autocorrelation / norms, 0.0)
 
-        e1 = np.insert(extrema_values, 0, extrema_values[0])
-        e2 = np.insert(extrema_values, -1, extrema_values[-1])
+        ac = auto_cosine[:n // 2]
+        if len(ac) < 3:
+            raise RuntimeError('Beat spectrum is too short to find a repeating period!')
 
-        extrema_neighbors = np.stack((e1[0:-1], e2[1:]))
+        # extrema are where the (mirror padded) derivative changes sign
+        auto_cosine_diff = np.diff(np.concatenate([ac[1:2], ac, ac[-2:-1]]))
+        extrema = np.flatnonzero(auto_cosine_diff[:-1] * auto_cosine_diff[1:] < 0)
+        extrema_values = ac[extrema]
 
-        m = np.amax(extrema_neighbors, axis=0)
-        extrema_values = extrema_values.flatten()
-        maxima = np.where(extrema_values >= m)[0]
-        maxima = zip(sign_changes[maxima], extrema_values[maxima])
-        maxima = maxima[1:]
-        maxima = sorted(maxima, key=lambda x: -x[1])
-        period = maxima[0][0]
+        # keep the extrema that are at least as high as both neighboring extrema
+        previous_values = np.concatenate([extrema_values[:1], extrema_values[:-1]])
+        next_values = np.concatenate([extrema_values[1:], extrema_values[-1:]])
+        is_maximum = extrema_values >= np.maximum(previous_values, next_values)
 
-        return period
+        # the first maximum is lag 0, which is thrown out
+        maxima = extrema[is_maximum][1:]
+        if len(maxima) == 0:
+            raise RuntimeError('Could not find a repeating period in the beat spectrum!')
+
+        period = maxima[np.argmax(ac[maxima])]
+
+        return int(period)
 
     def _compute_repeating_mask(self, magnitude_spectrogram_channel):
         """Computes the soft mask for the repeating part using the magnitude spectrogram and the repeating period
 
+        The repeating segment is the median over all repetitions of the period, computed once for all channels.
+        Period positions covered by the ragged tail have one more repetition than the rest, so the two groups
+        are median filtered separately instead of padding with NaNs.
+
         Parameters:
-            magnitude_spectrogram_channel (:obj:`np.array`): 2D matrix containing the magnitude spectrogram of a signal
-            
+            magnitude_spectrogram_channel (:obj:`np.array`): 2D matrix (Lf by Lt) or 3D tensor (Lf by Lt by Lc)
+                containing the magnitude spectrogram of a signal
+
         Returns:
-            (:obj:`np.array`): 2D matrix (Lf by Lt) containing the soft mask for the repeating part, elements of M 
-            take on values in ``[0, 1]``
+            (:obj:`np.array`): matrix of the same shape as the input containing the soft mask for the repeating part,
+            elements of M take on values in ``[0, 1]``
 
         """
+        magnitude_spectrogram = magnitude_spectrogram_channel
+        if magnitude_spectrogram.ndim == 2:
+            magnitude_spectrogram = magnitude_spectrogram[:, :, np.newaxis]
+
         # this +1 is a kluge to make this implementation match the original MATLAB implementation
         period = self.repeating_period + 1
-        freq_bins, time_bins = magnitude_spectrogram_channel.shape
+        freq_bins, time_bins, n_channels = magnitude_spectrogram.shape
         n_repetitions = int(np.ceil(float(time_bins) / period))
-        one_period = freq_bins * period
-
-        # Pad to make an integer number of repetitions. Pad with 'nan's to not affect the median.
-        remainder = (period * n_repetitions) % time_bins
-        mask_reshaped = np.hstack([magnitude_spectrogram_channel, float('nan') * np.zeros((freq_bins, remainder))])
+        n_full_repetitions = time_bins // period
+        tail_length = time_bins - n_full_repetitions * period
 
-        # reshape to take the median of each period
-        mask_reshaped = np.reshape(mask_reshaped.T, (n_repetitions, one_period))
+        # (Lf, n_full_repetitions, period, Lc) view of the whole repetitions
+        full_repetitions = magnitude_spectrogram[:, :n_full_repetitions * period, :].reshape(
+            (freq_bins, n_full_repetitions, period, n_channels))
+        tail = magnitude_spectrogram[:, n_full_repetitions * period:, :]
 
-        # take median of repeating periods before and after the padding
-        median_mask = np.nanmedian(mask_reshaped, axis=0)
+        repeating_segment = np.empty((freq_bins, period, n_channels), dtype=magnitude_spectrogram.dtype)
+        if tail_length > 0:
+            tail_repetitions = np.concatenate([full_repetitions[:, :, :tail_length, :], tail[:, np.newaxis, :, :]],
+                                              axis=1)
+            repeating_segment[:, :tail_length, :] = np.median(tail_repetitions, axis=1)
+        if n_full_repetitions > 0:
+            repeating_segment[:, tail_length:, :] = np.median(full_repetitions[:, :, tail_length:, :], axis=1)
 
-        # reshape to it's original shape
-        median_mask = np.reshape(np.tile(median_mask, (n_repetitions, 1)), (n_repetitions * period, freq_bins)).T
-        median_mask = median_mask[:, :time_bins]
+        # repeat the segment back to the original length
+        median_mask = np.tile(repeating_segment, (1, n_repetitions, 1))[:, :time_bins, :]
 
         # take minimum of computed mask and original input and scale
-        min_median_mask = np.minimum(median_mask, magnitude_spectrogram_channel)
-        mask = (min_median_mask + constants.EPSILON) / (magnitude_spectrogram_channel + constants.EPSILON)
+        min_median_mask = np.minimum(median_mask, magnitude_spectrogram)
+        mask = (min_median_mask + constants.EPSILON) / (magnitude_spectrogram + constants.EPSILON)
 
-        return mask
+        return mask.reshape(magnitude_spectrogram_channel.shape)
 
     def update_periods(self):
         """ Will update periods for use with :func:`find_repeating_period_simple`.
@@ -37,12 +37,17 @@ class RepetSim(mask_separation_base.MaskSeparationBase):
         :ref:`The RepetSim Demo Example <repet_sim_demo>`
     """
 
+    # Upper bounds on the number of elements held at once when searching for similar frames
+    # and when median filtering
+    _SIMILARITY_BLOCK_ELEMENTS = 2 ** 24
+    _MEDIAN_BLOCK_ELEMENTS = 2 ** 24
+
     def __init__(self, input_audio_signal, similarity_threshold=None, min_distance_between_frames=None,
                  max_repeating_frames=None, high_pass_cutoff=None, do_mono=False,
                  use_librosa_stft=constants.USE_LIBROSA_STFT, matlab_fidelity=False,
-                 mask_type=mask_separation_base.MaskSeparationBase.SOFT_MASK, mask_threshold=0.5):
+                 mask_type=mask_separation_base.MaskSeparationBase.SOFT_MASK, mask_threshold=0.5, precision=None):
         super(RepetSim, self).__init__(input_audio_signal=input_audio_signal, mask_type=mask_type,
-                                       mask_threshold=mask_threshold)
+                                       mask_threshold=mask_threshold, precision=precision)
 
         self.high_pass_cutoff = 100 if high_pass_cutoff is None else high_pass_cutoff
         self.similarity_threshold = 0 if similarity_threshold is None else similarity_threshold
@@ -86,23 +91,14 @@ class RepetSim(mask_separation_base.MaskSeparationBase):
         self._compute_spectrograms()
         self.similarity_indices = self._get_similarity_indices()
 
-        background_stft = []
-        background_mask = []
-        for i in range(self.audio_signal.num_channels):
-            repeating_mask = self._compute_mask(self.magnitude_spectrogram[:, :, i])
-
-            repeating_mask[low:self.high_pass_cutoff, :] = 1  # high-pass filter the foreground
-            background_mask.append(repeating_mask)
+        # all channels share the similarity indices, so they are median filtered together
+        background_mask = self._compute_mask(self.magnitude_spectrogram)
+        background_mask[low:self.high_pass_cutoff, :, :] = 1  # high-pass filter the foreground
+        background_stft = background_mask * self.stft
 
-            stft_with_mask = repeating_mask * self.stft[:, :, i]
-            background_stft.append(stft_with_mask)
-
-        # Set STFT in correct order
-        background_stft = np.array(background_stft).transpose((1, 2, 0))
         self._make_background_signal(background_stft)
 
         # make a mask and return
-        background_mask = np.array(background_mask).transpose((1, 2, 0))
         background_mask = masks.SoftMask(background_mask)
         if self.mask_type == self.BINARY_MASK:
             background_mask = background_mask.mask_to_binary(self.mask_threshold)
@@ -125,10 +121,10 @@ class RepetSim(mask_separation_base.MaskSeparationBase):
         if self.magnitude_spectrogram is None:
             self._compute_spectrograms()
 
-        self.similarity_matrix = self.get_similarity_matrix()
-
         if not self._min_distance_converted_to_hops:
-            self.min_distance_between_frames *= self.audio_signal.sample_rate / self.stft_params.window_overlap
+            self.min_distance_between_frames = int(self.min_distance_between_frames *
+                                                   (self.audio_signal.sample_rate /
+                                                    self.stft_params.window_overlap))
             self._min_distance_converted_to_hops = True
 
         return self._find_similarity_indices()
@@ -166,26 +162,69 @@ class RepetSim(mask_separation_base.MaskSeparationBase):
 
             return cosine
 
-    def _find_similarity_indices(self):
-        """Finds the similarity indices for all time frames from the similarity matrix
+    @staticmethod
+    def compute_similarity_indices(matrix, max_repeating_frames, min_distance_between_frames,
+                                   similarity_threshold, block_elements=None):
+        """Finds the most similar rows of every row of ``matrix`` by cosine similarity, without
+        forming the full similarity matrix.
 
+        Rows of the similarity matrix are computed a block at a time with one matrix product
+        against all (normalized) rows, and peaks are picked from all rows of a block at once
+        with :func:`utils.find_peak_indices_batch`. These are the same peaks that
+        :func:`utils.find_peak_indices` finds in each row of the full similarity matrix. Memory is
+        bounded by ``block_elements`` instead of growing with the square of the number of rows.
+
+        Parameters:
+            matrix (np.array): 2D matrix of shape ``(n_frames, n_features)``, e.g. the transposed
+                magnitude spectrogram of the audio signal
+            max_repeating_frames (int): maximum number of peaks picked per row (including the row
+                itself, which is thrown out)
+            min_distance_between_frames (int): minimum distance (in rows) between picked peaks
+            similarity_threshold (float): peaks below this (scaled) similarity are ignored
+            block_elements (int): upper bound on the number of similarities held in memory at once.
+                Defaults to ``RepetSim._SIMILARITY_BLOCK_ELEMENTS``
         Returns:
-            similarity_indices (list of lists): similarity indices for all time frames
+            similarity_indices (list of lists): similarity indices for all rows
         """
-        if self.similarity_matrix is None:
-            raise Exception('self.similarity_matrix cannot be None')
+        block_elements = RepetSim._SIMILARITY_BLOCK_ELEMENTS if block_elements is None else block_elements
+        n_frames = matrix.shape[0]
+
+        # ignore the 'divide by zero' warning
+        with np.errstate(divide='ignore'):
+            # inverse_mask of the magnitude, zero (instead of inf) for empty rows
+            inv_mag = 1 / np.sqrt(np.einsum('ij,ij->i', matrix, matrix))
+            inv_mag[np.isinf(inv_mag)] = 0
+        normalized_matrix = matrix * inv_mag[:, np.newaxis]
 
         similarity_indices = []
-        for i in range(self.audio_signal.stft_length):
-            cur_indices = utils.find_peak_indices(self.similarity_matrix[i, :], self.max_repeating_frames,
-                                                  min_dist=self.min_distance_between_frames,
-                                                  threshold=self.similarity_threshold)
+        block_size = max(1, block_elements // n_frames)
+        for start in range(0, n_frames, block_size):
+            similarity_block = np.dot(normalized_matrix[start:start + block_size], normalized_matrix.T)
+
+            peak_indices, n_found = utils.find_peak_indices_batch(similarity_block, max_repeating_frames,
+                                                                  min_dist=min_distance_between_frames,
+                                                                  threshold=similarity_threshold)
 
             # the first peak is always itself so we throw it out
-            # we also want only self.max_repeating_frames peaks
-            # so +1 for 0-based, and +1 for the first peak we threw out
-            cur_indices = cur_indices[1:self.max_repeating_frames + 2]
-            similarity_indices.append(cur_indices)
+            similarity_indices.extend(row[1:n].tolist() for row, n in zip(peak_indices, n_found))
+
+        return similarity_indices
+
+    def _find_similarity_indices(self):
+        """Finds the similarity indices for all time frames, a block of rows of the similarity
+        matrix at a time.
+
+        Returns:
+            similarity_indices (list of lists): similarity indices for all time frames
+        """
+        if self.magnitude_spectrogram is None:
+            self._compute_spectrograms()
+
+        mean_magnitude_spectrogram = np.mean(self.magnitude_spectrogram, axis=2)
+        similarity_indices = self.compute_similarity_indices(mean_magnitude_spectrogram.T,
+                                                             self.max_repeating_frames,
+                                                             self.min_distance_between_frames,
+                                                             self.similarity_threshold)
 
         if all(not idx for idx in similarity_indices):
             raise RuntimeError('No similarity indices!')
@@ -195,34 +234,55 @@ class RepetSim(mask_separation_base.MaskSeparationBase):
 
         return similarity_indices
 
-    def _compute_mask(self, magnitude_spectrogram_channel):
+    def _similarity_index_matrix(self):
+        """Packs ``self.similarity_indices`` into a padded index matrix.
+
+        Returns:
+            (tuple): ``(indices, counts)`` where ``indices`` is an int array of shape
+            ``(stft_length, max_similar)`` holding the similar frames of every frame (rows are
+            padded with 0 past their count) and ``counts`` is the number of valid entries per row.
         """
+        counts = np.array([len(idx) for idx in self.similarity_indices], dtype=int)
+        indices = np.zeros((len(counts), max(np.max(counts), 1)), dtype=int)
+        valid = np.arange(indices.shape[1]) < counts[:, np.newaxis]
+        indices[valid] = np.concatenate([np.asarray(idx, dtype=int) for idx in self.similarity_indices])
+        return indices, counts
+
+    def _compute_mask(self, magnitude_spectrogram_channel):
+        """Median filters every frame of the magnitude spectrogram over its similar frames.
+
+        The similar frames are gathered for a block of frames at a time with one fancy-index op
+        and reduced with a single median along the neighbor axis. Frames are grouped by their
+        number of similar frames so no NaN padding is needed.
 
         Args:
-            magnitude_spectrogram_channel:
+            magnitude_spectrogram_channel (np.array): magnitude spectrogram of shape
+                ``(n_freq, n_frames)`` or ``(n_freq, n_frames, n_channels)``.
 
         Returns:
-
+            (np.array): soft repeating mask with the same shape as the input.
         """
         if self.magnitude_spectrogram is None:
             self._compute_spectrograms()
 
         if self.similarity_indices is None:
-            self._get_similarity_indices()
+            self.similarity_indices = self._get_similarity_indices()
 
-        mask = np.zeros_like(magnitude_spectrogram_channel)
+        indices, counts = self._similarity_index_matrix()
 
-        for i in range(self.audio_signal.stft_length):
-            cur_similarities = self.similarity_indices[i]
+        # If there are no similarities, then just add ones to the mask here.
+        mask = np.ones_like(magnitude_spectrogram_channel)
 
-            if not cur_similarities:
-                # If there are no similarities, then just add ones to the mask here.
-                mask[:, i] = np.ones(mask.shape[constants.STFT_VERT_INDEX])
-            else:
-                similar_times = np.array([magnitude_spectrogram_channel[:, j]
-                                          for j in cur_similarities])
+        # bound the size of the gathered (n_freq, block, max_similar, ...) tensor
+        frame_size = magnitude_spectrogram_channel.size // magnitude_spectrogram_channel.shape[1]
+        block_size = max(1, self._MEDIAN_BLOCK_ELEMENTS // (frame_size * indices.shape[1]))
 
-                mask[:, i] = np.median(similar_times, axis=0)
+        for start in range(0, len(counts), block_size):
+            block_counts = counts[start:start + block_size]
+            for count in np.unique(block_counts[block_counts > 0]):
+                frames = start + np.flatnonzero(block_counts == count)
+                similar_times = np.take(magnitude_spectrogram_channel, indices[frames, :count], axis=1)
+                mask[:, frames] = np.median(similar_times, axis=2)
 
         mask = np.minimum(mask, magnitude_spectrogram_channel)
         mask = (mask + constants.EPSILON) / (magnitude_spectrogram_channel + constants.EPSILON)
@@ -27,13 +27,15 @@ class RPCA(mask_separation_base.MaskSeparationBase):
         do_mono: (Optional) (bool) Flattens AudioSignal to mono before running the algorithm (does not effect the
                         input AudioSignal object)
         use_librosa_stft: (Optional) (bool) Calls librosa's stft function instead of nussl's
+        precision: (Optional) (str) ``'float32'`` or ``'float64'``. See :attr:`MaskSeparationBase.precision`.
 
     """
 
     def __init__(self, input_audio_signal, high_pass_cutoff=None, num_iterations=None, epsilon=None,
                  do_mono=False, verbose=False, use_librosa_stft=constants.USE_LIBROSA_STFT,
-                 mask_type=mask_separation_base.MaskSeparationBase.SOFT_MASK, mask_threshold=0.5):
-        super(RPCA, self).__init__(input_audio_signal=input_audio_signal, mask_type=mask_type)
+                 mask_type=mask_separation_base.MaskSeparationBase.SOFT_MASK, mask_threshold=0.5, precision=None):
+        super(RPCA, self).__init__(input_audio_signal=input_audio_signal, mask_type=mask_type,
+                                   precision=precision)
         self.high_pass_cutoff = 100.0 if high_pass_cutoff is None else float(high_pass_cutoff)
         self.use_librosa_stft = use_librosa_stft
 
@@ -90,7 +92,7 @@ class RPCA(mask_separation_base.MaskSeparationBase):
                               overwrite=True, use_librosa=self.use_librosa_stft,
                               truncate_to_length=self.audio_signal.signal_length)
 
-        background_mask = np.array(background_mask).transpose((1, 2, 0)).astype('float')
+        background_mask = np.array(background_mask).transpose((1, 2, 0)).astype(self._float_dtype)
         background_mask = masks.SoftMask(background_mask)
         if self.mask_type == self.BINARY_MASK:
             background_mask = background_mask.mask_to_binary(self.mask_threshold)
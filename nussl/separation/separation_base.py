@@ -7,6 +7,7 @@ import json
 import warnings
 
 import numpy as np
+import six
 
 from ..core import utils
 from ..core import audio_signal
@@ -21,7 +22,7 @@ class SeparationBase(object):
 
     Parameters:
         input_audio_signal (:class:`audio_signal.AudioSignal`). :class:`audio_signal.AudioSignal` object.
-                            This will always make a copy of the provided AudioSignal object.
+                            This will always make a view of the provided AudioSignal object.
     """
 
     def __init__(self, input_audio_signal):
@@ -58,14 +59,15 @@ class SeparationBase(object):
 
     @property
     def audio_signal(self):
-        """(:class:`audio_signal.AudioSignal`): Copy of the :class:`audio_signal.AudioSignal` object passed in 
-        upon initialization.
+        """(:class:`audio_signal.AudioSignal`): View of the :class:`audio_signal.AudioSignal` object passed in
+        upon initialization (see :func:`audio_signal.AudioSignal.make_view`). It shares the data of the input signal
+        without copying it, and changing it never changes the input signal.
         """
         return self._audio_signal
 
     @audio_signal.setter
     def audio_signal(self, input_audio_signal):
-        self._audio_signal = copy.copy(input_audio_signal)
+        self._audio_signal = input_audio_signal.make_view()
 
     def plot(self, output_name, **kwargs):
         """Plots relevant data for separation algorithm
@@ -91,6 +93,17 @@ class SeparationBase(object):
         """
         raise NotImplementedError('Cannot call base class.')
 
+    def write_audio_signals(self, output_file_paths, **kwargs):
+        """Writes every :class:`audio_signal.AudioSignal` object from :func:`make_audio_signals` to a file, in one
+        call. See :func:`audio_signal.AudioSignal.write_audio_signals`.
+
+        Args:
+            output_file_paths (list): One filename per source returned by :func:`make_audio_signals`.
+            kwargs: Keyword arguments for :func:`audio_signal.AudioSignal.write_audio_to_file`, e.g.
+                ``sample_format`` or ``normalize``.
+        """
+        AudioSignal.write_audio_signals(self.make_audio_signals(), output_file_paths, **kwargs)
+
     def to_json(self):
         """
         Outputs JSON from the data stored in this object.
@@ -110,6 +123,8 @@ class SeparationBase(object):
 
     @staticmethod
     def _to_json_helper(o):
+        if isinstance(o, np.generic):
+            return o.item()
         if not isinstance(o, SeparationBase):
             raise TypeError('SeparationBase._to_json_helper() got foreign object!')
 
@@ -154,6 +169,38 @@ class SeparationBase(object):
         sep_decoder = SeparationBaseDecoder(cls)
         return sep_decoder.decode(json_string)
 
+    def save(self, output_file_path):
+        """
+        Saves this object to a binary file, with the same data as :func:`to_json`, but with every array written as
+        raw bytes instead of base64 encoded. See :func:`utils.save_binary` for the file format.
+
+        Args:
+            output_file_path (str): Path to the output file.
+
+        See Also:
+            :func:`load` to restore a saved object.
+
+        """
+        utils.save_binary(output_file_path, self.to_json)
+
+    @classmethod
+    def load(cls, input_file_path):
+        """
+        Creates a new :class:`SeparationBase` object from a file made by :func:`save`. The arrays are memory mapped,
+        so they are only read from the file when they are used.
+
+        Args:
+            input_file_path (str): Path to a file made by :func:`save`.
+
+        Returns:
+            (:class:`SeparationBase`) A new :class:`SeparationBase` object, as it was when it was saved.
+
+        See Also:
+            :func:`save` to save an object.
+
+        """
+        return utils.load_binary(input_file_path, cls.from_json)
+
     def __call__(self):
         return self.run()
 
@@ -204,11 +251,12 @@ class SeparationBaseDecoder(json.JSONDecoder):
         signal = AudioSignal.from_json(signal_json)
 
         # get the rest of the required arguments
-        signature = inspect.getargspec(class_.__init__)
+        get_arg_spec = inspect.getfullargspec if six.PY3 else inspect.getargspec
+        signature = get_arg_spec(class_.__init__)
         # first arg is covered above (2), and we don't want the non-defaults (-len(signature.defaults))
         non_required_args = 0 if signature.defaults is None else len(signature.defaults)
         required_args = signature.args[2:-non_required_args]
-        args = dict((k.encode('ascii'), json_dict[k]) for k in required_args)
+        args = dict((str(k), json_dict[k]) for k in required_args)
 
         # make a new instance of separation class
         separator = class_(signal, **args)
@@ -238,7 +286,7 @@ class SeparationBaseDecoder(json.JSONDecoder):
                 elif isinstance(v, (str, bytes)) and audio_signal.__name__ in v:  # TODO: test this
                     separator.__dict__[k] = AudioSignal.from_json(v)
                 else:
-                    separator.__dict__[k] = v if not isinstance(v, unicode) else v.encode('ascii')
+                    separator.__dict__[k] = v if not isinstance(v, six.text_type) else str(v)
 
             return separator
         else:
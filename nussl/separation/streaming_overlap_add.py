@@ -0,0 +1,291 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Block-streaming overlap/add with any separation algorithm in nussl.
+"""
+
+from __future__ import division
+
+import inspect
+
+import numpy as np
+import scipy.io.wavfile as wav
+
+from nussl.separation import separation_base
+from ..core import audio_signal
+from ..core import constants
+from ..core import stft_utils
+from ..core.audio_signal import AudioSignal
+
+
+class StreamingOverlapAdd(object):
+    """
+    Runs any :class:`SeparationBase`-derived separation algorithm over a stream of audio, one overlapping window at a
+    time, and crossfades every source that the algorithm returns from :func:`make_audio_signals`.
+
+    Unlike :class:`OverlapAdd`, this never needs the whole signal. Audio goes in block by block with
+    :func:`process_block` (or from an iterator with :func:`process_stream`, or a WAV file with
+    :func:`process_file`), and each source comes out block by block as soon as no later window overlaps it. Only
+    about one window of input and one window per source are held in memory, no matter how long the stream is.
+
+    Each window is separated by a new instance of ``separation_method``. Windowed sources are overlap-added and
+    divided by the overlap-added window, so the crossfade is exact for any window type and hop, including the
+    partial windows at the start and end of the stream. (Samples where every overlapping window is zero, like the
+    very first sample with a Hann window, come out as zeros.)
+
+    Parameters:
+        separation_method (type): A :class:`SeparationBase`-derived class, e.g. ``nussl.Repet``.
+        sample_rate (int): sample rate of the stream.
+        num_channels (int, optional): number of channels of the stream. Defaults to 1.
+        overlap_window_size (float, optional): length of each window in seconds.
+        overlap_hop_size (float, optional): hop between windows in seconds.
+        overlap_window_type (str, optional): window type used for the crossfade.
+        separation_kwargs (dict, optional): keyword arguments passed to ``separation_method`` for every window.
+
+    Attributes:
+        num_sources (int): Number of sources returned by ``separation_method``. ``None`` until the first window
+            has been separated.
+
+    Example:
+
+    .. code-block:: python
+        :linenos:
+
+        ola = nussl.StreamingOverlapAdd(nussl.Repet, sample_rate=44100, num_channels=2)
+
+        # from a WAV file to one WAV file per source, in constant memory
+        ola.process_file('path/to/long_input.wav', ['background.wav', 'foreground.wav'])
+
+        # or from any iterator of (num_channels, n_samples) blocks
+        for background, foreground in ola.process_stream(blocks):
+            ...
+
+    """
+    def __init__(self, separation_method, sample_rate, num_channels=1, overlap_window_size=24, overlap_hop_size=12,
+                 overlap_window_type=constants.WINDOW_TRIANGULAR, separation_kwargs=None):
+        if not inspect.isclass(separation_method) or \
+                not issubclass(separation_method, separation_base.SeparationBase):
+            raise ValueError('Invalid separation method for StreamingOverlapAdd! Got {}, but it must be a '
+                             'SeparationBase-derived class.'.format(separation_method))
+
+        self.separation_method = separation_method
+        self.separation_kwargs = {} if separation_kwargs is None else dict(separation_kwargs)
+        self.sample_rate = int(sample_rate)
+        self.num_channels = int(num_channels)
+
+        self.overlap_window_size = overlap_window_size
+        self.overlap_hop_size = overlap_hop_size
+        self.overlap_window_type = overlap_window_type
+        self.window_samples = int(np.round(self.sample_rate * self.overlap_window_size))
+        self.hop_samples = int(np.round(self.sample_rate * self.overlap_hop_size))
+
+        if not 0 < self.hop_samples <= self.window_samples:
+            raise ValueError('overlap_hop_size must be larger than 0 and at most overlap_window_size!')
+
+        self._window = stft_utils.make_window(self.overlap_window_type, self.window_samples)
+        self.num_sources = None
+        self.reset()
+
+    def reset(self):
+        """Clears every buffer so that a new stream can be processed."""
+        self._input_buffer = np.zeros((self.num_channels, 0))
+        self._buffer_start = 0  # stream index of the first sample in the input buffer
+        self._window_start = 0  # stream index of the start of the next window
+        self._n_input = 0
+        self._n_output = 0
+
+        # overlap-added sources and window, starting at self._window_start
+        self._source_overlap = None
+        self._window_overlap = np.zeros(self.window_samples)
+
+    @property
+    def latency(self):
+        """(int): Maximum number of samples that the output lags the input by."""
+        return self.window_samples - 1
+
+    def process_block(self, audio_block):
+        """Separates the next block of the stream.
+
+        Args:
+            audio_block (:obj:`np.array`): next block of audio with shape ``(num_channels, n_samples)``, or
+                ``(n_samples,)`` for a mono stream.
+
+        Returns:
+            (list): One array with shape ``(num_channels, n)`` per source, holding the next ``n`` samples of that
+            source. ``n`` is the same for every source but depends on how many samples are complete, and is not
+            necessarily the length of ``audio_block``. The list is empty until the first window is separated.
+        """
+        audio_block = np.asarray(audio_block, dtype=float)
+        if audio_block.ndim == 1:
+            audio_block = audio_block[np.newaxis, :]
+
+        if audio_block.ndim != 2 or audio_block.shape[constants.CHAN_INDEX] != self.num_channels:
+            raise ValueError('audio_block must have shape (num_channels, n_samples) with num_channels = {}!'
+                             .format(self.num_channels))
+
+        self._n_input += audio_block.shape[constants.LEN_INDEX]
+        self._input_buffer = np.hstack([self._input_buffer, audio_block])
+        return self._process_windows(end_of_stream=False)
+
+    def flush(self):
+        """Ends the stream, separating the last partial window and returning every sample still in flight, and
+        resets for a new stream.
+
+        Returns:
+            (list): Like :func:`process_block`. After this, every source is as long as the input.
+        """
+        sources = self._process_windows(end_of_stream=True)
+        self.reset()
+        return sources
+
+    def process_stream(self, audio_blocks):
+        """
+        Generator that separates every block from an iterator and then flushes the stream.
+
+        Args:
+            audio_blocks (iterable): blocks of audio, as passed to :func:`process_block`.
+
+        Yields:
+            (list): The output of :func:`process_block` for every block, then the output of :func:`flush`.
+        """
+        for audio_block in audio_blocks:
+            yield self.process_block(audio_block)
+
+        yield self.flush()
+
+    def process_file(self, input_file_path, output_file_paths, block_duration=1.0,
+                     sample_format=constants.DEFAULT_SAMPLE_FORMAT):
+        """
+        Separates a WAV file into one WAV file per source. The input file is memory mapped and read one block at
+        a time, and the output files are written as the blocks come out, so memory use does not depend on the
+        length of the file.
+
+        Fixed-point input samples are converted to floats like :func:`AudioSignal.load_audio_from_file` does, and
+        the outputs are written like :func:`AudioSignal.write_audio_to_file` with ``normalize=False``: they are
+        not peak normalized, because the peak is not known until the stream ends, so PCM outputs are clipped to
+        ``[-1.0, 1.0]``.
+
+        Args:
+            input_file_path (str): Path to a WAV file with :attr:`sample_rate` and :attr:`num_channels`.
+            output_file_paths (list): One path per source returned by the separation method.
+            block_duration (float): Length (in seconds) of the blocks read from the input file.
+            sample_format (str): One of ``constants.ALL_SAMPLE_FORMATS``, the sample format of the output files.
+                Defaults to ``constants.DEFAULT_SAMPLE_FORMAT`` (16-bit PCM).
+        """
+        if sample_format not in constants.ALL_SAMPLE_FORMATS:
+            raise ValueError('Unknown sample_format {}! Must be one of {}.'
+                             .format(sample_format, constants.ALL_SAMPLE_FORMATS))
+
+        file_sample_rate, file_data = wav.read(input_file_path, mmap=True)
+        file_data = file_data.reshape((file_data.shape[0], -1))
+
+        if file_sample_rate != self.sample_rate or file_data.shape[1] != self.num_channels:
+            raise ValueError('{} has sample rate {} and {} channels, but this StreamingOverlapAdd expects {} and {}!'
+                             .format(input_file_path, file_sample_rate, file_data.shape[1],
+                                     self.sample_rate, self.num_channels))
+
+        block_samples = max(int(np.round(block_duration * self.sample_rate)), 1)
+
+        def audio_blocks():
+            for start in range(0, file_data.shape[0], block_samples):
+                block = file_data[start:start + block_samples].T
+                yield block if np.issubdtype(block.dtype, np.floating) else audio_signal._fixed_point_to_float(block)
+
+        output_files = []
+        try:
+            for path in output_file_paths:
+                output_files.append(audio_signal._WavWriter(path, self.num_channels, file_data.shape[0],
+                                                            self.sample_rate, sample_format))
+
+            for sources in self.process_stream(audio_blocks()):
+                if not sources:
+                    continue
+
+                if len(sources) != len(output_files):
+                    raise ValueError('Got {} output paths for {} sources!'.format(len(output_files), len(sources)))
+
+                for output_file, source in zip(output_files, sources):
+                    output_file.write(source)
+        finally:
+            for output_file in output_files:
+                output_file.close()
+
+    def _process_windows(self, end_of_stream):
+        outputs = []
+
+        while True:
+            available = self._n_input - self._window_start
+            previous_window_end = self._window_start - self.hop_samples + self.window_samples
+
+            if available >= self.window_samples:
+                length = self.window_samples
+            elif end_of_stream and available > 0 and (self._window_start == 0 or
+                                                      previous_window_end < self._n_input):
+                # the last (partial) window
+                length = available
+            else:
+                break
+
+            offset = self._window_start - self._buffer_start
+            sources = self._separate(self._input_buffer[:, offset:offset + length])
+            self._source_overlap[:, :, :length] += sources * self._window[:length]
+            self._window_overlap[:length] += self._window[:length]
+
+            # nothing after this window starts before the next hop, so that much is complete
+            outputs.append(self._pop_output(self.hop_samples))
+            self._window_start += self.hop_samples
+
+        if end_of_stream and self._source_overlap is not None:
+            outputs.append(self._pop_output(self._n_input - self._n_output))
+
+        # forget the input before the next window
+        self._input_buffer = self._input_buffer[:, self._window_start - self._buffer_start:]
+        self._buffer_start = self._window_start
+
+        if not outputs:
+            return []
+        return list(np.concatenate(outputs, axis=-1))
+
+    def _pop_output(self, n_samples):
+        """Takes (up to) the first ``n_samples`` from the overlap buffers, normalized by the overlap-added window,
+        and shifts the buffers.
+        """
+        n_samples = max(min(n_samples, self._n_input - self._n_output, self.window_samples), 0)
+        norm = self._window_overlap[:n_samples].copy()
+        norm[norm == 0.0] = constants.EPSILON
+        output = self._source_overlap[:, :, :n_samples] / norm
+
+        shift = min(self.hop_samples, self.window_samples)
+        for overlap in (self._source_overlap, self._window_overlap):
+            overlap[..., :-shift] = overlap[..., shift:].copy()
+            overlap[..., -shift:] = 0
+
+        self._n_output += n_samples
+        return output
+
+    def _separate(self, segment):
+        """Runs a new instance of the separation method on one window and returns every source as an array with
+        shape ``(num_sources, num_channels, window length)``.
+        """
+        signal = AudioSignal(audio_data_array=segment, sample_rate=self.sample_rate)
+        separation_instance = self.separation_method(signal, **self.separation_kwargs)
+        separation_instance.run()
+        source_signals = separation_instance.make_audio_signals()
+
+        if self.num_sources is None:
+            self.num_sources = len(source_signals)
+        elif len(source_signals) != self.num_sources:
+            raise ValueError('{} returned {} sources, but earlier windows had {}!'
+                             .format(self.separation_method.__name__, len(source_signals), self.num_sources))
+
+        if self._source_overlap is None:
+            self._source_overlap = np.zeros((self.num_sources, self.num_channels, self.window_samples))
+
+        length = segment.shape[constants.LEN_INDEX]
+        sources = np.zeros((self.num_sources, self.num_channels, length))
+        for i, source_signal in enumerate(source_signals):
+            source_data = source_signal.audio_data[:, :length]
+            sources[i, :, :source_data.shape[constants.LEN_INDEX]] = source_data
+
+        return sources
@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+A streaming (block by block) variant of the REpeating Pattern Extraction Technique (REPET).
+"""
+
+from __future__ import division
+
+import numpy as np
+
+from nussl.separation.repet import Repet
+from ..core import constants
+from ..core import stft_utils
+
+
+class StreamingRepet(object):
+    """Implements REPET on a stream of audio blocks with a rolling repeating-segment model.
+
+    :class:`Repet` needs the whole signal because it computes the beat spectrum, the repeating period and the
+    median model globally. ``StreamingRepet`` instead consumes audio one block at a time and keeps only a ring
+    buffer of the last ``buffer_duration`` seconds of magnitude frames. Every new STFT frame:
+
+        * updates the beat spectrum of the buffer incrementally (the lag products of the frame entering and the
+          frame leaving the buffer are added and subtracted, with an exact recomputation with
+          :func:`Repet.compute_beat_spectrum` once per buffer length),
+        * re-estimates the repeating period with :func:`Repet.find_repeating_period_simple`,
+        * takes the median of the frame and the buffered frames a whole number of periods before it as the
+          repeating model, and masks the frame with it the same way :class:`Repet` does.
+
+    Masked frames are overlap-added into background and foreground blocks as soon as they are complete, so the
+    output lags the input by at most ``window_length`` samples (see :attr:`latency`). Until the buffer is long
+    enough to estimate a period, frames have no repeating model and go to the background.
+
+    Parameters:
+        sample_rate (int): sample rate of the stream.
+        num_channels (int, optional): number of channels of the stream. Defaults to 1.
+        buffer_duration (float, optional): length (in seconds) of the ring buffer of magnitude frames that the beat
+            spectrum and the repeating model are computed over. Defaults to 24 seconds.
+        min_period (float, optional): minimum time to look for repeating period in terms of seconds.
+        max_period (float, optional): maximum time to look for repeating period in terms of seconds. Defaults to
+            ``min(8, buffer_duration / 3)``.
+        period (float, optional): exact time that the repeating period is (in seconds). If this is set, the beat
+            spectrum is not computed.
+        high_pass_cutoff (float, optional): value (in Hz) for the high pass cutoff filter.
+        window_length (int, optional): STFT window length in samples. Defaults to the :class:`StftParams` default.
+        hop_length (int, optional): STFT hop length in samples. Defaults to half of ``window_length``.
+        window_type (str, optional): STFT window type. Defaults to :attr:`constants.WINDOW_DEFAULT`.
+
+    Attributes:
+        stft_params (:class:`stft_utils.StftParams`): STFT parameters used on the stream.
+        repeating_period (int): Current repeating period in units of hops (stft time bins), ``None`` until the
+            buffer is long enough to estimate one.
+
+    Example:
+
+    .. code-block:: python
+        :linenos:
+
+        streaming_repet = nussl.StreamingRepet(sample_rate=44100, num_channels=2)
+
+        for block in blocks:  # (num_channels, n_samples) arrays from a live feed
+            background, foreground = streaming_repet.process_block(block)
+            ...
+
+        background, foreground = streaming_repet.flush()  # whatever is still in flight
+
+    """
+    def __init__(self, sample_rate, num_channels=1, buffer_duration=24.0, min_period=None, max_period=None,
+                 period=None, high_pass_cutoff=100.0, window_length=None, hop_length=None, window_type=None):
+        if (min_period or max_period) and period:
+            raise ValueError('Cannot set both period and (min_period or max_period)!')
+
+        self.sample_rate = int(sample_rate)
+        self.num_channels = int(num_channels)
+        self.stft_params = stft_utils.StftParams(self.sample_rate, window_length=window_length,
+                                                 hop_length=hop_length, window_type=window_type)
+        self.buffer_duration = float(buffer_duration)
+        self.buffer_frames = int(np.ceil(self.buffer_duration * self.sample_rate / self.stft_params.hop_length))
+
+        if self.stft_params.hop_length > self.stft_params.window_length:
+            raise ValueError('hop_length cannot be larger than window_length!')
+
+        self.period = None if period is None else self._update_period(period)
+        self.min_period = self._update_period(0.8 if min_period is None else min_period)
+        self.max_period = self._update_period(min(8, self.buffer_duration / 3) if max_period is None else max_period)
+
+        # High pass filter cutoff freq. (in # of freq. bins), +1 to match Repet
+        self.high_pass_cutoff = int(np.ceil(float(high_pass_cutoff) * (self.stft_params.n_fft_bins - 1) /
+                                            self.sample_rate)) + 1
+
+        window_length, hop_length = self.stft_params.window_length, self.stft_params.hop_length
+        self._window = stft_utils.stft_cache.window(self.stft_params.window_type, window_length)
+
+        # e_istft divides by the overlap-added window; in a stream that envelope is periodic in the hop
+        self._window_normalization = np.zeros(hop_length)
+        for start in range(0, window_length, hop_length):
+            segment = self._window[start:start + hop_length]
+            self._window_normalization[:len(segment)] += segment
+        self._window_normalization[self._window_normalization == 0.0] = constants.EPSILON
+
+        self.repeating_period = None
+        self.reset()
+
+    def reset(self):
+        """Clears every buffer so that a new stream can be processed."""
+        n_bins = self.stft_params.n_fft_bins // 2 + 1
+        window_length, hop_length = self.stft_params.window_length, self.stft_params.hop_length
+
+        self._magnitude_buffer = np.zeros((self.buffer_frames, n_bins, self.num_channels))
+        self._power_buffer = np.zeros((self.buffer_frames, n_bins))
+        self._lag_products = np.zeros(self.buffer_frames)
+        self._n_frames = 0
+
+        # the stream is zero-padded at the start so that its first sample is covered by every overlapping frame
+        self._input_buffer = np.zeros((self.num_channels, window_length - hop_length))
+        self._background_overlap = np.zeros((self.num_channels, window_length))
+        self._foreground_overlap = np.zeros((self.num_channels, window_length))
+        self._samples_to_skip = window_length - hop_length
+        self._n_input = 0
+        self._n_output = 0
+
+        self.repeating_period = self.period
+
+    @property
+    def latency(self):
+        """(int): Maximum number of samples that the output lags the input by."""
+        return self.stft_params.window_length - 1
+
+    @property
+    def beat_spectrum(self):
+        """(:obj:`np.array`): Beat spectrum of the magnitude frames currently in the ring buffer."""
+        n_buffered = min(self._n_frames, self.buffer_frames)
+        lags = np.arange(n_buffered)
+        return self._lag_products[:n_buffered] / ((n_buffered - lags) * self._power_buffer.shape[1])
+
+    def process_block(self, audio_block):
+        """Separates the next block of the stream.
+
+        Args:
+            audio_block (:obj:`np.array`): next block of audio with shape ``(num_channels, n_samples)``, or
+                ``(n_samples,)`` for a mono stream.
+
+        Returns:
+            (tuple): ``(background, foreground)``, two arrays with shape ``(num_channels, n)`` holding the next
+            ``n`` samples of each output. ``n`` depends on how many samples are complete and is not necessarily
+            the length of ``audio_block``.
+        """
+        audio_block = np.asarray(audio_block, dtype=float)
+        if audio_block.ndim == 1:
+            audio_block = audio_block[np.newaxis, :]
+
+        if audio_block.ndim != 2 or audio_block.shape[constants.CHAN_INDEX] != self.num_channels:
+            raise ValueError('audio_block must have shape (num_channels, n_samples) with num_channels = {}!'
+                             .format(self.num_channels))
+
+        self._n_input += audio_block.shape[constants.LEN_INDEX]
+        self._input_buffer = np.hstack([self._input_buffer, audio_block])
+        return self._process_frames()
+
+    def flush(self):
+        """Ends the stream, returning every sample that is still in flight, and resets for a new stream.
+
+        Returns:
+            (tuple): ``(background, foreground)``, like :func:`process_block`. After this, the total output length
+            equals the total input length.
+        """
+        hop_length, window_length = self.stft_params.hop_length, self.stft_params.window_length
+
+        # every frame completes one hop of output, including the zero-padding at the start of the stream
+        n_frames_needed = int(np.ceil((window_length - hop_length + self._n_input) / hop_length)) - self._n_frames
+        padded_length = (n_frames_needed - 1) * hop_length + window_length
+        n_padding = max(padded_length - self._input_buffer.shape[constants.LEN_INDEX], 0)
+
+        self._input_buffer = np.hstack([self._input_buffer, np.zeros((self.num_channels, n_padding))])
+        background, foreground = self._process_frames()
+        self.reset()
+        return background, foreground
+
+    def _process_frames(self):
+        window_length, hop_length = self.stft_params.window_length, self.stft_params.hop_length
+        n_fft_bins = self.stft_params.n_fft_bins
+        n_frames = max(0, (self._input_buffer.shape[constants.LEN_INDEX] - window_length) // hop_length + 1)
+
+        background = np.empty((self.num_channels, n_frames * hop_length))
+        foreground = np.empty((self.num_channels, n_frames * hop_length))
+
+        for i in range(n_frames):
+            start = i * hop_length
+            frame = self._input_buffer[:, start:start + window_length]
+            stft_frame = np.fft.rfft(frame * self._window, n=n_fft_bins, axis=1).T  # (n_bins, num_channels)
+
+            repeating_mask = self._push_frame(np.abs(stft_frame))
+            background_stft = repeating_mask * stft_frame
+
+            self._background_overlap += np.fft.irfft(background_stft.T, n=n_fft_bins, axis=1)[:, :window_length]
+            self._foreground_overlap += np.fft.irfft((stft_frame - background_stft).T, n=n_fft_bins,
+                                                     axis=1)[:, :window_length]
+
+            # the first hop of the overlap buffers is complete now
+            background[:, start:start + hop_length] = self._background_overlap[:, :hop_length]
+            foreground[:, start:start + hop_length] = self._foreground_overlap[:, :hop_length]
+            for overlap in (self._background_overlap, self._foreground_overlap):
+                overlap[:, :-hop_length] = overlap[:, hop_length:].copy()
+                overlap[:, -hop_length:] = 0
+
+        self._input_buffer = self._input_buffer[:, n_frames * hop_length:]
+
+        background /= np.tile(self._window_normalization, n_frames)
+        foreground /= np.tile(self._window_normalization, n_frames)
+
+        # drop the zero-padding at the start of the stream and anything past the end of the input
+        skip = min(self._samples_to_skip, background.shape[constants.LEN_INDEX])
+        self._samples_to_skip -= skip
+        n_out = min(background.shape[constants.LEN_INDEX] - skip, self._n_input - self._n_output)
+        self._n_output += n_out
+
+        return background[:, skip:skip + n_out], foreground[:, skip:skip + n_out]
+
+    def _push_frame(self, magnitude_frame):
+        """Adds a magnitude frame to the ring buffer, updates the beat spectrum and the repeating period, and
+        returns the repeating mask for the frame.
+        """
+        n_buffer = self.buffer_frames
+        frame_index = self._n_frames
+        position = frame_index % n_buffer
+        power_frame = np.mean(np.square(magnitude_frame), axis=1)
+
+        if frame_index >= n_buffer:
+            # the oldest frame (at the position being overwritten) leaves the buffer with all of its lag products
+            oldest_products = np.dot(self._power_buffer, self._power_buffer[position])
+            self._lag_products -= oldest_products[(position + np.arange(n_buffer)) % n_buffer]
+
+        self._magnitude_buffer[position] = magnitude_frame
+        self._power_buffer[position] = power_frame
+        self._n_frames += 1
+
+        n_buffered = min(self._n_frames, n_buffer)
+        lags = np.arange(n_buffered)
+        if self._n_frames % n_buffer == 0:
+            # recompute exactly once per buffer length so that rounding errors don't accumulate
+            ordered = self._power_buffer[(position + 1 + lags) % n_buffer]
+            beat_spectrum = Repet.compute_beat_spectrum(ordered)
+            self._lag_products = beat_spectrum * (n_buffered - lags) * self._power_buffer.shape[1]
+        else:
+            newest_products = np.dot(self._power_buffer, power_frame)
+            self._lag_products[:n_buffered] += newest_products[(position - lags) % n_buffer]
+
+        self.repeating_period = self._current_period(n_buffered)
+
+        # median of this frame and the frames whole periods before it
+        period = self.repeating_period or 0
+        n_repetitions = 1 if period == 0 else (n_buffered - 1) // period + 1
+        positions = (position - period * np.arange(n_repetitions)) % n_buffer
+        median_frame = np.median(self._magnitude_buffer[positions], axis=0)
+
+        # take minimum of computed mask and original input and scale, like Repet
+        repeating_mask = ((np.minimum(median_frame, magnitude_frame) + constants.EPSILON) /
+                          (magnitude_frame + constants.EPSILON))
+        repeating_mask[:self.high_pass_cutoff, :] = 1  # high-pass filter the foreground
+        return repeating_mask
+
+    def _current_period(self, n_buffered):
+        if self.period is not None:
+            return self.period
+
+        # look for at least three repetitions in the buffer, like Repet does over the whole signal
+        max_period = min(self.max_period, n_buffered // 3)
+        if max_period < self.min_period:
+            return None
+
+        return int(Repet.find_repeating_period_simple(self.beat_spectrum, self.min_period, max_period))
+
+    def _update_period(self, period):
+        # same conversion from seconds to hops as Repet
+        period = float(period)
+        result = period * self.sample_rate
+        result += self.stft_params.window_length / self.stft_params.window_overlap - 1
+        result /= self.stft_params.window_overlap
+        return int(np.ceil(result))
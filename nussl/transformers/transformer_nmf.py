@@ -3,7 +3,8 @@
 """
 Non-negative Matrix Factorization
 """
-import math
+import multiprocessing
+import time
 import numpy as np
 import warnings
 import matplotlib.pyplot as plt
@@ -32,14 +33,47 @@ class TransformerNMF(object):
         distance_measure (str): Specifies whether to use euclidean or divergence distance metrics (`H`)
         should_update_activation (bool): Whether the activation matrix should be updated for another iteration
         should_update_template (bool): Whether the template matrix should be updated at every iteration
-        seed (int): A seed value for the random numbers. If None, no seed is used.
-        This will be input to np.random.seed()
+        seed (int or :obj:`np.random.RandomState`): A seed value for the random numbers. If None, no seed is used.
+        This seeds a :obj:`np.random.RandomState` that belongs to this object (see :ref:`random_state`), so the
+        global numpy random state is left untouched.
         max_num_iterations (int): Maximum number of times that the update rules will be computed
         should_do_epsilon (bool):
         stopping_epsilon (float):
+        reconstruction_error_interval (int): How often (in iterations) the distance between
+        :ref:`input_matrix` and :ref:`reconstructed_matrix` is computed and appended to
+        :ref:`reconstruction_error`. If ``None``, the distance is never computed. Defaults to every iteration.
+        relative_tolerance (float): If not ``None``, stop when the relative improvement of the reconstruction
+        error, ``(previous - current) / previous``, stays below this value for ``patience`` consecutive
+        evaluations. The error is evaluated every ``reconstruction_error_interval`` iterations.
+        patience (int): Number of consecutive evaluations without enough relative improvement before
+        stopping. Only used if ``relative_tolerance`` is set. Defaults to 1.
+        max_time (float): Wall-clock budget for :func:`transform`, in seconds. If ``None`` (default), there
+        is no time limit.
+        batch_size (int): If not ``None``, run mini-batch (online) NMF: :ref:`input_matrix` is processed in
+        blocks of ``batch_size`` columns and one iteration is one pass over all of the blocks. For each block,
+        the activations are updated ``num_batch_iterations`` times with the templates fixed, then the templates
+        are updated once from that block. Intermediate matrices are never bigger than one block, so memory use
+        does not grow with the number of columns. The reconstruction error of a pass is summed over the blocks
+        as they are processed. Defaults to ``None`` (update on the whole matrix at once).
+        num_batch_iterations (int): Number of activation updates per block in mini-batch mode. Defaults to 10.
+        update_in_place (bool): If ``True``, the update rules overwrite :ref:`activation_matrix` and
+        :ref:`template_dictionary` and reuse the same intermediate buffers on every iteration instead
+        of allocating new matrices. Matrices passed in as initial states will be modified.
+        num_restarts (int): Number of independent random initializations to run. :func:`transform` keeps the
+        factorization with the lowest final distance. The first run uses this object's initial matrices and
+        every other run draws its own from a :obj:`np.random.RandomState` seeded from :ref:`random_state`, so
+        results are reproducible for a given ``seed``. Matrices passed in as initial states are used by all of
+        the runs. ``max_time`` applies to each run. Defaults to 1.
+        num_jobs (int): Number of worker processes used for the restarts. If ``None``, uses one per CPU.
+        Defaults to 1 (restarts run one after another in this process).
 
     Attributes:
-
+        random_state (:obj:`np.random.RandomState`): The random number generator used for initialization.
+        restart_distances (list): Final distance of each run of the last call to :func:`transform`. Only set
+        if ``num_restarts`` is more than 1.
+        num_iterations (int): Number of iterations run by the last call to :func:`transform`.
+        stopping_reason (str): Why the last call to :func:`transform` stopped. One of
+        :ref:`ALL_STOPPING_REASONS`.
 
     Examples:
         :ref:'The Transformer NMF Demo Example <transformer_nmf_demo>'
@@ -51,10 +85,19 @@ class TransformerNMF(object):
     DEFAULT_DISTANCE_TYPE = EUCLIDEAN
     ALL_DISTANCE_TYPES = [EUCLIDEAN, KL_DIVERGENCE]
 
+    # Reasons for stopping
+    STOPPED_MAX_ITERATIONS = 'max_num_iterations'
+    STOPPED_EPSILON = 'stopping_epsilon'
+    STOPPED_CONVERGED = 'relative_tolerance'
+    STOPPED_MAX_TIME = 'max_time'
+    ALL_STOPPING_REASONS = [STOPPED_MAX_ITERATIONS, STOPPED_EPSILON, STOPPED_CONVERGED, STOPPED_MAX_TIME]
+
     def __init__(self, input_matrix, num_components=50,
                  activation_matrix=None, template_dictionary=None, distance_measure=None,
                  should_update_activation=None, should_update_template=None,
-                 seed=None, max_num_iterations=50, should_do_epsilon=False, stopping_epsilon=1e10):
+                 seed=None, max_num_iterations=50, should_do_epsilon=False, stopping_epsilon=1e10,
+                 reconstruction_error_interval=1, relative_tolerance=None, patience=1, max_time=None,
+                 batch_size=None, num_batch_iterations=10, update_in_place=False, num_restarts=1, num_jobs=1):
 
         # Check input_matrix
         self._check_input_matrix(input_matrix)
@@ -68,22 +111,30 @@ class TransformerNMF(object):
 
         self.num_components = num_components
 
-        # Set the seed value
-        if seed is not None:
-            np.random.seed(seed)
+        # Set the seed value. This object draws from its own generator, never from the global one
+        self.random_state = seed if isinstance(seed, np.random.RandomState) else np.random.RandomState(seed)
 
         # Check activation and templates
         self.activation_matrix = None
         self.template_dictionary = None
 
+        # Random initial matrices keep the precision of a float32 input matrix
+        init_dtype = self.input_matrix.dtype if self.input_matrix.dtype == np.float32 else np.float64
+
         # Initialize templates to random if none provided
-        self.template_dictionary = np.random.rand(self.input_matrix.shape[0], num_components) \
+        self.template_dictionary = \
+            self.random_state.rand(self.input_matrix.shape[0], num_components).astype(init_dtype, copy=False) \
             if template_dictionary is None else template_dictionary
 
         # Initialize activation_matrix to random if none provided
-        self.activation_matrix = np.random.rand(num_components, self.input_matrix.shape[1]) \
+        self.activation_matrix = \
+            self.random_state.rand(num_components, self.input_matrix.shape[1]).astype(init_dtype, copy=False) \
             if activation_matrix is None else activation_matrix
 
+        # Kept so that restarts only re-randomize what wasn't given
+        self._initial_template_dictionary = template_dictionary
+        self._initial_activation_matrix = activation_matrix
+
         # Check to make sure we understand the distance measure
         if distance_measure is not None and distance_measure not in self.ALL_DISTANCE_TYPES:
             raise ValueError('distance_measure is not a known distance type! Known types: {}'
@@ -112,7 +163,42 @@ class TransformerNMF(object):
         self.stopping_epsilon = stopping_epsilon
         self.max_num_iterations = max_num_iterations
 
+        if reconstruction_error_interval is not None and reconstruction_error_interval <= 0:
+            raise ValueError('reconstruction_error_interval must be a positive integer or None!')
+
+        if should_do_epsilon and reconstruction_error_interval is None:
+            raise ValueError('Cannot stop on stopping_epsilon if the reconstruction error is never computed!')
+
+        if relative_tolerance is not None and reconstruction_error_interval is None:
+            raise ValueError('Cannot stop on relative_tolerance if the reconstruction error is never computed!')
+
+        if patience <= 0:
+            raise ValueError('patience must be a positive integer!')
+
+        self.reconstruction_error_interval = reconstruction_error_interval
+        self.relative_tolerance = relative_tolerance
+        self.patience = patience
+        self.max_time = max_time
+
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError('batch_size must be a positive integer or None!')
+
+        self.batch_size = batch_size
+        self.num_batch_iterations = num_batch_iterations
+
+        self.update_in_place = update_in_place
+        self._buffers = {}
+
+        if num_restarts <= 0:
+            raise ValueError('num_restarts must be a positive integer!')
+
+        self.num_restarts = num_restarts
+        self.num_jobs = num_jobs
+        self.restart_distances = None
+
         self.reconstruction_error = []
+        self.num_iterations = 0
+        self.stopping_reason = None
 
     @staticmethod
     def _check_input_matrix(matrix):
@@ -191,26 +277,132 @@ class TransformerNMF(object):
                           'this function. Expect this to take a long time if you have not set '
                           'a suitable epsilon!')
 
-        should_stop = False
-        num_iterations = 0
-        while not should_stop:
+        if self.num_restarts > 1:
+            return self._transform_restarts()
+
+        start_time = time.time()
+        num_stalled_evaluations = 0
+        self.stopping_reason = None
+        self.num_iterations = 0
 
-            self.update()
+        while self.stopping_reason is None:
+            self.num_iterations += 1
 
-            current_distance = self.distance
-            self.reconstruction_error.append(current_distance)
+            # The distance is a full pass over the input matrix, so only compute it when asked to
+            should_compute_error = self.reconstruction_error_interval is not None and \
+                self.num_iterations % self.reconstruction_error_interval == 0
+
+            if self.batch_size is None:
+                self.update()
+                current_distance = self.distance if should_compute_error else None
+            else:
+                current_distance = self._update_mini_batches(should_compute_error)
+
+            if should_compute_error:
+                self.reconstruction_error.append(current_distance)
+
+                if self.relative_tolerance is not None and len(self.reconstruction_error) > 1:
+                    if self._relative_improvement() < self.relative_tolerance:
+                        num_stalled_evaluations += 1
+                    else:
+                        num_stalled_evaluations = 0
 
             # Stopping conditions
-            # TODO: Rethink stopping logic
-            num_iterations += 1
             if self.should_do_epsilon:
-                should_stop = current_distance <= self.stopping_epsilon
+                if should_compute_error and current_distance <= self.stopping_epsilon:
+                    self.stopping_reason = self.STOPPED_EPSILON
+
+            elif self.num_iterations >= self.max_num_iterations:
+                self.stopping_reason = self.STOPPED_MAX_ITERATIONS
 
+            if self.stopping_reason is None and num_stalled_evaluations >= self.patience:
+                self.stopping_reason = self.STOPPED_CONVERGED
+
+            if self.stopping_reason is None and self.max_time is not None \
+                    and time.time() - start_time >= self.max_time:
+                self.stopping_reason = self.STOPPED_MAX_TIME
+
+        return self.activation_matrix, self.template_dictionary
+
+    def _transform_restarts(self):
+        """
+        Runs :ref:`num_restarts` independent factorizations, possibly in parallel, and keeps the one
+        with the lowest final distance.
+        """
+        kwargs = dict(num_components=self.num_components, distance_measure=self.distance_measure,
+                      should_update_activation=self.should_update_activation,
+                      should_update_template=self.should_update_template,
+                      max_num_iterations=self.max_num_iterations, should_do_epsilon=self.should_do_epsilon,
+                      stopping_epsilon=self.stopping_epsilon,
+                      reconstruction_error_interval=self.reconstruction_error_interval,
+                      relative_tolerance=self.relative_tolerance, patience=self.patience, max_time=self.max_time,
+                      batch_size=self.batch_size, num_batch_iterations=self.num_batch_iterations,
+                      update_in_place=self.update_in_place)
+
+        # The first run starts from this object's matrices, the others from their own generators
+        seeds = [None] + list(self.random_state.randint(np.iinfo(np.int32).max, size=self.num_restarts - 1))
+        jobs = []
+        for i, seed in enumerate(seeds):
+            run_kwargs = dict(kwargs, seed=seed)
+            if i == 0:
+                run_kwargs['template_dictionary'] = np.copy(self.template_dictionary)
+                run_kwargs['activation_matrix'] = np.copy(self.activation_matrix)
             else:
-                should_stop = num_iterations >= self.max_num_iterations
+                if self._initial_template_dictionary is not None:
+                    run_kwargs['template_dictionary'] = np.copy(self._initial_template_dictionary)
+                if self._initial_activation_matrix is not None:
+                    run_kwargs['activation_matrix'] = np.copy(self._initial_activation_matrix)
+            jobs.append((self.input_matrix, run_kwargs))
+
+        if self.num_jobs == 1:
+            results = [_run_nmf_restart(job) for job in jobs]
+        else:
+            pool = multiprocessing.Pool(self.num_jobs)
+            try:
+                results = pool.map(_run_nmf_restart, jobs)
+            finally:
+                pool.close()
+                pool.join()
+
+        # A NaN distance (e.g. KL divergence with zeros in the input) never wins
+        self.restart_distances = [r['distance'] for r in results]
+        distances = np.array(self.restart_distances, dtype=float)
+        best = results[int(np.argmin(np.where(np.isnan(distances), np.inf, distances)))]
+
+        self.activation_matrix = best['activation_matrix']
+        self.template_dictionary = best['template_dictionary']
+        self.reconstruction_error.extend(best['reconstruction_error'])
+        self.num_iterations = best['num_iterations']
+        self.stopping_reason = best['stopping_reason']
 
         return self.activation_matrix, self.template_dictionary
 
+    def _total_distance(self):
+        """
+        :ref:`distance`, computed block by block in mini-batch mode so the full reconstruction is never built.
+        """
+        if self.batch_size is None:
+            return self.distance
+
+        distance_func = self._euclidean_distance_between if self._do_euclidean else self._kl_divergence_between
+        total_distance = 0.0
+        for start in range(0, self.input_matrix.shape[1], self.batch_size):
+            block = slice(start, start + self.batch_size)
+            total_distance += distance_func(self.input_matrix[:, block],
+                                            np.dot(self.template_dictionary, self.activation_matrix[:, block]))
+
+        return total_distance
+
+    def _relative_improvement(self):
+        """
+        Relative improvement between the last two values in :ref:`reconstruction_error`.
+        """
+        previous, current = self.reconstruction_error[-2:]
+        if previous == 0:
+            return 0.0
+
+        return (previous - current) / abs(previous)
+
     def update(self):
         """
         Computes a single update using the update function specified.
@@ -218,99 +410,145 @@ class TransformerNMF(object):
         """
         # update activation matrix
         if self.should_update_activation:
-            self.activation_matrix = self.activation_update_func()
+            self.activation_matrix = self.activation_update_func(self.input_matrix, self.template_dictionary,
+                                                                 self.activation_matrix)
 
         # update template vectors
         if self.should_update_template:
-            self.template_dictionary = self.template_update_func()
+            self.template_dictionary = self.template_update_func(self.input_matrix, self.template_dictionary,
+                                                                 self.activation_matrix)
 
-    def _update_activation_euclidean(self):
+    def _update_mini_batches(self, compute_distance):
         """
-        Computes a new activation matrix using the Lee and Seung multiplicative update algorithm
-        :return: An updated activation matrix based on euclidean distance
+        Does one pass of mini-batch NMF over :ref:`input_matrix`, :ref:`batch_size` columns at a time.
+
+        Args:
+            compute_distance (bool): Whether to compute the distance for each block.
+
+        Returns:
+            (float) The distance summed over all of the blocks, or ``None`` if ``compute_distance`` is ``False``.
         """
+        distance_func = self._euclidean_distance_between if self._do_euclidean else self._kl_divergence_between
+        total_distance = 0.0 if compute_distance else None
+
+        for start in range(0, self.input_matrix.shape[1], self.batch_size):
+            block = slice(start, start + self.batch_size)
+            input_block = self.input_matrix[:, block]
+            activation_block = self.activation_matrix[:, block]
+
+            # Inference: update this block's activations with the templates fixed
+            if self.should_update_activation:
+                for _ in range(self.num_batch_iterations):
+                    activation_block = self.activation_update_func(input_block, self.template_dictionary,
+                                                                   activation_block)
+                self.activation_matrix[:, block] = activation_block
+
+            if compute_distance:
+                total_distance += distance_func(input_block, np.dot(self.template_dictionary, activation_block))
 
-        # make a new matrix to store results
-        activation_copy = np.empty_like(self.activation_matrix)
+            # Learning: one template update from this block only
+            if self.should_update_template:
+                self.template_dictionary = self.template_update_func(input_block, self.template_dictionary,
+                                                                     activation_block)
 
-        # store in memory so we don't have to do n*m calculations.
-        template_transpose = self.template_dictionary.T
-        temp_transpose_matrix = np.dot(template_transpose, self.input_matrix)
-        temp_transpose_act = np.dot(np.dot(template_transpose, self.template_dictionary), self.activation_matrix)
+        return total_distance
+
+    def _update_activation_euclidean(self, input_matrix, template_dictionary, activation_matrix):
+        """
+        Computes a new activation matrix using the Lee and Seung multiplicative update algorithm
+        :return: An updated activation matrix based on euclidean distance
+        """
+        template_transpose = template_dictionary.T
 
         # Eq. 4, H update from [1]
-        for indices, val in np.ndenumerate(self.activation_matrix):
-            result = temp_transpose_matrix[indices]
-            result /= temp_transpose_act[indices]
-            result *= self.activation_matrix[indices]
-            activation_copy[indices] = result
+        numerator = self._dot(template_transpose, input_matrix, 'activation_numerator')
+        template_gram = self._dot(template_transpose, template_dictionary, 'template_gram')
+        denominator = self._dot(template_gram, activation_matrix, 'activation_denominator')
 
-        return activation_copy
+        return self._multiplicative_update(activation_matrix, numerator, denominator)
 
-    def _update_template_euclidean(self):
+    def _update_template_euclidean(self, input_matrix, template_dictionary, activation_matrix):
         """
         Computes a new template matrix using the Lee and Seung multiplicative update algorithm
         :return: An updated template matrix based on euclidean distance
         """
-
-        # Make a new matrix to store results
-        template_copy = np.empty_like(self.template_dictionary)
-
-        # Cache some variables
-        activation_transpose = self.activation_matrix.T
-        input_matrix_activation_transpose = np.dot(self.input_matrix, activation_transpose)
-        temp_act = np.dot(np.dot(self.template_dictionary, self.activation_matrix), activation_transpose)
+        activation_transpose = activation_matrix.T
 
         # Eq. 4, W update from [1]
-        for indices, val in np.ndenumerate(self.template_dictionary):
-            result = input_matrix_activation_transpose[indices]
-            result /= temp_act[indices]
-            result *= self.template_dictionary[indices]
-            template_copy[indices] = result
+        numerator = self._dot(input_matrix, activation_transpose, 'template_numerator')
+        activation_gram = self._dot(activation_matrix, activation_transpose, 'activation_gram')
+        denominator = self._dot(template_dictionary, activation_gram, 'template_denominator')
 
-        return template_copy
+        return self._multiplicative_update(template_dictionary, numerator, denominator)
 
-    def _update_activation_kl_divergence(self):
+    def _update_activation_kl_divergence(self, input_matrix, template_dictionary, activation_matrix):
         """
         Computes a new activation matrix using the Lee and Seung multiplicative update algorithm
         :return: An updated activation matrix based on KL divergence
         """
-        # make a new matrix to store results
-        activation_copy = np.empty_like(self.activation_matrix)
-
-        dot = np.dot(self.template_dictionary, self.activation_matrix)
+        ratio = self._input_reconstruction_ratio(input_matrix, template_dictionary, activation_matrix)
 
         # Eq. 5, H update from [1]
-        for indices, val in np.ndenumerate(self.activation_matrix):
-            (a, mu) = indices
-            result = sum((self.template_dictionary[i][a] * self.input_matrix[i][mu]) / dot[i][mu]
-                         for i in range(self.template_dictionary.shape[0]))
-            result /= sum(self.template_dictionary[k][a] for k in range(self.template_dictionary.shape[0]))
-            result *= self.activation_matrix[indices]
-            activation_copy[indices] = result
+        numerator = self._dot(template_dictionary.T, ratio, 'activation_numerator')
+        denominator = np.sum(template_dictionary, axis=0)[:, np.newaxis]
 
-        return activation_copy
+        return self._multiplicative_update(activation_matrix, numerator, denominator)
 
-    def _update_template_kl_divergence(self):
+    def _update_template_kl_divergence(self, input_matrix, template_dictionary, activation_matrix):
         """
         Computes a new template matrix using the Lee and Seung multiplicative update algorithm
         :return: An updated template matrix based on KL divergence
         """
-        # make a new matrix to store results
-        template_copy = np.empty_like(self.template_dictionary)
-
-        dot = np.dot(self.template_dictionary, self.activation_matrix)
+        ratio = self._input_reconstruction_ratio(input_matrix, template_dictionary, activation_matrix)
 
         # Eq. 5, W update from [1]
-        for indices, val in np.ndenumerate(self.template_dictionary):
-            (i, a) = indices
-            result = sum((self.activation_matrix[a][mu] * self.input_matrix[i][mu]) / dot[i][mu]
-                         for mu in range(self.activation_matrix.shape[1]))
-            result /= sum(self.activation_matrix[a][nu] for nu in range(self.activation_matrix.shape[1]))
-            result *= self.template_dictionary[indices]
-            template_copy[indices] = result
+        numerator = self._dot(ratio, activation_matrix.T, 'template_numerator')
+        denominator = np.sum(activation_matrix, axis=1)[np.newaxis, :]
+
+        return self._multiplicative_update(template_dictionary, numerator, denominator)
 
-        return template_copy
+    def _input_reconstruction_ratio(self, input_matrix, template_dictionary, activation_matrix):
+        """
+        Element-wise ratio between the input matrix and its current reconstruction, used by
+        both of the KL divergence update rules.
+        """
+        reconstruction = self._dot(template_dictionary, activation_matrix, 'reconstruction')
+
+        if self.update_in_place:
+            return np.divide(input_matrix, reconstruction, out=reconstruction)
+
+        return input_matrix / reconstruction
+
+    def _dot(self, a, b, buffer_name):
+        """
+        ``np.dot(a, b)``. If :ref:`update_in_place` is ``True`` the result is written into a
+        buffer that is allocated once and reused on every iteration.
+        """
+        if not self.update_in_place:
+            return np.dot(a, b)
+
+        shape = (a.shape[0], b.shape[1])
+        dtype = np.result_type(a, b)
+        # Keyed by shape too, so the last (shorter) block in mini-batch mode doesn't evict the others
+        buffer = self._buffers.get((buffer_name, shape))
+
+        if buffer is None or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self._buffers[(buffer_name, shape)] = buffer
+
+        return np.dot(a, b, out=buffer)
+
+    def _multiplicative_update(self, matrix, numerator, denominator):
+        """
+        Computes ``matrix * numerator / denominator``, overwriting :param:`matrix` if
+        :ref:`update_in_place` is ``True``.
+        """
+        if not self.update_in_place:
+            return matrix * numerator / denominator
+
+        np.multiply(matrix, numerator, out=matrix)
+        np.divide(matrix, denominator, out=matrix)
+        return matrix
 
     def _euclidean_distance(self):
         """
@@ -319,7 +557,7 @@ class TransformerNMF(object):
         using Euclidean distance
         :return: Euclidean distance
         """
-        return sum((self.input_matrix[index] - val) ** 2 for index, val in np.ndenumerate(self.reconstructed_matrix))
+        return self._euclidean_distance_between(self.input_matrix, self.reconstructed_matrix)
 
     def _kl_divergence(self):
         """
@@ -329,9 +567,15 @@ class TransformerNMF(object):
         :return:
 
         """
-        return sum(
-            (self.input_matrix[index] * math.log(self.input_matrix[index] / val, 10) + self.input_matrix[index] - val)
-            for index, val in np.ndenumerate(self.reconstructed_matrix))
+        return self._kl_divergence_between(self.input_matrix, self.reconstructed_matrix)
+
+    @staticmethod
+    def _euclidean_distance_between(input_matrix, reconstructed_matrix):
+        return np.sum((input_matrix - reconstructed_matrix) ** 2)
+
+    @staticmethod
+    def _kl_divergence_between(input_matrix, reconstructed_matrix):
+        return np.sum(input_matrix * np.log10(input_matrix / reconstructed_matrix) + input_matrix - reconstructed_matrix)
 
     MAX_TEMPLATES_FOR_LINES = 30
 
@@ -436,3 +680,26 @@ class TransformerNMF(object):
 
         # Finalize and save
         plt.savefig(output_file)
+
+
+def _run_nmf_restart(job):
+    """
+    Runs one restart of :class:`TransformerNMF`. This is a module-level function so that it can be sent to
+    worker processes.
+
+    Args:
+        job (tuple): The input matrix and a dict of keyword arguments for :class:`TransformerNMF`.
+
+    Returns:
+        (dict) The final distance and the results of :func:`TransformerNMF.transform`.
+    """
+    input_matrix, kwargs = job
+    nmf = TransformerNMF(input_matrix, **kwargs)
+    nmf.transform()
+
+    return {'distance': nmf._total_distance(),
+            'activation_matrix': nmf.activation_matrix,
+            'template_dictionary': nmf.template_dictionary,
+            'reconstruction_error': nmf.reconstruction_error,
+            'num_iterations': nmf.num_iterations,
+            'stopping_reason': nmf.stopping_reason}
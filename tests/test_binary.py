@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import nussl
+from nussl.separation.masks import SoftMask
+
+
+class TestBinary(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'saved.nussl')
+        self.signal = nussl.AudioSignal(audio_data_array=np.random.rand(2, nussl.DEFAULT_SAMPLE_RATE * 4))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_audio_signal(self):
+        self.signal.stft()
+        self.signal.save(self.path)
+        loaded = nussl.AudioSignal.load(self.path)
+
+        self.assertIsInstance(loaded._audio_data, np.memmap)
+        self.assertTrue(loaded == self.signal)
+        self.assertLess(os.path.getsize(self.path), len(self.signal.to_json()))
+
+        with self.assertRaises(ValueError):
+            nussl.AudioSignal.from_json(nussl.utils.load_binary(self.path, lambda json_string: json_string))
+
+    def test_repet(self):
+        repet = nussl.Repet(self.signal)
+        repet.run()
+        repet.make_audio_signals()
+
+        repet.save(self.path)
+        self.assertTrue(nussl.Repet.load(self.path) == repet)
+
+    def test_mask(self):
+        mask = SoftMask(np.random.rand(20, 10, 2))
+        mask.save(self.path)
+        self.assertTrue(SoftMask.load(self.path) == mask)
+
+        with self.assertRaises(ValueError):
+            SoftMask.load(__file__)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -38,7 +38,8 @@ class TransformerNMFUnitTests(unittest.TestCase):
 
     def test_random_matrix(self):
         for n in range(4, 10, 2):
-            matrix = np.random.rand(n, n)
+            # TransformerNMF doesn't seed the global generator, so seed the test matrices here
+            matrix = np.random.RandomState(n).rand(n, n)
 
             # Run on euclidean
             distance_type = nussl.transformers.TransformerNMF.EUCLIDEAN
@@ -48,6 +49,163 @@ class TransformerNMFUnitTests(unittest.TestCase):
             distance_type = nussl.transformers.TransformerNMF.KL_DIVERGENCE
             self.calculate_nmf_error(matrix, self.n_bases, distance_type, self.n_iters, self.n_attempts, n)
 
+    def test_update_in_place(self):
+        """
+        The in-place update rules should give exactly the same factorization as the regular ones
+        """
+        matrix = np.random.rand(30, 20)
+        distance_types = [nussl.transformers.TransformerNMF.EUCLIDEAN,
+                          nussl.transformers.TransformerNMF.KL_DIVERGENCE]
+
+        for dist_type in distance_types:
+            templates = np.random.rand(matrix.shape[0], self.n_bases)
+            activations = np.random.rand(self.n_bases, matrix.shape[1])
+
+            nmf = nussl.TransformerNMF(matrix, self.n_bases, activations.copy(), templates.copy(),
+                                       distance_measure=dist_type, max_num_iterations=self.n_iters)
+            nmf.transform()
+
+            nmf_in_place = nussl.TransformerNMF(matrix, self.n_bases, activations.copy(),
+                                                templates.copy(), distance_measure=dist_type,
+                                                max_num_iterations=self.n_iters,
+                                                update_in_place=True)
+            nmf_in_place.transform()
+
+            assert np.allclose(nmf.activation_matrix, nmf_in_place.activation_matrix)
+            assert np.allclose(nmf.template_dictionary, nmf_in_place.template_dictionary)
+            assert np.allclose(nmf.reconstruction_error, nmf_in_place.reconstruction_error)
+
+    def test_reconstruction_error_interval(self):
+        """
+        Computing the reconstruction error less often should not change the factorization
+        """
+        matrix = np.random.rand(30, 20)
+        templates = np.random.rand(matrix.shape[0], self.n_bases)
+        activations = np.random.rand(self.n_bases, matrix.shape[1])
+
+        nmf = nussl.TransformerNMF(matrix, self.n_bases, activations.copy(), templates.copy(),
+                                   max_num_iterations=self.n_iters)
+        nmf.transform()
+        assert len(nmf.reconstruction_error) == self.n_iters
+
+        interval = 7
+        nmf_interval = nussl.TransformerNMF(matrix, self.n_bases, activations.copy(), templates.copy(),
+                                            max_num_iterations=self.n_iters,
+                                            reconstruction_error_interval=interval)
+        nmf_interval.transform()
+        assert np.allclose(nmf_interval.reconstruction_error,
+                           nmf.reconstruction_error[interval - 1::interval])
+
+        nmf_never = nussl.TransformerNMF(matrix, self.n_bases, activations.copy(), templates.copy(),
+                                         max_num_iterations=self.n_iters,
+                                         reconstruction_error_interval=None)
+        nmf_never.transform()
+        assert len(nmf_never.reconstruction_error) == 0
+        assert np.allclose(nmf.activation_matrix, nmf_never.activation_matrix)
+        assert np.allclose(nmf.template_dictionary, nmf_never.template_dictionary)
+
+        self.assertRaises(ValueError, nussl.TransformerNMF, matrix, self.n_bases,
+                          should_do_epsilon=True, reconstruction_error_interval=None)
+
+    def test_stopping_criteria(self):
+        """
+        Checks the relative tolerance and time budget stopping criteria
+        """
+        matrix = np.random.rand(30, 20)
+        max_iters = 1000
+
+        nmf = nussl.TransformerNMF(matrix, self.n_bases, max_num_iterations=max_iters)
+        nmf.transform()
+        assert nmf.num_iterations == max_iters
+        assert nmf.stopping_reason == nussl.TransformerNMF.STOPPED_MAX_ITERATIONS
+
+        tolerance, patience = 1e-3, 3
+        nmf = nussl.TransformerNMF(matrix, self.n_bases, max_num_iterations=max_iters,
+                                   relative_tolerance=tolerance, patience=patience)
+        nmf.transform()
+        assert nmf.num_iterations < max_iters
+        assert nmf.stopping_reason == nussl.TransformerNMF.STOPPED_CONVERGED
+        assert len(nmf.reconstruction_error) == nmf.num_iterations
+
+        errors = np.array(nmf.reconstruction_error)
+        improvements = (errors[:-1] - errors[1:]) / errors[:-1]
+        assert np.all(improvements[-patience:] < tolerance)
+
+        nmf = nussl.TransformerNMF(matrix, self.n_bases, max_num_iterations=max_iters, max_time=0)
+        nmf.transform()
+        assert nmf.num_iterations == 1
+        assert nmf.stopping_reason == nussl.TransformerNMF.STOPPED_MAX_TIME
+
+        self.assertRaises(ValueError, nussl.TransformerNMF, matrix, self.n_bases,
+                          relative_tolerance=tolerance, reconstruction_error_interval=None)
+
+    def test_mini_batch(self):
+        """
+        Mini-batch NMF with one block and one activation update per block is regular NMF. With smaller
+        blocks it should still converge.
+        """
+        matrix = np.dot(np.random.rand(30, self.n_bases), np.random.rand(self.n_bases, 100))
+        distance_types = [nussl.transformers.TransformerNMF.EUCLIDEAN,
+                          nussl.transformers.TransformerNMF.KL_DIVERGENCE]
+
+        for dist_type in distance_types:
+            templates = np.random.rand(matrix.shape[0], self.n_bases)
+            activations = np.random.rand(self.n_bases, matrix.shape[1])
+
+            nmf = nussl.TransformerNMF(matrix, self.n_bases, activations.copy(), templates.copy(),
+                                       distance_measure=dist_type, max_num_iterations=self.n_iters)
+            nmf.transform()
+
+            nmf_one_batch = nussl.TransformerNMF(matrix, self.n_bases, activations.copy(), templates.copy(),
+                                                 distance_measure=dist_type, max_num_iterations=self.n_iters,
+                                                 batch_size=matrix.shape[1], num_batch_iterations=1)
+            nmf_one_batch.transform()
+
+            assert np.allclose(nmf.activation_matrix, nmf_one_batch.activation_matrix)
+            assert np.allclose(nmf.template_dictionary, nmf_one_batch.template_dictionary)
+
+            for update_in_place in [False, True]:
+                nmf_batch = nussl.TransformerNMF(matrix, self.n_bases, activations.copy(), templates.copy(),
+                                                 distance_measure=dist_type, max_num_iterations=self.n_iters,
+                                                 batch_size=16, update_in_place=update_in_place)
+                nmf_batch.transform()
+
+                assert nmf_batch.activation_matrix.shape == activations.shape
+                assert nmf_batch.reconstruction_error[-1] < nmf_batch.reconstruction_error[0]
+
+                error = np.linalg.norm(nmf_batch.reconstructed_matrix - matrix) / np.linalg.norm(matrix)
+                assert error < self.max_error_pct
+
+    def test_restarts(self):
+        """
+        Restarts are reproducible for a seed, keep the best run, give the same results in parallel,
+        and never touch the global numpy random state
+        """
+        matrix = np.random.rand(30, 20)
+        num_restarts = 4
+
+        global_state = np.random.get_state()
+        nmf = nussl.TransformerNMF(matrix, self.n_bases, max_num_iterations=self.n_iters, seed=0,
+                                   num_restarts=num_restarts)
+        nmf.transform()
+        assert np.array_equal(global_state[1], np.random.get_state()[1])
+
+        assert len(nmf.restart_distances) == num_restarts
+        assert np.isclose(nmf.distance, min(nmf.restart_distances))
+        assert np.isclose(nmf.reconstruction_error[-1], nmf.distance)
+
+        # The first run is the same as not restarting at all
+        nmf_single = nussl.TransformerNMF(matrix, self.n_bases, max_num_iterations=self.n_iters, seed=0)
+        nmf_single.transform()
+        assert np.isclose(nmf_single.distance, nmf.restart_distances[0])
+
+        nmf_parallel = nussl.TransformerNMF(matrix, self.n_bases, max_num_iterations=self.n_iters, seed=0,
+                                            num_restarts=num_restarts, num_jobs=2)
+        nmf_parallel.transform()
+        assert np.allclose(nmf.restart_distances, nmf_parallel.restart_distances)
+        assert np.allclose(nmf.activation_matrix, nmf_parallel.activation_matrix)
+        assert np.allclose(nmf.template_dictionary, nmf_parallel.template_dictionary)
+
     def calculate_nmf_error(self, mixture, n_bases, dist_type, iterations, attempts, seed):
         div = nussl.transformers.TransformerNMF.KL_DIVERGENCE
         nimfa_type = 'divergence' if dist_type == div else dist_type
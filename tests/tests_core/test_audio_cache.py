@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import division
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import scipy.io.wavfile as wav
+
+import nussl
+
+
+class TestAudioCache(unittest.TestCase):
+    sr = 8000
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.directory, 'cache')
+
+        self.paths = []
+        for i in range(3):
+            path = os.path.join(self.directory, 'input{}.wav'.format(i))
+            wav.write(path, self.sr, (np.random.rand(self.sr, 2) * 2 ** 15 - 2 ** 14).astype('int16'))
+            self.paths.append(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_load(self):
+        cache = nussl.AudioCache(self.cache_dir)
+        self.assertFalse(cache.is_cached(self.paths[0]))
+
+        signal = cache.load(self.paths[0])
+        original = nussl.AudioSignal(self.paths[0])
+        self.assertTrue(cache.is_cached(self.paths[0]))
+        self.assertIsInstance(signal._audio_data, np.memmap)
+        self.assertEqual((signal.sample_rate, signal.path_to_input_file), (self.sr, self.paths[0]))
+        self.assertTrue(np.allclose(signal.audio_data, original.audio_data))
+
+        # a changed file gets a new copy
+        cache_path = cache.cache_path(self.paths[0])
+        os.utime(self.paths[0], (0, 0))
+        self.assertNotEqual(cache.cache_path(self.paths[0]), cache_path)
+        self.assertFalse(cache.is_cached(self.paths[0]))
+
+    def test_resample(self):
+        cache = nussl.AudioCache(self.cache_dir, sample_rate=self.sr // 2)
+        signal = cache.load(self.paths[1])
+        original = nussl.AudioSignal(self.paths[1], sample_rate=self.sr // 2)
+
+        self.assertEqual(signal.sample_rate, self.sr // 2)
+        self.assertTrue(np.allclose(signal.audio_data, original.audio_data, atol=1e-6))
+        self.assertFalse(nussl.AudioCache(self.cache_dir).is_cached(self.paths[1]))
+
+    def test_load_many(self):
+        serial = nussl.AudioCache(self.cache_dir)
+        parallel = nussl.AudioCache(os.path.join(self.directory, 'parallel_cache'), num_jobs=2)
+
+        self.assertEqual(parallel.prefetch(self.paths[1:]), [parallel.cache_path(p) for p in self.paths[1:]])
+        for a, b in zip(serial.load_many(self.paths), parallel.load_many(self.paths)):
+            self.assertTrue(np.array_equal(a.audio_data, b.audio_data))
+
+        with self.assertRaises(ValueError):
+            nussl.AudioCache(self.cache_dir, num_jobs=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -189,6 +189,89 @@ class AudioSignalUnitTests(unittest.TestCase):
     freq = 30
     sine_wave = np.sin(np.linspace(0, freq * 2 * np.pi, length))
 
+    def test_write_sample_format(self):
+        signal = np.random.rand(2, self.length) * 1.6 - 0.8
+        a = nussl.AudioSignal(audio_data_array=signal)
+
+        tolerances = {nussl.SAMPLE_FORMAT_INT16: 2 ** -15, nussl.SAMPLE_FORMAT_INT32: 2 ** -31,
+                      nussl.SAMPLE_FORMAT_FLOAT32: 1e-7}
+        for sample_format, tolerance in tolerances.items():
+            a.write_audio_to_file(self.audio_output, sample_format=sample_format, chunk_size=1000)
+            sr, data = wav.read(self.audio_output)
+            if not np.issubdtype(data.dtype, np.floating):
+                data = data / float(np.iinfo(data.dtype).max + 1)
+
+            assert sr == a.sample_rate
+            assert np.max(np.abs(data.T - signal)) <= tolerance
+
+        # 24-bit samples are the top 3 bytes of 32-bit samples
+        a.write_audio_to_file(self.audio_output, sample_format=nussl.SAMPLE_FORMAT_INT24)
+        with open(self.audio_output, 'rb') as f:
+            raw = np.frombuffer(f.read()[44:], dtype='u1').reshape(-1, 3)
+        data = np.zeros((raw.shape[0], 4), dtype='u1')
+        data[:, 1:] = raw
+        data = data.view('<i4').reshape(-1, 2) / 2.0 ** 31
+        assert np.max(np.abs(data.T - signal)) <= 2 ** -23
+
+    def test_write_normalize(self):
+        a = nussl.AudioSignal(audio_data_array=self.sine_wave * 2)
+        a.write_audio_to_file(self.audio_output, sample_format=nussl.SAMPLE_FORMAT_FLOAT32)
+        assert np.allclose(wav.read(self.audio_output)[1], self.sine_wave)
+        assert np.allclose(a.audio_data, self.sine_wave * 2)  # not changed in place
+
+        a.write_audio_to_file(self.audio_output, normalize=False, sample_format=nussl.SAMPLE_FORMAT_FLOAT32)
+        assert np.allclose(wav.read(self.audio_output)[1], self.sine_wave * 2)
+
+        nussl.AudioSignal.write_audio_signals([a, a / 2], [self.audio_output] * 2)
+        with self.assertRaises(nussl.core.audio_signal.AudioSignalException):
+            nussl.AudioSignal.write_audio_signals([a, a], [self.audio_output])
+
+    def test_lazy_load(self):
+        data = (np.random.rand(self.length, 2) * 2 ** 15 - 2 ** 14).astype('int16')
+        wav.write(self.audio_output, self.sr, data)
+
+        eager = nussl.AudioSignal(self.audio_output)
+        lazy = nussl.AudioSignal(self.audio_output, lazy=True)
+        self.assertIsInstance(lazy._audio_data, np.memmap)
+        self.assertEqual((lazy.num_channels, lazy.signal_length), (eager.num_channels, eager.signal_length))
+        self.assertTrue(np.allclose(lazy.audio_data, eager.audio_data))
+
+        # only the active region is read and converted, once until the active region changes
+        lazy.set_active_region(self.sr, 2 * self.sr)
+        self.assertEqual(lazy.audio_data.dtype, np.float64)
+        self.assertIs(lazy.audio_data, lazy.audio_data)
+        self.assertTrue(np.allclose(lazy.audio_data, eager.audio_data[:, self.sr:2 * self.sr]))
+        lazy.set_active_region_to_default()
+        self.assertEqual(lazy.signal_length, eager.signal_length)
+        self.assertTrue(np.allclose(lazy.audio_data, eager.audio_data))
+
+        offset = nussl.AudioSignal(self.audio_output, offset=1, duration=1, lazy=True)
+        self.assertTrue(np.allclose(offset.audio_data, eager.audio_data[:, self.sr:2 * self.sr]))
+
+    def test_next_window_generator(self):
+        data = (np.random.rand(self.length, 2) * 2 ** 15 - 2 ** 14).astype('int16')
+        wav.write(self.audio_output, self.sr, data)
+        a = nussl.AudioSignal(self.audio_output, lazy=True)
+        end = self.length - self.sr // 4
+        a.set_active_region(self.sr // 2, end)
+
+        window_size, hop_size = self.sr, self.sr // 2
+        windows = list(a.next_window_generator(window_size, hop_size))
+        self.assertEqual([w.signal_length for w in windows], [self.sr] * 3 + [3 * self.sr // 4])
+        self.assertEqual((a._active_start, a._active_end), (self.sr // 2, end))
+
+        # each window is a view of the active region, and prefetching gives the same windows
+        prefetched = a.next_window_generator(1.0, 0.5, convert_to_samples=True, prefetch=2)
+        for i, (window, prefetched_window) in enumerate(zip(windows, prefetched)):
+            start = self.sr // 2 + i * hop_size
+            expected = a.audio_data[:, i * hop_size:i * hop_size + window_size]
+            self.assertTrue(np.array_equal(window.audio_data, expected))
+            self.assertTrue(np.array_equal(window.audio_data, prefetched_window.audio_data))
+            self.assertEqual(window.audio_data.shape[1], min(window_size, end - start))
+
+        with self.assertRaises(nussl.core.audio_signal.AudioSignalException):
+            a.next_window_generator(0, hop_size)
+
     def test_resample(self):
         # Check that sample rate property changes
         a = nussl.AudioSignal(self.audio_input1)
@@ -450,6 +533,67 @@ class AudioSignalUnitTests(unittest.TestCase):
         d /= 2
         self.assertTrue(np.allclose(c.audio_data, d.audio_data))
 
+    def test_make_copy_with_data(self):
+        signal = np.random.rand(2, self.length)
+        a = nussl.AudioSignal(audio_data_array=signal, label='mix')
+        a.stft_params.window_length = 1024
+        a.stft()
+        a.set_active_region(self.sr, 2 * self.sr)
+
+        b = a.make_copy_with_audio_data(signal[:, :self.sr], verbose=False)
+        self.assertIsNone(b.stft_data)
+        self.assertTrue(np.array_equal(b.audio_data, signal[:, :self.sr]))
+        self.assertEqual((b.label, b.sample_rate, b.stft_params.window_length), ('mix', a.sample_rate, 1024))
+        self.assertTrue(a.active_region_is_default is False and b.active_region_is_default)
+
+        c = a.make_copy_with_stft_data(a.stft_data * 0.5, verbose=False)
+        self.assertIsNone(c.audio_data)
+        self.assertTrue(np.array_equal(c.stft_data, a.stft_data * 0.5))
+
+        # the metadata of the copies is independent, and the original is untouched
+        c.stft_params.window_length = 2048
+        self.assertEqual(a.stft_params.window_length, 1024)
+        a.set_active_region_to_default()
+        self.assertTrue(np.array_equal(a.audio_data, signal))
+        self.assertEqual(a.stft_data.shape[-1], 2)
+
+    def test_make_view(self):
+        signal = np.random.rand(2, self.length)
+        a = nussl.AudioSignal(audio_data_array=signal)
+        a.stft()
+        a.set_active_region(self.sr, 2 * self.sr)
+
+        # views of the whole signal keep the active region and the STFT
+        b = a.make_view(channels=1)
+        self.assertTrue(np.shares_memory(b.audio_data, signal))
+        self.assertTrue(np.array_equal(b.audio_data, signal[1:, self.sr:2 * self.sr]))
+        self.assertTrue(np.array_equal(b.stft_data, a.stft_data[:, :, 1:]))
+        self.assertTrue(np.array_equal(a.make_audio_signal_from_channel(1).audio_data, b.audio_data))
+
+        c = a.make_view(start=self.sr // 2, end=self.sr)
+        self.assertTrue(c.active_region_is_default)
+        self.assertIsNone(c.stft_data)
+        self.assertTrue(np.array_equal(c.audio_data, signal[:, self.sr // 2:self.sr]))
+
+        # views are read-only, and are copied when they change
+        with self.assertRaises(ValueError):
+            c.audio_data[0, 0] = 1.0
+        c.apply_gain(2.0)
+        c.stft()
+        self.assertTrue(np.array_equal(c.audio_data, 2 * signal[:, self.sr // 2:self.sr]))
+        self.assertTrue(np.array_equal(a.get_channel(0), signal[0, self.sr:2 * self.sr]))
+
+        with self.assertRaises(nussl.core.audio_signal.AudioSignalException):
+            a.make_view(channels=2)
+        with self.assertRaises(nussl.core.audio_signal.AudioSignalException):
+            a.make_view(channels=[0, 1])
+
+        # separation algorithms only make a view of the mixture
+        repet = nussl.Repet(a)
+        self.assertTrue(np.shares_memory(repet.audio_signal.audio_data, signal))
+        repet.stft_params.window_length = 1024
+        self.assertNotEqual(a.stft_params.window_length, 1024)
+
 
 
 
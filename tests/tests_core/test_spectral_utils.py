@@ -192,6 +192,165 @@ class TestSpectralUtils(unittest.TestCase):
 
         stft, p, freq_array, _ = nussl.stft_utils.e_stft_plus(x, win_length, hop_length, win_type, self.sr)
 
+    def test_e_stft_frame_by_frame(self):
+        """
+        Checks the batched e_stft() against an FFT of each hop computed one at a time, for
+        different hop lengths and with and without the reflection above Nyquist.
+
+        This WILL raise an error if the calculated stft is different than the frame by frame stft.
+        """
+        win_type = nussl.WINDOW_HANN
+        win_length = 1024
+        window = nussl.stft_utils.make_window(win_type, win_length)
+        noise = (np.random.rand(self.sr) * 2) - 1
+
+        for i in self.hop_length_ratios:
+            hop_length = int(win_length * i)
+            padded, n_blocks = nussl.stft_utils._add_zero_padding(noise, win_length, hop_length)
+
+            for remove_reflection in [True, False]:
+                stft = nussl.stft_utils.e_stft(noise, win_length, hop_length, win_type,
+                                               remove_reflection=remove_reflection)
+                n_bins = win_length // 2 + 1 if remove_reflection else win_length
+                assert stft.shape == (n_bins, n_blocks)
+
+                for hop in range(n_blocks):
+                    start = hop * hop_length
+                    frame = padded[start:start + win_length] * window
+                    assert np.allclose(stft[:, hop], np.fft.fft(frame)[:n_bins])
+
+    def test_e_istft_overlap_add(self):
+        """
+        Checks the batched e_istft() against an inverse FFT of each hop that is overlap-added one
+        at a time, for different hop lengths. Hop lengths that don't divide the window length
+        exercise the ragged last segment of each frame.
+
+        This WILL raise an error if the calculated signal is different than the frame by frame signal.
+        """
+        win_type = nussl.WINDOW_HAMMING
+        win_length = 1024
+        window = nussl.stft_utils.make_window(win_type, win_length)
+        noise = (np.random.rand(self.sr) * 2) - 1
+
+        for i in self.hop_length_ratios:
+            hop_length = int(win_length * i)
+            stft = nussl.stft_utils.e_stft(noise, win_length, hop_length, win_type)
+            signal = nussl.stft_utils.e_istft(stft, win_length, hop_length, win_type,
+                                              remove_padding=False)
+
+            n_hops = stft.shape[1]
+            expected = np.zeros((n_hops - 1) * hop_length + win_length)
+            norm_window = np.zeros_like(expected)
+            full_stft = nussl.stft_utils._add_reflection(stft)
+            for hop in range(n_hops):
+                start = hop * hop_length
+                expected[start:start + win_length] += np.real(np.fft.ifft(full_stft[:, hop]))
+                norm_window[start:start + win_length] += window
+            norm_window[norm_window == 0.0] = nussl.EPSILON
+
+            assert np.allclose(signal, expected / norm_window)
+
+    def test_stft_istft_multichannel(self):
+        """
+        Checks that e_stft() and e_istft() on a (n_channels, n_samples) array give the same results
+        as running them on each channel separately, and that AudioSignal uses the same path.
+
+        This WILL raise an error if the multichannel results are different than the single channel results.
+        """
+        win_type = nussl.WINDOW_HANN
+        win_length = 2048
+        hop_length = win_length // 2
+        n_ch = 5
+        noise = (np.random.rand(n_ch, self.sr) * 2) - 1
+
+        stft = nussl.stft_utils.e_stft(noise, win_length, hop_length, win_type)
+        signal = nussl.stft_utils.e_istft(stft, win_length, hop_length, win_type)
+        assert stft.ndim == 3 and stft.shape[nussl.STFT_CHAN_INDEX] == n_ch
+        assert signal.shape[nussl.CHAN_INDEX] == n_ch
+
+        for ch in range(n_ch):
+            mono_stft = nussl.stft_utils.e_stft(noise[ch], win_length, hop_length, win_type)
+            mono_signal = nussl.stft_utils.e_istft(mono_stft, win_length, hop_length, win_type)
+            assert np.allclose(stft[:, :, ch], mono_stft)
+            assert np.allclose(signal[ch], mono_signal)
+
+        sig = nussl.AudioSignal(audio_data_array=noise, sample_rate=self.sr)
+        sig_stft = sig.stft(win_length, hop_length, win_type)
+        sig_signal = sig.istft(win_length, hop_length, win_type)
+        assert np.allclose(sig_stft, stft)
+        assert np.allclose(sig_signal, signal[:, :self.sr])
+        assert np.allclose(sig_signal, noise)
+
+    def test_stft_istft_float32(self):
+        """
+        Checks that single precision STFTs and iSTFTs stay in single precision from end to end, and are close
+        to the double precision results.
+        """
+        win_type = nussl.WINDOW_HANN
+        win_length = 2048
+        hop_length = win_length // 2
+        noise = (np.random.rand(2, self.sr) * 2) - 1
+
+        stft = nussl.stft_utils.e_stft(noise, win_length, hop_length, win_type)
+        stft32 = nussl.stft_utils.e_stft(noise, win_length, hop_length, win_type, precision=nussl.FLOAT32)
+        assert stft.dtype == np.complex128
+        assert stft32.dtype == np.complex64
+        assert np.allclose(stft32, stft, atol=1e-4)
+
+        signal32 = nussl.stft_utils.e_istft(stft32, win_length, hop_length, win_type)
+        assert signal32.dtype == np.float32
+        assert np.allclose(signal32[:, :self.sr], noise, atol=1e-4)
+
+        sig = nussl.AudioSignal(audio_data_array=noise, sample_rate=self.sr)
+        sig.stft_params.precision = nussl.FLOAT32
+        sig.stft(win_length, hop_length, win_type)
+        assert sig.stft_data.dtype == np.complex64
+
+        masked = sig.apply_mask(nussl.separation.SoftMask(np.ones(sig.stft_data.shape)))
+        assert masked.stft_data.dtype == np.complex64
+        assert masked.istft(win_length, hop_length, win_type).dtype == np.float32
+
+        with self.assertRaises(ValueError):
+            sig.stft_params.precision = 'float16'
+
+    def test_stft_cache(self):
+        """
+        Checks that repeated STFTs and iSTFTs with the same parameters reuse the cached window and
+        window normalization envelope, that cached arrays can't be changed, and that the cache
+        stays within its maximum size.
+        """
+        cache = nussl.stft_utils.stft_cache
+        cache.clear()
+
+        win_type = nussl.WINDOW_HANN
+        win_length = 1024
+        hop_length = win_length // 2
+        noise = (np.random.rand(self.sr) * 2) - 1
+
+        for _ in range(3):
+            stft = nussl.stft_utils.e_stft(noise, win_length, hop_length, win_type)
+            nussl.stft_utils.e_istft(stft, win_length, hop_length, win_type)
+
+        # one miss for the window and one for the envelope, everything after that is a hit
+        info = cache.info()
+        assert info.misses == 2
+        assert info.hits == 5
+        assert info.current_size == 2
+
+        window = cache.window(win_type, win_length)
+        assert np.allclose(window, nussl.stft_utils.make_window(win_type, win_length))
+        with self.assertRaises(ValueError):
+            window[0] = 1.0
+
+        small_cache = nussl.stft_utils.StftCache(max_size=2)
+        for length in [128, 256, 512, 128]:
+            small_cache.window(win_type, length)
+        assert len(small_cache) == 2
+        assert small_cache.info().misses == 4
+
+        cache.clear()
+        assert cache.info() == (0, 0, cache.max_size, 0)
+
     def test_librosa_stft(self):
         """
         This test checks our wrappers for librosa's stft and istft. They should be redundant
@@ -33,6 +33,39 @@ class TestUtils(unittest.TestCase):
         peak = nussl.utils.find_peak_values(array, 3, min_dist=0)
         assert peak == [99, 98, 97]
 
+    def test_find_peak_indices_batch(self):
+        array = np.array([[0, 3, 1, 5, 0, 0, 4, 4, 0, 2],
+                          [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+                          [9, 8, 7, 6, 5, 4, 3, 2, 1, 0]])
+
+        peaks, n_found = nussl.utils.find_peak_indices_batch(array, 5, min_dist=1, threshold=0)
+        assert np.array_equal(peaks, [[3, 6, 9, -1, -1], [-1] * 5, [0, 2, 4, 6, 8]])
+        assert np.array_equal(n_found, [3, 0, 5])
+
+        peaks, n_found = nussl.utils.find_peak_indices_batch(array, 2, min_dist=0, threshold=0)
+        assert np.array_equal(peaks, [[3, 6], [-1, -1], [0, 1]])
+        assert np.array_equal(n_found, [2, 0, 2])
+
+        peaks, n_found = nussl.utils.find_peak_indices_batch(array, 5, min_dist=1, threshold=0.5)
+        assert np.array_equal(peaks[0], [3, 6, -1, -1, -1])
+
+        peaks, n_found = nussl.utils.find_peak_indices_batch(array, 5, min_dist=1, threshold=0.5, do_min=True)
+        assert np.array_equal(peaks[0], [0, 4, 8, -1, -1])
+        assert np.array_equal(peaks[2], [9, 6, -1, -1, -1])
+
+        # every row gives the same peaks as find_peak_indices() on its own
+        random_state = np.random.RandomState(0)
+        array = random_state.rand(20, 50)
+        for n_peaks, min_dist, threshold in [(6, 3, 0.5), (10, 0, 0.2), (4, 10, 0), (50, 1, 0.9)]:
+            peaks, n_found = nussl.utils.find_peak_indices_batch(array, n_peaks, min_dist=min_dist,
+                                                                 threshold=threshold)
+            for i, row in enumerate(array):
+                expected = nussl.utils.find_peak_indices(row, n_peaks, min_dist=min_dist, threshold=threshold)
+                self.assertEqual(peaks[i, :n_found[i]].tolist(), expected)
+
+        with self.assertRaises(ValueError):
+            nussl.utils.find_peak_indices_batch(np.arange(10), 1)
+
     def test_add_mismatched_arrays(self):
         long_array = np.ones((20,))
         short_array = np.arange(10)
@@ -81,6 +81,45 @@ class MaskSeparationBaseUnitTests(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             mask_separator.make_audio_signals()
 
+    def test_precision(self):
+        """
+        Tests setting the precision of a MaskSeparationBase object
+        """
+        sig = nussl.AudioSignal(audio_data_array=np.random.rand(2, 1000))
+        mask_separator = nussl.MaskSeparationBase(sig)
+        assert mask_separator.precision == nussl.DEFAULT_PRECISION
+
+        mask_separator = nussl.MaskSeparationBase(sig, precision=nussl.FLOAT32)
+        assert mask_separator.precision == nussl.FLOAT32
+        assert mask_separator.zeros_mask((10, 10)).mask.dtype == np.float32
+
+        # The input signal's StftParams are left alone
+        assert sig.stft_params.precision == nussl.DEFAULT_PRECISION
+
+        mask_separator.audio_signal.stft()
+        assert mask_separator.audio_signal.stft_data.dtype == np.complex64
+
+        with self.assertRaises(ValueError):
+            _ = nussl.MaskSeparationBase(sig, precision='int8')
+
+    def test_subclass_precision(self):
+        """
+        Tests that MaskSeparationBase subclasses pass precision on to MaskSeparationBase
+        """
+        random_state = np.random.RandomState(0)
+        audio_data = np.tile(random_state.rand(4000) - 0.5, 10)[np.newaxis, :] + 0.1 * random_state.randn(1, 40000)
+        sig = nussl.AudioSignal(audio_data_array=audio_data, sample_rate=8000)
+
+        for method in [nussl.Repet, nussl.RepetSim, nussl.FT2D]:
+            separator = method(sig, precision=nussl.FLOAT32)
+            assert separator.precision == nussl.FLOAT32
+
+            background_mask, _ = separator.run()
+            assert separator.audio_signal.stft_data.dtype == np.complex64
+            assert background_mask.mask.dtype == np.float32
+
+        assert sig.stft_params.precision == nussl.DEFAULT_PRECISION
+
     def test_json(self):
         """
         Test MaskSeparationBase going to and from json
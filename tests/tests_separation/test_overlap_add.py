@@ -1,10 +1,13 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import multiprocessing.pool
 import nussl
 import unittest
 import numpy as np
 
+from nussl.separation import overlap_add
+
 
 class TestOverlapAdd(unittest.TestCase):
 
@@ -100,3 +103,48 @@ class TestOverlapAdd(unittest.TestCase):
                 ola.separation_method = method
             with self.assertRaises(ValueError):
                 ola.separation_method = self.invalid_method_names[i]
+
+    def test_overlap_add_parallel(self):
+        """
+        Tests that separating the segments on a pool of processes or threads gives the same output as in serial.
+        """
+        random_state = np.random.RandomState(0)
+        audio_data = np.tile(random_state.rand(8000) - 0.5, 60)[np.newaxis, :] + 0.1 * random_state.randn(2, 480000)
+        signal = nussl.AudioSignal(audio_data_array=audio_data, sample_rate=16000)
+
+        for method in self.valid_methods:
+            serial = nussl.OverlapAdd(signal, method, overlap_window_size=10, overlap_hop_size=5).run()
+
+            for use_threads in [False, True]:
+                ola = nussl.OverlapAdd(signal, method, overlap_window_size=10, overlap_hop_size=5,
+                                       num_jobs=2, use_threads=use_threads)
+                assert np.allclose(ola.run().audio_data, serial.audio_data)
+
+        with self.assertRaises(ValueError):
+            nussl.OverlapAdd(signal, nussl.Repet, num_jobs=0)
+
+    def test_overlap_add_threads_share_signal(self):
+        """
+        Tests that the separation instance of a worker thread is a copy that shares the data of the input signal.
+        """
+        ola = nussl.OverlapAdd(self.signal, nussl.Repet, num_jobs=2, use_threads=True)
+        instance = ola.separation_instance
+
+        pool = multiprocessing.pool.ThreadPool(1, overlap_add._init_overlap_add_worker, (instance, True))
+        try:
+            worker_instance = pool.apply(_get_worker_instance)
+        finally:
+            pool.close()
+            pool.join()
+
+        assert worker_instance is not instance
+        assert worker_instance.audio_signal is not instance.audio_signal
+        assert np.shares_memory(worker_instance.audio_signal._audio_data, self.signal._audio_data)
+
+        # changing the active region of a worker never changes the other instances
+        worker_instance.audio_signal.set_active_region(0, 1000)
+        assert instance.audio_signal.active_region_is_default
+
+
+def _get_worker_instance():
+    return overlap_add._worker_state.separation_instance
@@ -44,3 +44,57 @@ class TestRepet(unittest.TestCase):
 
     def test_masks(self):
         pass
+
+
+class TestRepetSynthetic(unittest.TestCase):
+
+    @staticmethod
+    def _nan_padded_mask(magnitude_spectrogram_channel, period):
+        freq_bins, time_bins = magnitude_spectrogram_channel.shape
+        n_repetitions = int(np.ceil(float(time_bins) / period))
+        padded = np.full((freq_bins, n_repetitions * period), np.nan)
+        padded[:, :time_bins] = magnitude_spectrogram_channel
+
+        repeating_segment = np.nanmedian(padded.reshape((freq_bins, n_repetitions, period)), axis=1)
+        median_mask = np.tile(repeating_segment, (1, n_repetitions))[:, :time_bins]
+        median_mask = np.minimum(median_mask, magnitude_spectrogram_channel)
+        return ((median_mask + nussl.core.constants.EPSILON) /
+                (magnitude_spectrogram_channel + nussl.core.constants.EPSILON))
+
+    def test_multichannel_mask(self):
+        random_state = np.random.RandomState(0)
+        signal = nussl.AudioSignal(audio_data_array=random_state.rand(6, 16000), sample_rate=16000)
+        repet = nussl.Repet(signal)
+        magnitude_spectrogram = random_state.rand(33, 50, 6)
+
+        for repeating_period in [0, 6, 9, 24, 49]:
+            repet.repeating_period = repeating_period
+            mask = repet._compute_repeating_mask(magnitude_spectrogram)
+            self.assertEqual(mask.shape, magnitude_spectrogram.shape)
+
+            for ch in range(magnitude_spectrogram.shape[2]):
+                expected = self._nan_padded_mask(magnitude_spectrogram[:, :, ch], repeating_period + 1)
+                assert np.allclose(mask[:, :, ch], expected)
+                assert np.allclose(repet._compute_repeating_mask(magnitude_spectrogram[:, :, ch]), expected)
+
+    def test_find_repeating_period_complex(self):
+        random_state = np.random.RandomState(0)
+        beat_spectrum = np.abs(np.sin(np.arange(400) * np.pi / 25)) + 0.01 * random_state.rand(400)
+
+        # the auto-cosine peaks at multiples of the period
+        period = nussl.Repet.find_repeating_period_complex(beat_spectrum)
+        assert isinstance(period, int)
+        self.assertEqual(period % 25, 0)
+
+        # a pure tone of the same period has its highest non-zero peak exactly at the period
+        beat_spectrum = 1 + np.cos(np.arange(400) * 2 * np.pi / 25) * np.linspace(1, 0, 400)
+        self.assertEqual(nussl.Repet.find_repeating_period_complex(beat_spectrum), 25)
+
+        with self.assertRaises(RuntimeError):
+            nussl.Repet.find_repeating_period_complex(np.linspace(1, 0, 100))
+
+        signal = nussl.AudioSignal(audio_data_array=np.tile(random_state.rand(4096) - 0.5, 20)[np.newaxis, :],
+                                   sample_rate=16000)
+        repet = nussl.Repet(signal, use_find_period_complex=True)
+        repet.run()
+        self.assertEqual(repet.repeating_period % 4, 0)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+import warnings
+
+import nussl
+import numpy as np
+
+
+class TestRepetSim(unittest.TestCase):
+
+    def setUp(self):
+        sample_rate = 16000
+        random_state = np.random.RandomState(0)
+        beat = random_state.rand(sample_rate // 4) - 0.5
+        audio_data = np.tile(beat, 80)[np.newaxis, :] + 0.1 * random_state.randn(2, sample_rate * 20)
+        self.signal = nussl.AudioSignal(audio_data_array=audio_data, sample_rate=sample_rate)
+
+    @staticmethod
+    def _loop_mask(magnitude_spectrogram, similarity_indices):
+        mask = np.ones_like(magnitude_spectrogram)
+        for i, cur_similarities in enumerate(similarity_indices):
+            if cur_similarities:
+                mask[:, i] = np.median(magnitude_spectrogram[:, cur_similarities], axis=1)
+
+        mask = np.minimum(mask, magnitude_spectrogram)
+        return (mask + nussl.core.constants.EPSILON) / (magnitude_spectrogram + nussl.core.constants.EPSILON)
+
+    def test_compute_mask(self):
+        for kwargs in [{}, {'similarity_threshold': 0.5, 'max_repeating_frames': 20}]:
+            repet_sim = nussl.RepetSim(self.signal, **kwargs)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                background_mask, foreground_mask = repet_sim.run()
+
+            self.assertEqual(len(repet_sim.similarity_indices), repet_sim.audio_signal.stft_length)
+
+            for ch in range(self.signal.num_channels):
+                magnitude_spectrogram = repet_sim.magnitude_spectrogram[:, :, ch]
+                expected = self._loop_mask(magnitude_spectrogram, repet_sim.similarity_indices)
+                expected[:repet_sim.high_pass_cutoff, :] = 1
+                assert np.allclose(background_mask.mask[:, :, ch], expected)
+
+            # a small gather budget must give the same mask
+            repet_sim._MEDIAN_BLOCK_ELEMENTS = 1
+            blocked_mask = repet_sim._compute_mask(repet_sim.magnitude_spectrogram)
+            blocked_mask[:repet_sim.high_pass_cutoff, :, :] = 1
+            assert np.allclose(background_mask.mask, blocked_mask)
+
+    def test_similarity_indices(self):
+        random_state = np.random.RandomState(1)
+        matrix = np.tile(random_state.rand(8, 20), (12, 1)) + 0.1 * random_state.rand(96, 20)
+        similarity_matrix = nussl.RepetSim.compute_similarity_matrix(matrix)
+
+        for max_repeating_frames, min_distance, threshold in [(10, 1, 0), (5, 3, 0.5), (40, 0, 0.9)]:
+            expected = [nussl.utils.find_peak_indices(row, max_repeating_frames, min_dist=min_distance,
+                                                      threshold=threshold)[1:max_repeating_frames + 2]
+                        for row in similarity_matrix]
+
+            # whole matrix in one block, several rows per block and one row per block
+            for block_elements in [None, 500, 1]:
+                similarity_indices = nussl.RepetSim.compute_similarity_indices(
+                    matrix, max_repeating_frames, min_distance, threshold, block_elements=block_elements)
+                self.assertEqual(similarity_indices, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
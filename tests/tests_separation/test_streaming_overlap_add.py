@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import nussl
+import numpy as np
+import scipy.io.wavfile as wav
+
+
+class _GainSplit(nussl.SeparationBase):
+    """Splits a signal into two sources with fixed gains, so the crossfaded output is known exactly."""
+
+    def run(self):
+        pass
+
+    def make_audio_signals(self):
+        audio_data = self.audio_signal.audio_data
+        return [self.audio_signal.make_copy_with_audio_data(0.25 * audio_data, verbose=False),
+                self.audio_signal.make_copy_with_audio_data(0.75 * audio_data, verbose=False)]
+
+
+class TestStreamingOverlapAdd(unittest.TestCase):
+
+    def setUp(self):
+        self.sample_rate = 8000
+        random_state = np.random.RandomState(0)
+        self.audio_data = 0.2 * random_state.randn(2, self.sample_rate * 7 + 123)
+        self.block_lengths = random_state.randint(1, 5000, size=200)
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _stream(self, ola):
+        blocks = []
+        start = 0
+        for block_length in self.block_lengths:
+            if start >= self.audio_data.shape[1]:
+                break
+            blocks.append(self.audio_data[:, start:start + block_length])
+            start += block_length
+
+        outputs = [sources for sources in ola.process_stream(blocks) if sources]
+        return [np.hstack([sources[i] for sources in outputs]) for i in range(ola.num_sources)]
+
+    def test_crossfade(self):
+        for window_size, hop_size, window_type in [(2, 1, nussl.WINDOW_TRIANGULAR), (1.5, 0.4, nussl.WINDOW_HAMMING),
+                                                   (1, 1, nussl.WINDOW_RECTANGULAR), (20, 10, nussl.WINDOW_TRIANGULAR)]:
+            ola = nussl.StreamingOverlapAdd(_GainSplit, self.sample_rate, num_channels=2,
+                                            overlap_window_size=window_size, overlap_hop_size=hop_size,
+                                            overlap_window_type=window_type)
+            first, second = self._stream(ola)
+
+            self.assertEqual(ola.num_sources, 2)
+            assert np.allclose(first, 0.25 * self.audio_data)
+            assert np.allclose(second, 0.75 * self.audio_data)
+
+    def test_process_file(self):
+        input_path = os.path.join(self.temp_dir, 'input.wav')
+        output_paths = [os.path.join(self.temp_dir, 'background.wav'), os.path.join(self.temp_dir, 'foreground.wav')]
+        wav.write(input_path, self.sample_rate, (self.audio_data.T * 2 ** 15).astype('int16'))
+
+        ola = nussl.StreamingOverlapAdd(nussl.Repet, self.sample_rate, num_channels=2,
+                                        overlap_window_size=3, overlap_hop_size=1.5)
+        ola.process_file(input_path, output_paths, block_duration=0.7)
+
+        outputs = [wav.read(path) for path in output_paths]
+        for sample_rate, data in outputs:
+            self.assertEqual(sample_rate, self.sample_rate)
+            self.assertEqual(data.shape, self.audio_data.T.shape)
+
+        # background + foreground is the input, up to 16-bit rounding
+        total = (outputs[0][1].astype(float) + outputs[1][1]) / 2 ** 15
+        assert np.max(np.abs(total - self.audio_data.T)) < 1e-3
+
+        with self.assertRaises(ValueError):
+            nussl.StreamingOverlapAdd(nussl.Repet, self.sample_rate).process_file(input_path, output_paths)
+
+        with self.assertRaises(ValueError):
+            ola.process_file(input_path, output_paths, sample_format='int8')
+
+    def test_process_file_sample_format(self):
+        input_path = os.path.join(self.temp_dir, 'input.wav')
+        output_paths = [os.path.join(self.temp_dir, 'first.wav'), os.path.join(self.temp_dir, 'second.wav')]
+        ola = nussl.StreamingOverlapAdd(_GainSplit, self.sample_rate, num_channels=2, overlap_window_size=2,
+                                        overlap_hop_size=2, overlap_window_type=nussl.WINDOW_RECTANGULAR)
+
+        # 16-bit samples are read and written with the same scale, so the gains are exact
+        int16_data = 4 * np.round(np.clip(self.audio_data.T, -1, 1) * 2 ** 13).astype('int16')
+        wav.write(input_path, self.sample_rate, int16_data)
+        ola.process_file(input_path, output_paths, block_duration=0.3)
+        first, second = [wav.read(path)[1] for path in output_paths]
+        assert np.array_equal(first, int16_data // 4)
+        assert np.array_equal(second, 3 * (int16_data // 4))
+
+        # unsigned 8-bit input, 32-bit float output
+        uint8_data = np.clip(np.round(self.audio_data.T * 128 + 128), 0, 255).astype('uint8')
+        wav.write(input_path, self.sample_rate, uint8_data)
+        ola.process_file(input_path, output_paths, sample_format=nussl.SAMPLE_FORMAT_FLOAT32)
+        first, second = [wav.read(path)[1] for path in output_paths]
+        expected = (uint8_data.astype(float) - 128) / 128
+        self.assertEqual(first.dtype, np.float32)
+        assert np.allclose(first, 0.25 * expected, atol=1e-6)
+        assert np.allclose(second, 0.75 * expected, atol=1e-6)
+
+    def test_setup(self):
+        for method in [nussl.AudioSignal, int, None, nussl.Repet(nussl.AudioSignal(audio_data_array=np.ones(100)))]:
+            with self.assertRaises(ValueError):
+                nussl.StreamingOverlapAdd(method, self.sample_rate)
+
+        with self.assertRaises(ValueError):
+            nussl.StreamingOverlapAdd(nussl.Repet, self.sample_rate, overlap_window_size=1, overlap_hop_size=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
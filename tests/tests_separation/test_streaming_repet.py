@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import nussl
+import numpy as np
+
+
+class TestStreamingRepet(unittest.TestCase):
+
+    def setUp(self):
+        self.sample_rate = 16000
+        random_state = np.random.RandomState(0)
+        self.repeating = np.tile(random_state.rand(self.sample_rate // 2) - 0.5, 16)[np.newaxis, :]
+        self.audio_data = self.repeating * np.ones((2, 1)) + 0.1 * random_state.randn(2, self.sample_rate * 8)
+        self.block_lengths = random_state.randint(1, 3000, size=200)
+
+    def _stream(self, streaming_repet, audio_data):
+        backgrounds, foregrounds = [], []
+        start = 0
+        for block_length in self.block_lengths:
+            if start >= audio_data.shape[1]:
+                break
+            end = min(start + block_length, audio_data.shape[1])
+            background, foreground = streaming_repet.process_block(audio_data[:, start:end])
+            backgrounds.append(background)
+            foregrounds.append(foreground)
+            start = end
+
+            n_output = sum(b.shape[1] for b in backgrounds)
+            assert 0 <= end - n_output <= streaming_repet.latency
+
+        background, foreground = streaming_repet.flush()
+        backgrounds.append(background)
+        foregrounds.append(foreground)
+        return np.hstack(backgrounds), np.hstack(foregrounds)
+
+    def test_reconstruction(self):
+        streaming_repet = nussl.StreamingRepet(self.sample_rate, num_channels=2, buffer_duration=3.0)
+        background, foreground = self._stream(streaming_repet, self.audio_data)
+
+        self.assertEqual(background.shape, self.audio_data.shape)
+        assert np.allclose(background + foreground, self.audio_data)
+
+        # the stream can be reused after flush()
+        background_again, _ = self._stream(streaming_repet, self.audio_data)
+        assert np.allclose(background, background_again)
+
+        # mono streams take 1D blocks
+        streaming_repet = nussl.StreamingRepet(self.sample_rate, period=0.5)
+        background, foreground = self._stream(streaming_repet, self.audio_data[:1])
+        assert np.allclose(background + foreground, self.audio_data[:1])
+
+    def test_beat_spectrum(self):
+        streaming_repet = nussl.StreamingRepet(self.sample_rate, num_channels=2, buffer_duration=3.0)
+        n_buffer = streaming_repet.buffer_frames
+
+        for start in range(0, self.audio_data.shape[1], 2000):
+            streaming_repet.process_block(self.audio_data[:, start:start + 2000])
+
+            # the incremental beat spectrum matches the beat spectrum of the frames in the ring buffer
+            n_frames = streaming_repet._n_frames
+            order = np.arange(min(n_frames, n_buffer))
+            if n_frames > n_buffer:
+                order = (order + n_frames) % n_buffer
+            expected = nussl.Repet.compute_beat_spectrum(streaming_repet._power_buffer[order])
+            assert np.allclose(streaming_repet.beat_spectrum, expected)
+
+        # the period is (a multiple of) half a second, ~15.6 hops
+        repetitions = streaming_repet.repeating_period / 15.625
+        assert round(repetitions) >= 1
+        assert abs(repetitions - round(repetitions)) * 15.625 <= 2
+
+    def test_setup(self):
+        with self.assertRaises(ValueError):
+            nussl.StreamingRepet(self.sample_rate, period=1.0, min_period=0.5)
+
+        streaming_repet = nussl.StreamingRepet(self.sample_rate, num_channels=2)
+        with self.assertRaises(ValueError):
+            streaming_repet.process_block(self.audio_data[:1])
+
+
+if __name__ == '__main__':
+    unittest.main()